@@ -0,0 +1,64 @@
+# ================================
+# Pequeno sistema de animação do Herói dos Pampas
+# As animações são tabelas de quadros calculadas uma vez: cada quadro
+# guarda apenas os valores (alpha, posição, ...) daquele momento, e
+# avançar a animação é só andar um índice na tabela. Quando a tabela
+# termina a animação para de fazer trabalho.
+# ================================
+
+from itertools import zip_longest
+
+
+# Valores de um tween linear: parte de `inicio` e anda `passo` a cada quadro
+# até chegar em `fim`. O valor inicial não entra na lista (é o estado antes
+# do primeiro quadro) e o último valor é sempre exatamente `fim`.
+def valores_tween(inicio, fim, passo):
+    if passo <= 0:
+        raise ValueError("O passo do tween precisa ser positivo")
+    valores = []
+    valor = inicio
+    direcao = 1 if fim >= inicio else -1
+    while valor != fim:
+        valor += direcao * passo
+        if (valor - fim) * direcao > 0:
+            valor = fim
+        valores.append(valor)
+    return valores
+
+
+# Junta várias trilhas (listas de valores) numa tabela de quadros.
+# Trilhas mais curtas repetem o último valor até a mais longa terminar.
+def combinar_trilhas(*trilhas):
+    ultimos = [trilha[-1] if trilha else None for trilha in trilhas]
+    quadros = []
+    for valores in zip_longest(*trilhas):
+        quadros.append(tuple(
+            ultimos[i] if valor is None else valor for i, valor in enumerate(valores)
+        ))
+    return tuple(quadros)
+
+
+# Percorre uma tabela de quadros pré-calculada, um quadro por avanço
+class Animacao:
+    def __init__(self, quadros):
+        self.quadros = quadros
+        self.indice = -1
+
+    @property
+    def concluida(self):
+        return self.indice >= len(self.quadros) - 1
+
+    # Quadro atual (None antes do primeiro avanço)
+    @property
+    def atual(self):
+        return self.quadros[self.indice] if self.indice >= 0 else None
+
+    # Avança um quadro; devolve None quando a animação já terminou
+    def avancar(self):
+        if self.concluida:
+            return None
+        self.indice += 1
+        return self.quadros[self.indice]
+
+    def reiniciar(self):
+        self.indice = -1
@@ -0,0 +1,252 @@
+# ================================
+# Balanceamento do Herói dos Pampas
+# Joga milhares de partidas sem janela, com semente fixa e o BotBandeira,
+# para cada fase e cada combinação dos parâmetros de jogo:
+#   - velocidade dos inimigos (faixa sorteada, em px por passo)
+#   - intervalo entre inimigos (ms)
+#   - atraso da bandeira (ms)
+#   - inimigos derrotados por vida extra
+# e resume, por fase e combinação, o tempo de sobrevivência, os inimigos
+# derrotados, quantas partidas alcançaram a bandeira e o custo de cada
+# passo de simulação. Sem valores pedidos, os três primeiros parâmetros
+# são os de cada fase (fases.json).
+#
+# As partidas são independentes e se dividem entre processos (um por
+# núcleo, por padrão); cada processo carrega os sprites uma vez só.
+#
+# Uso:
+#   python balanceamento.py --partidas 200
+#   python balanceamento.py --fases 1 7 13 --velocidades 3-8 4-10 --intervalos 400 300 --saida relatorio.json
+# ================================
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+from time import perf_counter
+
+from bots import BotBandeira
+from colisao import MOTORES as MOTORES_COLISAO
+from fases import carregar_fases
+from medicao import percentil, resumir_ms
+from motor import (
+    EVENTO_ACERTO, EVENTO_DANO, EVENTO_FASE_CONCLUIDA, EVENTO_GAME_OVER, EVENTO_VIDA_EXTRA, EVENTO_VITORIA,
+    PONTOS_VIDA_EXTRA, TAXA_SIMULACAO, criar_motor_sem_janela
+)
+
+SEMENTE_BASE = 2025
+MINUTOS_POR_PARTIDA = 3  # Partidas que não terminam antes disso são interrompidas
+
+_motor = None  # Motor sem janela de cada processo, reaproveitado entre partidas
+
+
+def _iniciar_processo(colisao='mascaras'):
+    global _motor
+    # Sem isso o SDL trata o SIGTERM (vira um evento de QUIT que ninguém lê)
+    # e o Pool fica esperando para sempre, no fim, o processo que mandou encerrar
+    os.environ.setdefault('SDL_NO_SIGNAL_HANDLERS', '1')
+    _motor = criar_motor_sem_janela(colisao=colisao)
+
+
+# Joga uma partida: começa na fase pedida, com as vidas iniciais, e vai até
+# a bandeira, o game over ou o limite de passos
+def jogar_partida(tarefa):
+    fase, parametros, semente, passos_max = tarefa
+    motor = _motor
+    motor.velocidade_inimigos = parametros['velocidade_inimigos']
+    motor.intervalo_inimigos_ms = parametros['intervalo_inimigos_ms']
+    motor.atraso_bandeira_ms = parametros['atraso_bandeira_ms']
+    motor.pontos_vida_extra = parametros['pontos_vida_extra']
+    # Mesmo estado de um motor novo com essa semente
+    motor.rng.seed(semente)
+    motor.semente = semente
+    motor.passos = 0
+    motor.tempo_simulado = 0
+    motor.reiniciar()
+    motor.iniciar_fase(fase)
+
+    bot = BotBandeira()
+    abates = danos = vidas_extras = 0
+    concluiu = game_over = False
+    inicio = perf_counter()
+    while motor.passos < passos_max:
+        eventos = motor.passo(bot(motor))
+        if not eventos:
+            continue
+        abates += eventos.count(EVENTO_ACERTO)
+        danos += eventos.count(EVENTO_DANO)
+        vidas_extras += eventos.count(EVENTO_VIDA_EXTRA)
+        if EVENTO_FASE_CONCLUIDA in eventos or EVENTO_VITORIA in eventos:
+            concluiu = True
+            break
+        if EVENTO_GAME_OVER in eventos:
+            game_over = True
+            break
+    duracao = perf_counter() - inicio
+
+    return {
+        'fase': fase,
+        'parametros': parametros,
+        'passos': motor.passos,
+        'abates': abates,
+        'danos': danos,
+        'vidas_extras': vidas_extras,
+        'concluiu': concluiu,
+        'game_over': game_over,
+        'segundos_por_passo': duracao / max(motor.passos, 1),
+    }
+
+
+def _chave(parametros):
+    return tuple(sorted((nome, tuple(valor) if isinstance(valor, list) else valor) for nome, valor in parametros.items()))
+
+
+def _media(valores):
+    return round(sum(valores) / len(valores), 3) if valores else 0.0
+
+
+# Resume as partidas de cada fase e combinação de parâmetros
+def resumir(resultados, fases):
+    grupos = {}
+    for resultado in resultados:
+        grupos.setdefault((resultado['fase'], _chave(resultado['parametros'])), []).append(resultado)
+
+    linhas = []
+    for (fase, _), partidas in sorted(grupos.items()):
+        # Sobrevivência: tempo de jogo até a bandeira, o game over ou o limite da partida
+        sobrevivencia = sorted(partida['passos'] / TAXA_SIMULACAO for partida in partidas)
+        linhas.append({
+            'fase': fase,
+            'nome_fase': fases[fase].nome,
+            'parametros': partidas[0]['parametros'],
+            'partidas': len(partidas),
+            'sobrevivencia_s': {
+                'media': _media(sobrevivencia),
+                'p10': round(percentil(sobrevivencia, 10), 3),
+                'p50': round(percentil(sobrevivencia, 50), 3),
+            },
+            'abates': _media([partida['abates'] for partida in partidas]),
+            'danos': _media([partida['danos'] for partida in partidas]),
+            'vidas_extras': _media([partida['vidas_extras'] for partida in partidas]),
+            'taxa_conclusao': _media([partida['concluiu'] for partida in partidas]),
+            'taxa_game_over': _media([partida['game_over'] for partida in partidas]),
+            'passo_ms': resumir_ms([partida['segundos_por_passo'] for partida in partidas]),
+        })
+    return linhas
+
+
+def imprimir_relatorio(linhas):
+    fase_anterior = None
+    for linha in linhas:
+        if linha['fase'] != fase_anterior:
+            fase_anterior = linha['fase']
+            print(f"{linha['fase']:2d} {linha['nome_fase']}")
+        parametros = linha['parametros']
+        velocidade = _texto(parametros['velocidade_inimigos'])
+        print(
+            f"   vel {velocidade:>5s}  int {_texto(parametros['intervalo_inimigos_ms']):>5s}  "
+            f"band {_texto(parametros['atraso_bandeira_ms']):>6s}  vida+ {parametros['pontos_vida_extra']:4d}  |  "
+            f"sobrev. {linha['sobrevivencia_s']['p50']:7.1f} s  abates {linha['abates']:7.1f}  "
+            f"bandeira {linha['taxa_conclusao']:6.1%}  passo {linha['passo_ms']['media']:.3f} ms"
+        )
+
+
+# Valor de um parâmetro no relatório; None = o valor de cada fase
+def _texto(valor):
+    if valor is None:
+        return 'fase'
+    return '-'.join(map(str, valor)) if isinstance(valor, list) else str(valor)
+
+
+def _faixa(texto):
+    minimo, _, maximo = texto.partition('-')
+    try:
+        faixa = [int(minimo), int(maximo or minimo)]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"faixa inválida: {texto!r} (use MIN-MAX, ex.: 3-8)")
+    if faixa[0] > faixa[1]:
+        raise argparse.ArgumentTypeError(f"faixa inválida: {texto!r} (mínimo maior que o máximo)")
+    return faixa
+
+
+def main(argv=None):
+    fases = carregar_fases()
+    parser = argparse.ArgumentParser(description="Varredura de parâmetros de jogo com partidas sem janela")
+    parser.add_argument('--fases', type=int, nargs='+', choices=sorted(fases), default=sorted(fases))
+    parser.add_argument('--velocidades', type=_faixa, nargs='+', default=[None],
+                        help="faixas de velocidade dos inimigos, MIN-MAX (padrão: a de cada fase)")
+    parser.add_argument('--intervalos', type=int, nargs='+', default=[None],
+                        help="intervalos entre inimigos, em ms (padrão: o de cada fase)")
+    parser.add_argument('--atrasos-bandeira', type=int, nargs='+', default=[None],
+                        help="atrasos da bandeira, em ms (padrão: o de cada fase)")
+    parser.add_argument('--vidas-extra', type=int, nargs='+', default=[PONTOS_VIDA_EXTRA],
+                        help="inimigos derrotados por vida extra")
+    parser.add_argument('--partidas', type=int, default=50, help="partidas por fase e combinação")
+    parser.add_argument('--minutos', type=float, default=MINUTOS_POR_PARTIDA, help="duração máxima de cada partida (jogo)")
+    parser.add_argument('--semente', type=int, default=SEMENTE_BASE)
+    parser.add_argument('--colisao', choices=MOTORES_COLISAO, default='mascaras',
+                        help="motor de colisão (padrão: o do jogo)")
+    parser.add_argument('--processos', type=int, default=os.cpu_count(), help="processos (1 = sem multiprocessing)")
+    parser.add_argument('--saida', help="arquivo JSON onde gravar o relatório")
+    args = parser.parse_args(argv)
+
+    combinacoes = [
+        {
+            'velocidade_inimigos': velocidade,
+            'intervalo_inimigos_ms': intervalo,
+            'atraso_bandeira_ms': atraso,
+            'pontos_vida_extra': vida_extra,
+        }
+        for velocidade, intervalo, atraso, vida_extra in itertools.product(
+            args.velocidades, args.intervalos, args.atrasos_bandeira, args.vidas_extra
+        )
+    ]
+    passos_max = int(args.minutos * 60 * TAXA_SIMULACAO)
+    # A mesma semente para cada combinação: as diferenças vêm só dos parâmetros
+    tarefas = [
+        (fase, parametros, args.semente + partida, passos_max)
+        for fase in args.fases
+        for parametros in combinacoes
+        for partida in range(args.partidas)
+    ]
+
+    inicio = perf_counter()
+    if args.processos <= 1:
+        _iniciar_processo(args.colisao)
+        resultados = [jogar_partida(tarefa) for tarefa in tarefas]
+    else:
+        # Blocos pequenos o bastante para nenhum processo ficar parado no fim
+        bloco = max(1, len(tarefas) // (args.processos * 16))
+        with multiprocessing.Pool(args.processos, initializer=_iniciar_processo, initargs=(args.colisao,)) as pool:
+            resultados = list(pool.imap_unordered(jogar_partida, tarefas, chunksize=bloco))
+    duracao = perf_counter() - inicio
+
+    linhas = resumir(resultados, fases)
+    imprimir_relatorio(linhas)
+    passos = sum(resultado['passos'] for resultado in resultados)
+    print(
+        f"{len(resultados)} partidas ({passos} passos) em {duracao:.1f} s com {args.processos} processo(s): "
+        f"{len(resultados) / duracao:.1f} partidas/s"
+    )
+
+    if args.saida:
+        relatorio = {
+            'parametros': {
+                'partidas': args.partidas,
+                'minutos': args.minutos,
+                'semente': args.semente,
+                'processos': args.processos,
+                'colisao': args.colisao,
+            },
+            'duracao_s': round(duracao, 3),
+            'linhas': linhas,
+        }
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
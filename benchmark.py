@@ -0,0 +1,276 @@
+# ================================
+# Benchmark do Herói dos Pampas
+# Roda cenários roteirizados e com semente fixa, sem janela (driver
+# "dummy" do SDL), e mede o tempo de cada quadro separado por etapa:
+# update, colisão (chimarrões x inimigos e gaúcho x inimigos), desenho e flip,
+# com subetapas (update.inimigos, desenho.fundo...).
+#
+# Uso:
+#   python benchmark.py
+#   python benchmark.py --cenarios enxurrada_inimigos rajada_balas --quadros 1200
+#   python benchmark.py --saida resultado.json --comparar resultado_anterior.json
+#   python benchmark.py --cenarios onda_densa --trace perfil   (grava perfil-onda_densa.trace.json)
+#   python benchmark.py --cenarios contato_inimigos --colisao mascaras   (custo da colisão pixel a pixel)
+#
+# O resultado em JSON serve para comparar versões e achar regressões.
+# ================================
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+from time import perf_counter
+
+# O driver precisa ser escolhido antes de o pygame abrir a tela
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from bots import BotVaivem
+from colisao import MOTORES as MOTORES_COLISAO
+from configuracoes import ALTURA, CAMINHO_ASSETS, FUNDO_MENU, LARGURA
+from entidades import MotorVetorial
+from inicializacao import iniciar_pygame
+from medicao import Medidor, resumir_ms
+from perfilador import Perfilador
+from motor import EVENTO_DANO, Entradas, Motor
+from pacote import PacoteRecursos
+from recursos import GerenciadorRecursos
+from renderizacao import MODOS, Renderizador
+from telas import MENU_OPCOES, Telas, carregar_fontes
+
+VERSAO_FORMATO = 2  # 2: etapas com subetapas (update.inimigos, colisao.balas...)
+FASE_BENCHMARK = 1
+
+
+# ================================
+# CENÁRIOS
+# Cada cenário prepara o motor e devolve o bot que joga por ele.
+# ================================
+
+def _fase_normal(motor):
+    return BotVaivem()
+
+
+# Inimigos surgindo a cada 10 ms: algumas centenas ao mesmo tempo na tela
+def _enxurrada_inimigos(motor):
+    motor.intervalo_inimigos_ms = 10
+    motor.invulneravel = True
+    return BotVaivem(intervalo_tiro=30)
+
+
+# Três chimarrões por passo: algumas centenas voando ao mesmo tempo
+def _rajada_balas(motor):
+    motor.invulneravel = True
+    return BotVaivem(intervalo_tiro=1, disparos=3)
+
+
+# Espaço segurado no meio de uma onda densa: muitos inimigos e muitos chimarrões
+def _onda_densa(motor):
+    motor.intervalo_inimigos_ms = 10
+    motor.invulneravel = True
+    return BotVaivem(intervalo_tiro=1, disparos=3)
+
+
+# Gaúcho parado no meio de uma onda densa, atirando: inimigos passam o
+# tempo todo por ele e pelos chimarrões, o caso em que a colisão
+# 'mascaras' mais testa pixels (compare com --colisao faixas)
+def _contato_inimigos(motor):
+    motor.intervalo_inimigos_ms = 10
+    motor.invulneravel = True
+    return lambda motor: Entradas(disparos=1)
+
+
+CENARIOS_JOGO = {
+    'fase_normal': _fase_normal,
+    'enxurrada_inimigos': _enxurrada_inimigos,
+    'rajada_balas': _rajada_balas,
+    'onda_densa': _onda_densa,
+    'contato_inimigos': _contato_inimigos,
+}
+CENARIOS = ('menu_ocioso',) + tuple(CENARIOS_JOGO)
+
+
+class Benchmark:
+    # entidades: 'sprites' (Motor) ou 'numpy' (MotorVetorial, arrays NumPy)
+    # escala: resolução interna do quadro de jogo (ver escala.py)
+    def __init__(self, modo_renderizacao='completo', colisao='faixas', entidades='sprites', escala=1.0):
+        self.colisao = colisao
+        self.classe_motor = MotorVetorial if entidades == 'numpy' else Motor
+        iniciar_pygame()
+        self.tela = pygame.display.set_mode((LARGURA, ALTURA))
+        self.recursos = GerenciadorRecursos(
+            CAMINHO_ASSETS, (LARGURA, ALTURA), 32 * 1024 * 1024, PacoteRecursos.abrir()
+        )
+        self.renderizador = Renderizador(self.tela, modo_renderizacao, escala)
+        self.telas = Telas(*carregar_fontes())
+
+    def encerrar(self):
+        self.renderizador.encerrar()
+        self.recursos.encerrar()
+        pygame.quit()
+
+    # Menu parado, trocando a opção selecionada de vez em quando
+    def _quadro_menu(self, medidor, quadro):
+        with medidor.etapa('desenho'):
+            self.telas.menu(self.renderizador.tela, self.recursos.fundo(FUNDO_MENU), (quadro // 30) % len(MENU_OPCOES))
+        with medidor.etapa('flip'):
+            self.renderizador.apresentar()
+
+    # Roda um cenário e devolve a lista de registros dos quadros medidos e
+    # um dicionário com informações do cenário inteiro (coletas do GC, pools).
+    # Os quadros de aquecimento (caches vazios, primeiras cargas) não entram na conta.
+    # Com trace=True o medidor é um Perfilador, que guarda a linha do tempo de cada quadro.
+    def rodar(self, cenario, quadros, aquecimento, semente, trace=False):
+        medidor = Perfilador(self.telas.fonte_pequena, capacidade=quadros) if trace else Medidor()
+        motor = None
+        if cenario != 'menu_ocioso':
+            motor = self.classe_motor(self.recursos, semente=semente, colisao=self.colisao)
+            motor.medidor = medidor
+            bot = CENARIOS_JOGO[cenario](motor)
+            motor.iniciar_fase(FASE_BENCHMARK)
+            fundo = self.recursos.fundo(motor.fase.fundo)
+        self.renderizador.medidor = medidor
+        self.renderizador.invalidar()
+
+        coletas_antes = _coletas_gc()  # Refeita ao fim do aquecimento
+        for quadro in range(aquecimento + quadros):
+            if quadro == aquecimento:
+                medidor.quadros.clear()
+                coletas_antes = _coletas_gc()
+            if trace:
+                medidor.iniciar_quadro()
+            inicio = perf_counter()
+
+            if motor is None:
+                self._quadro_menu(medidor, quadro)
+                medidor.fechar_quadro(perf_counter() - inicio)
+                continue
+
+            # Um passo de simulação por quadro; se o gaúcho cair, a fase recomeça
+            eventos = motor.passo(bot(motor))
+            if EVENTO_DANO in eventos and not motor.ativo:
+                motor.reiniciar()
+                motor.iniciar_fase(FASE_BENCHMARK)
+            sobreposicoes = self.telas.sobreposicoes_jogo(motor.pontos, motor.jogador.vida, motor.fase.nome)
+            self.renderizador.desenhar_quadro(fundo, motor.grupos_desenho, sobreposicoes)
+            medidor.fechar_quadro(perf_counter() - inicio, inimigos=len(motor.inimigos), balas=len(motor.balas))
+
+        self.renderizador.medidor = None
+        extras = {'coletas_gc': [depois - antes for antes, depois in zip(coletas_antes, _coletas_gc())]}
+        if motor is not None and motor.estatisticas_pools():
+            extras['pools'] = motor.estatisticas_pools()
+        return medidor, extras
+
+
+# Coletas do GC feitas até agora, por geração
+def _coletas_gc():
+    return [geracao['collections'] for geracao in gc.get_stats()]
+
+
+# Resume os registros de um cenário: percentis do quadro inteiro e de cada etapa
+def resumir_cenario(registros):
+    etapas = sorted({etapa for registro in registros for etapa in registro['etapas']})
+    resumo = {
+        'quadros': len(registros),
+        'quadro_ms': resumir_ms([registro['total'] for registro in registros]),
+        'etapas_ms': {
+            etapa: resumir_ms([registro['etapas'].get(etapa, 0.0) for registro in registros])
+            for etapa in etapas
+        },
+    }
+    for contagem in ('inimigos', 'balas'):
+        valores = [registro[contagem] for registro in registros if contagem in registro]
+        if valores:
+            resumo[contagem] = {'media': round(sum(valores) / len(valores), 1), 'max': max(valores)}
+    return resumo
+
+
+def ambiente():
+    return {
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'sdl': '.'.join(map(str, pygame.get_sdl_version())),
+        'plataforma': platform.platform(),
+        'driver_video': os.environ.get('SDL_VIDEODRIVER'),
+    }
+
+
+def imprimir_resumo(resultado, anterior=None):
+    for nome, resumo in resultado['cenarios'].items():
+        quadro = resumo['quadro_ms']
+        linha = f"{nome:20s} p50 {quadro['p50']:8.3f} ms  p90 {quadro['p90']:8.3f} ms  p99 {quadro['p99']:8.3f} ms"
+        if 'inimigos' in resumo:
+            linha += f"  inimigos {resumo['inimigos']['max']:4d}  balas {resumo['balas']['max']:4d}"
+        print(linha)
+
+        base = (anterior or {}).get('cenarios', {}).get(nome)
+        for etapa, valores in resumo['etapas_ms'].items():
+            texto = f"    {etapa:22s} p50 {valores['p50']:8.3f} ms  p99 {valores['p99']:8.3f} ms"
+            if base and etapa in base['etapas_ms'] and base['etapas_ms'][etapa]['p50'] > 0:
+                variacao = valores['p50'] / base['etapas_ms'][etapa]['p50'] - 1
+                texto += f"  ({variacao:+.1%} no p50)"
+            print(texto)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark sem janela do Herói dos Pampas")
+    parser.add_argument('--cenarios', nargs='+', choices=CENARIOS, default=list(CENARIOS))
+    parser.add_argument('--quadros', type=int, default=600, help="quadros medidos por cenário")
+    parser.add_argument('--aquecimento', type=int, default=60, help="quadros descartados no início de cada cenário")
+    parser.add_argument('--semente', type=int, default=2025)
+    parser.add_argument('--renderizacao', choices=MODOS, default='completo')
+    parser.add_argument('--colisao', choices=MOTORES_COLISAO, default='faixas')
+    parser.add_argument('--entidades', choices=('sprites', 'numpy'), default='sprites')
+    parser.add_argument('--escala', type=float, default=1.0, help="resolução interna do quadro de jogo (ex.: 0.5)")
+    parser.add_argument('--saida', help="arquivo JSON onde gravar o resultado")
+    parser.add_argument('--comparar', help="resultado JSON anterior, para mostrar a variação por etapa")
+    parser.add_argument('--trace', metavar='PREFIXO', help="grava PREFIXO-<cenário>.trace.json (formato do chrome://tracing)")
+    args = parser.parse_args(argv)
+    if args.quadros < 1 or args.aquecimento < 0:
+        parser.error("--quadros precisa ser pelo menos 1 e --aquecimento não pode ser negativo")
+
+    anterior = None
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as arquivo:
+            anterior = json.load(arquivo)
+
+    benchmark = Benchmark(args.renderizacao, args.colisao, args.entidades, args.escala)
+    try:
+        cenarios = {}
+        for nome in args.cenarios:
+            medidor, extras = benchmark.rodar(nome, args.quadros, args.aquecimento, args.semente, bool(args.trace))
+            cenarios[nome] = resumir_cenario(list(medidor.quadros))
+            if args.trace:
+                medidor.exportar_chrome(f"{args.trace}-{nome}.trace.json")
+            cenarios[nome].update(extras)
+    finally:
+        benchmark.encerrar()
+
+    resultado = {
+        'versao': VERSAO_FORMATO,
+        'ambiente': ambiente(),
+        'parametros': {
+            'quadros': args.quadros,
+            'aquecimento': args.aquecimento,
+            'semente': args.semente,
+            'renderizacao': args.renderizacao,
+            'colisao': args.colisao,
+            'entidades': args.entidades,
+            'escala': args.escala,
+        },
+        'cenarios': cenarios,
+    }
+
+    imprimir_resumo(resultado, anterior)
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,62 @@
+# ================================
+# Jogadores automáticos do Herói dos Pampas
+# Um bot é qualquer objeto chamável que recebe o motor e devolve as
+# Entradas do próximo passo. São usados pelo benchmark e por execuções
+# sem janela; como o motor tem semente, a mesma partida se repete sempre.
+# ================================
+
+from configuracoes import ALTURA
+from motor import Entradas
+
+MARGEM_VERTICAL = 60     # O bot vira antes de chegar perto das bordas
+DISTANCIA_PERIGO = 250   # Inimigos mais perto que isso (em x) na mesma faixa são evitados
+
+
+# Anda para cima e para baixo, desviando de inimigos que vêm na mesma
+# altura, e lança `disparos` chimarrões a cada `intervalo_tiro` passos
+class BotVaivem:
+    def __init__(self, intervalo_tiro=12, disparos=1):
+        self.intervalo_tiro = intervalo_tiro
+        self.disparos = disparos
+        self.descendo = True
+        self.passos = 0
+
+    def __call__(self, motor):
+        self.passos += 1
+        rect = motor.jogador.rect
+
+        if rect.bottom >= ALTURA - MARGEM_VERTICAL:
+            self.descendo = False
+        elif rect.top <= MARGEM_VERTICAL:
+            self.descendo = True
+
+        # Inimigo logo à frente na mesma faixa: foge para o lado com mais espaço
+        for alvo in motor.retangulos_inimigos():
+            if 0 <= alvo.left - rect.right < DISTANCIA_PERIGO and alvo.top < rect.bottom and alvo.bottom > rect.top:
+                self.descendo = alvo.centery < rect.centery
+                break
+
+        disparos = self.disparos if self.passos % self.intervalo_tiro == 0 else 0
+        return Entradas(cima=not self.descendo, baixo=self.descendo, disparos=disparos)
+
+
+# Como o BotVaivem, mas, quando a bandeira aparece, anda até ela (ainda
+# desviando dos inimigos à frente). Usado no balanceamento para medir
+# quantas partidas chegam ao fim da fase.
+class BotBandeira(BotVaivem):
+    def __call__(self, motor):
+        entradas = super().__call__(motor)
+        if not motor.bandeira_group:
+            return entradas
+
+        rect = motor.jogador.rect
+        alvo = next(iter(motor.bandeira_group)).rect
+        direita = rect.right < alvo.centerx
+        # Sem inimigo à frente, segue a altura da bandeira em vez do vaivém
+        ameacado = any(
+            0 <= inimigo.left - rect.right < DISTANCIA_PERIGO and inimigo.top < rect.bottom and inimigo.bottom > rect.top
+            for inimigo in motor.retangulos_inimigos()
+        )
+        if not ameacado:
+            self.descendo = rect.centery < alvo.centery
+        return entradas._replace(cima=not self.descendo, baixo=self.descendo, direita=direita)
@@ -0,0 +1,40 @@
+# ================================
+# Cenas do Herói dos Pampas (menu, vinheta, jogo, game over...)
+# O laço principal nunca espera parado: telas que ficam um tempo na
+# janela (vinheta, game over, tela final, pausa depois da bandeira) são
+# cenas com prazo, e o laço continua tratando eventos enquanto isso.
+# Quando o prazo acaba, a função `depois` da cena decide a próxima.
+# ================================
+
+import pygame
+
+
+class Cenas:
+    def __init__(self, inicial):
+        self.atual = inicial
+        self.fim = None          # get_ticks() em que a cena termina (None = sem prazo)
+        self.depois = None       # Chamada quando o prazo acaba
+        self.redesenhar = True   # A cena ainda não foi desenhada (ou a janela pediu)
+
+    def trocar(self, nome, duracao_ms=None, depois=None):
+        self.atual = nome
+        self.fim = None if duracao_ms is None else pygame.time.get_ticks() + duracao_ms
+        self.depois = depois
+        self.redesenhar = True
+
+    # Milissegundos até o prazo da cena atual (None = sem prazo)
+    def restante_ms(self):
+        if self.fim is None:
+            return None
+        return max(0, self.fim - pygame.time.get_ticks())
+
+    # Verifica o prazo da cena atual; devolve True se a cena mudou
+    def atualizar(self):
+        if self.fim is None or pygame.time.get_ticks() < self.fim:
+            return False
+        depois = self.depois
+        self.fim = None
+        self.depois = None
+        if depois is not None:
+            depois()
+        return True
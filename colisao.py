@@ -0,0 +1,164 @@
+# ================================
+# Colisões do Herói dos Pampas
+# Cada passo do motor testa os chimarrões contra os inimigos e o gaúcho
+# contra os inimigos. Há dois motores de colisão com o mesmo resultado,
+# que comparam só os retângulos dos sprites:
+#  - 'pygame': groupcollide/spritecollideany, que testam todos os pares
+#  - 'faixas': os inimigos são indexados por faixas horizontais da tela;
+#    como tudo no jogo anda só na horizontal, cada chimarrão só é testado
+#    contra os inimigos das faixas em que ele está
+# e um preciso, com outro resultado:
+#  - 'mascaras': as faixas e os retângulos escolhem os pares que podem
+#    colidir, e só esses são testados pixel a pixel (máscaras de
+#    transparência). A borda transparente dos sprites não conta mais como
+#    encostar. A máscara de cada imagem é calculada uma vez só.
+#
+# Uso em cada passo: indexar(inimigos), depois balas(balas) e jogador(jogador).
+# ================================
+
+import weakref
+
+import pygame
+
+MOTORES = ('faixas', 'pygame', 'mascaras')
+ALTURA_FAIXA = 64     # Em pixels; da ordem da altura dos sprites
+MINIMO_PARES = 1000   # Abaixo disso (chimarrões x inimigos) o teste de todos os pares é mais rápido
+
+_mascaras = weakref.WeakKeyDictionary()  # Imagem -> Mask, sem segurar a imagem na memória
+
+
+def criar_colisao(nome='faixas'):
+    if nome == 'faixas':
+        return ColisaoPorFaixas()
+    if nome == 'pygame':
+        return ColisaoPygame()
+    if nome == 'mascaras':
+        return ColisaoMascaras()
+    raise ValueError(f"Motor de colisão desconhecido: {nome}")
+
+
+# Máscara da imagem (pixels com alpha acima de 127), calculada na primeira vez.
+# Os sprites de um mesmo tipo compartilham a imagem e, portanto, a máscara.
+def mascara(imagem):
+    resultado = _mascaras.get(imagem)
+    if resultado is None:
+        resultado = _mascaras[imagem] = pygame.mask.from_surface(imagem)
+    return resultado
+
+
+# Teste fino: os retângulos se cruzam e algum pixel opaco de um cobre um do outro
+def encostam_por_mascara(a, b):
+    if not a.rect.colliderect(b.rect):
+        return False
+    return mascara(a.image).overlap(mascara(b.image), (b.rect.x - a.rect.x, b.rect.y - a.rect.y)) is not None
+
+
+class ColisaoPygame:
+    teste_fino = None  # Só os retângulos
+
+    def __init__(self):
+        self.inimigos = None
+
+    def indexar(self, inimigos):
+        self.inimigos = inimigos
+
+    # Chimarrões que acertaram -> inimigos atingidos; os dois lados somem
+    def balas(self, balas):
+        return pygame.sprite.groupcollide(balas, self.inimigos, True, True)
+
+    def jogador(self, jogador):
+        return pygame.sprite.spritecollideany(jogador, self.inimigos)
+
+
+class ColisaoPorFaixas:
+    # Chamado com (sprite, inimigo) depois que os retângulos se cruzam; None = basta o retângulo
+    teste_fino = None
+
+    def __init__(self, altura_faixa=ALTURA_FAIXA, minimo_pares=MINIMO_PARES):
+        self.altura_faixa = altura_faixa
+        self.minimo_pares = minimo_pares
+        self.grupo = None
+        self._inimigos = None  # Na ordem do grupo; None depois de atingido
+        self._faixas = {}      # faixa -> posições em _inimigos, em ordem crescente
+
+    def indexar(self, inimigos):
+        # O índice só é montado em balas(), se houver pares suficientes
+        self.grupo = inimigos
+        self._inimigos = None
+
+    def _montar_indice(self):
+        altura = self.altura_faixa
+        self._inimigos = self.grupo.sprites()
+        faixas = {}
+        for posicao, inimigo in enumerate(self._inimigos):
+            rect = inimigo.rect
+            for faixa in range(rect.top // altura, (rect.bottom - 1) // altura + 1):
+                if faixa in faixas:
+                    faixas[faixa].append(posicao)
+                else:
+                    faixas[faixa] = [posicao]
+        self._faixas = faixas
+
+    # Inimigos que podem encostar em algo que ocupa as faixas de `primeira`
+    # a `ultima`: posições na ordem do grupo (a ordem em que spritecollide
+    # os devolveria)
+    def _candidatos(self, primeira, ultima):
+        faixas = self._faixas
+        if primeira >= ultima:
+            return faixas.get(primeira, ())
+        encontrados = [faixas[faixa] for faixa in range(primeira, ultima + 1) if faixa in faixas]
+        if len(encontrados) == 1:
+            return encontrados[0]
+        return sorted({posicao for lista in encontrados for posicao in lista})
+
+    # Mesmo resultado de groupcollide(balas, inimigos, True, True): cada
+    # chimarrão, na ordem do grupo, leva todos os inimigos vivos que encosta
+    def balas(self, balas):
+        teste = self.teste_fino
+        # Com poucos pares, testar todos sai mais barato que montar o índice
+        if len(balas) * len(self.grupo) < self.minimo_pares:
+            return pygame.sprite.groupcollide(balas, self.grupo, True, True, teste)
+
+        self._montar_indice()
+        inimigos = self._inimigos
+        altura = self.altura_faixa
+        por_faixas = {}  # Os chimarrões saem da mão do gaúcho: muitos ocupam as mesmas faixas
+        acertos = {}
+        for bala in balas.sprites():
+            rect = bala.rect
+            chave = (rect.top // altura, (rect.bottom - 1) // altura)
+            candidatos = por_faixas.get(chave)
+            if candidatos is None:
+                candidatos = por_faixas[chave] = self._candidatos(*chave)
+            atingidos = None
+            for posicao in candidatos:
+                inimigo = inimigos[posicao]
+                if inimigo is not None and rect.colliderect(inimigo.rect) and (teste is None or teste(bala, inimigo)):
+                    if atingidos is None:
+                        atingidos = []
+                    atingidos.append(inimigo)
+                    inimigos[posicao] = None
+                    inimigo.kill()
+            if atingidos:
+                acertos[bala] = atingidos
+                bala.kill()
+        return acertos
+
+    # Mesmo resultado de spritecollideany(jogador, inimigos)
+    def jogador(self, jogador):
+        teste = self.teste_fino
+        if self._inimigos is None:
+            return pygame.sprite.spritecollideany(jogador, self.grupo, teste)
+        rect = jogador.rect
+        altura = self.altura_faixa
+        inimigos = self._inimigos
+        for posicao in self._candidatos(rect.top // altura, (rect.bottom - 1) // altura):
+            inimigo = inimigos[posicao]
+            if inimigo is not None and rect.colliderect(inimigo.rect) and (teste is None or teste(jogador, inimigo)):
+                return inimigo
+        return None
+
+
+# Faixas e retângulos escolhem os pares; as máscaras decidem
+class ColisaoMascaras(ColisaoPorFaixas):
+    teste_fino = staticmethod(encostam_por_mascara)
@@ -0,0 +1,34 @@
+# ================================
+# Configurações compartilhadas do Herói dos Pampas
+# Dimensões da tela e imagens usadas pelo jogo.
+# Ficam num módulo à parte para que o empacotador de recursos
+# (pacote.py) possa usá-las sem abrir a janela do jogo.
+# ================================
+
+import os  # Para lidar com caminhos de arquivos
+
+# Define as dimensões da tela do jogo
+LARGURA, ALTURA = 1536, 1024  # Largura e altura da janela
+
+# Define o caminho da pasta onde estão os assets (imagens, sons, etc.)
+CAMINHO_ASSETS = os.path.join(os.path.dirname(__file__), 'assets')
+
+# Fundo do menu, das instruções e dos créditos; os fundos, nomes e
+# inimigos de cada fase ficam no manifesto fases.json (ver fases.py)
+FUNDO_MENU = 'fundo_pampa.jpg'
+
+# Imagens de Game Over e de sucesso final
+GAME_OVER_ARQUIVO = 'game-over.jpg'
+FINAL_SUCCESS_ARQUIVO = 'success.jpg'
+
+# Sprites de inimigos (todos com a mesma escala); cada fase usa alguns deles
+nomes_inimigos = [
+    'inimigo.png', 'inimigo-2.png', 'inimigo-3.png', 'inimigo-4.png',
+    'inimigo-5.png', 'inimigo-6.png', 'inimigo-7.png', 'inimigo-8.png',
+    'inimigo-9.png', 'inimigo-10.png', 'inimigo-11.png', 'inimigo-12.png'
+]
+
+# Escalas aplicadas às imagens originais
+ESCALA_PERSONAGENS = 0.11  # Gaúcho e inimigos
+ESCALA_BANDEIRA = 0.2
+TAMANHO_BALA = (65, 65)    # O chimarrão tem tamanho fixo
@@ -0,0 +1,243 @@
+# ================================
+# Entidades em arrays do Herói dos Pampas (opcional, requer NumPy)
+# Em vez de um Sprite com Rect e update() próprios para cada inimigo e
+# chimarrão, o ArmazemEntidades guarda x, y, largura, altura, velocidade
+# e índice do sprite em arrays NumPy (uma "struct de arrays"). Movimento,
+# remoção de quem saiu da tela e colisões viram uma operação vetorial
+# por passo, qualquer que seja o número de entidades.
+#
+# O MotorVetorial é um Motor que usa esses armazéns; a mesma semente gera
+# exatamente a mesma partida do Motor com sprites.
+# ================================
+
+import pygame
+
+from colisao import mascara
+from configuracoes import LARGURA
+from motor import Motor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele só o Motor com sprites está disponível
+    np = None
+
+NUMPY_DISPONIVEL = np is not None
+VELOCIDADE_BALA = 10
+
+
+class ArmazemEntidades:
+    CAMPOS = ('x', 'y', 'largura', 'altura', 'velocidade', 'imagem', 'x_anterior', 'y_anterior')
+
+    # imagens: sprites possíveis; cada entidade guarda o índice do seu
+    # nome: usado nas medições de desenho, como o nome de um GrupoInterpolado
+    def __init__(self, imagens, capacidade=64, nome=None):
+        self.imagens = list(imagens)
+        self.nome = nome
+        self.tamanhos = [imagem.get_size() for imagem in self.imagens]
+        for campo in self.CAMPOS:
+            setattr(self, campo, np.zeros(capacidade, np.int32))
+        self.n = 0
+        # As entidades criadas depois de guardar_posicoes() ficam no fim dos
+        # arrays e não têm posição anterior: são desenhadas onde estão
+        self.com_anterior = 0
+        # Retângulos do último desenho, no formato dos grupos do pygame, para o modo 'sujo'
+        self.spritedict = {}
+        self.lostsprites = []
+
+    def __len__(self):
+        return self.n
+
+    # Troca os sprites possíveis (ex.: inimigos de outra fase); só com o armazém vazio
+    def trocar_imagens(self, imagens):
+        self.imagens = list(imagens)
+        self.tamanhos = [imagem.get_size() for imagem in self.imagens]
+
+    def _crescer(self):
+        for campo in self.CAMPOS:
+            antigo = getattr(self, campo)
+            novo = np.zeros(len(antigo) * 2, np.int32)
+            novo[:self.n] = antigo[:self.n]
+            setattr(self, campo, novo)
+
+    # velocidade: deslocamento em x por passo (negativo = para a esquerda)
+    def adicionar(self, indice_imagem, x, y, velocidade):
+        if self.n == len(self.x):
+            self._crescer()
+        i = self.n
+        largura, altura = self.tamanhos[indice_imagem]
+        self.x[i] = self.x_anterior[i] = x
+        self.y[i] = self.y_anterior[i] = y
+        self.largura[i] = largura
+        self.altura[i] = altura
+        self.velocidade[i] = velocidade
+        self.imagem[i] = indice_imagem
+        self.n += 1
+
+    def empty(self):
+        self.n = 0
+        self.com_anterior = 0
+
+    # Remove as entidades marcadas, mantendo a ordem das demais
+    def remover(self, mortos):
+        vivos = ~mortos
+        restantes = int(vivos.sum())
+        if restantes == self.n:
+            return
+        n = self.n
+        for campo in self.CAMPOS:
+            array = getattr(self, campo)
+            array[:restantes] = array[:n][vivos]
+        self.com_anterior = int(vivos[:self.com_anterior].sum())
+        self.n = restantes
+
+    # Anda um passo e remove quem saiu pela esquerda ou pela direita da tela
+    def mover(self):
+        n = self.n
+        if not n:
+            return
+        x = self.x[:n]
+        x += self.velocidade[:n]
+        self.remover((x + self.largura[:n] < 0) | (x > LARGURA))
+
+    def guardar_posicoes(self):
+        n = self.n
+        self.x_anterior[:n] = self.x[:n]
+        self.y_anterior[:n] = self.y[:n]
+        self.com_anterior = n
+
+    def retangulos(self):
+        n = self.n
+        return [
+            pygame.Rect(x, y, largura, altura)
+            for x, y, largura, altura in zip(
+                self.x[:n].tolist(), self.y[:n].tolist(), self.largura[:n].tolist(), self.altura[:n].tolist()
+            )
+        ]
+
+    # Mesmo desenho de GrupoInterpolado.desenhar, só com as entidades vivas
+    def desenhar(self, superficie, alfa, escalador=None):
+        n, m = self.n, self.com_anterior
+        x = self.x[:n].astype(np.float64)
+        y = self.y[:n].astype(np.float64)
+        x[:m] = self.x_anterior[:m] + (x[:m] - self.x_anterior[:m]) * alfa
+        y[:m] = self.y_anterior[:m] + (y[:m] - self.y_anterior[:m]) * alfa
+        imagens = self.imagens
+        if escalador is not None:
+            x *= escalador.fator
+            y *= escalador.fator
+            imagens = [escalador.sprite(imagem) for imagem in imagens]
+        x = np.round(x)
+        y = np.round(y)
+        blits = [
+            (imagens[indice], (px, py))
+            for indice, px, py in zip(self.imagem[:n].tolist(), x.astype(np.int64).tolist(), y.astype(np.int64).tolist())
+        ]
+        self.spritedict = dict(enumerate(superficie.blits(blits)))
+        self.lostsprites = []
+
+    # Apaga o último desenho com o fundo (como Group.clear)
+    def clear(self, superficie, fundo):
+        for rect in self.spritedict.values():
+            superficie.blit(fundo, rect, rect)
+
+
+# Colisões entre dois armazéns, com o resultado de
+# groupcollide(balas, inimigos, True, True): cada chimarrão, na ordem,
+# leva todos os inimigos que encosta e que nenhum chimarrão anterior levou.
+# Com por_mascara, os pares cujos retângulos se cruzam ainda passam pelo
+# teste das máscaras (como a colisão 'mascaras').
+# Devolve quantos chimarrões acertaram.
+def colidir_armazens(balas, inimigos, por_mascara=False):
+    nb, ni = balas.n, inimigos.n
+    if not nb or not ni:
+        return 0
+    bx, by = balas.x[:nb, None], balas.y[:nb, None]
+    ix, iy = inimigos.x[:ni], inimigos.y[:ni]
+    # Mesma regra de Rect.colliderect: bordas que só se tocam não colidem
+    encostam = (
+        (bx < ix + inimigos.largura[:ni]) & (bx + balas.largura[:nb, None] > ix)
+        & (by < iy + inimigos.altura[:ni]) & (by + balas.altura[:nb, None] > iy)
+    )
+    if por_mascara:
+        for b, i in np.argwhere(encostam).tolist():
+            deslocamento = (int(ix[i] - bx[b, 0]), int(iy[i] - by[b, 0]))
+            mascara_bala = mascara(balas.imagens[balas.imagem[b]])
+            if mascara_bala.overlap(mascara(inimigos.imagens[inimigos.imagem[i]]), deslocamento) is None:
+                encostam[b, i] = False
+    atingidos = encostam.any(axis=0)
+    if not atingidos.any():
+        return 0
+    acertaram = np.zeros(nb, bool)
+    acertaram[encostam.argmax(axis=0)[atingidos]] = True  # Primeiro chimarrão de cada inimigo
+    balas.remover(acertaram)
+    inimigos.remover(atingidos)
+    return int(acertaram.sum())
+
+
+# imagem: se dada, os candidatos pelo retângulo ainda passam pelo teste das máscaras
+def encosta_em_algum(rect, armazem, imagem=None):
+    n = armazem.n
+    if not n:
+        return False
+    x, y = armazem.x[:n], armazem.y[:n]
+    encostam = (
+        (rect.left < x + armazem.largura[:n]) & (rect.right > x)
+        & (rect.top < y + armazem.altura[:n]) & (rect.bottom > y)
+    )
+    if imagem is None:
+        return bool(encostam.any())
+    mascara_imagem = mascara(imagem)
+    for i in np.flatnonzero(encostam).tolist():
+        deslocamento = (int(x[i]) - rect.x, int(y[i]) - rect.y)
+        if mascara_imagem.overlap(mascara(armazem.imagens[armazem.imagem[i]]), deslocamento) is not None:
+            return True
+    return False
+
+
+class MotorVetorial(Motor):
+    def __init__(self, recursos, semente=None, interpolar=True, **opcoes):
+        if not NUMPY_DISPONIVEL:
+            raise RuntimeError("O MotorVetorial precisa do NumPy (pip install numpy)")
+        super().__init__(recursos, semente=semente, interpolar=interpolar, **opcoes)
+        self.inimigos = ArmazemEntidades(self.imagens_inimigos, capacidade=256, nome='inimigos')
+        self.balas = ArmazemEntidades([self.imagem_bala], capacidade=256, nome='balas')
+        self.grupos_desenho = (self.jogador_group, self.inimigos, self.balas, self.bandeira_group)
+
+    def _gerar_inimigo(self):
+        indice, y, velocidade = self._sortear_inimigo()
+        self.inimigos.adicionar(indice, LARGURA, y, -velocidade)
+
+    # Mesma posição de Bala: centro em (x, y)
+    def _lancar_bala(self, x, y):
+        largura, altura = self.balas.tamanhos[0]
+        self.balas.adicionar(0, x - largura // 2, y - altura // 2, VELOCIDADE_BALA)
+
+    # A fase acabou de começar, então o armazém de inimigos está vazio
+    def _carregar_inimigos(self, fase):
+        super()._carregar_inimigos(fase)
+        self.inimigos.trocar_imagens(self.imagens_inimigos)
+
+    def _esvaziar_entidades(self):
+        self.inimigos.empty()
+        self.balas.empty()
+
+    def _mover_inimigos(self):
+        self.inimigos.mover()
+
+    def _mover_balas(self):
+        self.balas.mover()
+
+    # Com a colisão 'mascaras', o teste fino também vale para os armazéns
+    def _colidir_balas(self):
+        return colidir_armazens(self.balas, self.inimigos, self.colisao.teste_fino is not None)
+
+    def _colidir_jogador(self):
+        imagem = self.jogador.image if self.colisao.teste_fino is not None else None
+        return encosta_em_algum(self.jogador.rect, self.inimigos, imagem)
+
+    def retangulos_inimigos(self):
+        return self.inimigos.retangulos()
+
+    # Os arrays não usam pools de objetos
+    def estatisticas_pools(self):
+        return {}
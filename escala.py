@@ -0,0 +1,99 @@
+# ================================
+# Escala de desenho do Herói dos Pampas
+# A lógica do jogo usa sempre coordenadas de LARGURA x ALTURA. Quando a
+# janela tem outro tamanho (redimensionada, tela cheia) ou a resolução
+# interna é menor (HEROI_ESCALA=0.5, para máquinas com vídeo fraco), o
+# quadro de jogo é desenhado com posições e sprites multiplicados por um
+# fator, e o Renderizador o amplia para a janela uma vez por quadro.
+#
+# O Escalador guarda os sprites e fundos já redimensionados para o fator
+# atual, presos à superfície original (sem segurá-la na memória). Quando
+# o fator muda, os fundos são refeitos com smoothscale numa thread; até
+# ficarem prontos, uma versão rápida (transform.scale) fica no lugar.
+# ================================
+
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from configuracoes import ALTURA, LARGURA
+
+ESCALAS = (1.0, 0.75, 0.5)  # Resoluções internas oferecidas no jogo (F5 alterna)
+
+
+# Maior retângulo com a proporção do jogo, centralizado na janela
+def area_na_janela(tamanho_janela):
+    largura, altura = tamanho_janela
+    ampliacao = min(largura / LARGURA, altura / ALTURA)
+    area = pygame.Rect(0, 0, max(1, round(LARGURA * ampliacao)), max(1, round(ALTURA * ampliacao)))
+    area.center = (largura // 2, altura // 2)
+    return area
+
+
+def tamanho_escalado(tamanho, fator):
+    return max(1, round(tamanho[0] * fator)), max(1, round(tamanho[1] * fator))
+
+
+class Escalador:
+    def __init__(self):
+        self.fator = 1.0
+        self._sprites = weakref.WeakKeyDictionary()      # original -> sprite no fator atual
+        self._fundos = weakref.WeakKeyDictionary()       # original -> fundo com smoothscale
+        self._provisorios = weakref.WeakKeyDictionary()  # original -> fundo com transform.scale
+        self._em_preparo = weakref.WeakKeyDictionary()   # original -> Future do smoothscale
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="escala")
+
+    # Troca o fator e descarta o que foi redimensionado para o anterior
+    def definir_fator(self, fator):
+        if fator == self.fator:
+            return
+        self.fator = fator
+        self._sprites = weakref.WeakKeyDictionary()
+        self._fundos = weakref.WeakKeyDictionary()
+        self._provisorios = weakref.WeakKeyDictionary()
+        self._em_preparo = weakref.WeakKeyDictionary()
+
+    def posicao(self, x, y):
+        return round(x * self.fator), round(y * self.fator)
+
+    # Sprite no fator atual; o alpha da superfície (fade da bandeira) é
+    # copiado do original a cada uso
+    def sprite(self, imagem):
+        if self.fator == 1.0:
+            return imagem
+        escalada = self._sprites.get(imagem)
+        if escalada is None:
+            tamanho = tamanho_escalado(imagem.get_size(), self.fator)
+            escalada = self._sprites[imagem] = pygame.transform.smoothscale(imagem, tamanho)
+        alpha = imagem.get_alpha()
+        if escalada.get_alpha() != alpha:
+            escalada.set_alpha(alpha)
+        return escalada
+
+    # Fundo no fator atual: o definitivo é feito numa thread; enquanto isso,
+    # devolve uma versão rápida, calculada uma vez só
+    def fundo(self, fundo):
+        if self.fator == 1.0:
+            return fundo
+        pronto = self._fundos.get(fundo)
+        if pronto is not None:
+            return pronto
+
+        tamanho = tamanho_escalado(fundo.get_size(), self.fator)
+        futuro = self._em_preparo.get(fundo)
+        if futuro is None:
+            self._em_preparo[fundo] = self._executor.submit(pygame.transform.smoothscale, fundo, tamanho)
+        elif futuro.done():
+            del self._em_preparo[fundo]
+            pronto = self._fundos[fundo] = futuro.result()
+            self._provisorios.pop(fundo, None)
+            return pronto
+
+        provisorio = self._provisorios.get(fundo)
+        if provisorio is None:
+            provisorio = self._provisorios[fundo] = pygame.transform.scale(fundo, tamanho)
+        return provisorio
+
+    def encerrar(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,141 @@
+# ================================
+# Fases do Herói dos Pampas
+# As fases vêm do manifesto fases.json. Cada fase tem nome, fundo,
+# inimigos que podem surgir nela, intervalo entre inimigos, faixa de
+# velocidade e atraso da bandeira, e pode ter ondas próprias (ver
+# ondas.py). O que a fase não define vem do bloco "padrao".
+#
+# O manifesto é conferido e compilado uma vez, na abertura: um campo
+# errado aparece logo, com a fase e o motivo, e não no meio da partida.
+# As fases são numeradas pela ordem no manifesto, a partir de 1.
+# ================================
+
+import json
+import os
+from collections import namedtuple
+
+from configuracoes import CAMINHO_ASSETS, nomes_inimigos
+from ondas import Onda
+
+CAMINHO_MANIFESTO = os.path.join(os.path.dirname(__file__), 'fases.json')
+
+# inimigos: arquivos dos sprites (de nomes_inimigos); velocidade_inimigos: (mínima, máxima)
+# em px por passo; ondas: tupla de Onda ou None (um inimigo a cada intervalo_inimigos_ms)
+Fase = namedtuple(
+    'Fase', 'numero nome fundo inimigos intervalo_inimigos_ms velocidade_inimigos atraso_bandeira_ms ondas'
+)
+CAMPOS = Fase._fields[1:]
+OBRIGATORIOS = ('nome', 'fundo', 'inimigos', 'intervalo_inimigos_ms', 'velocidade_inimigos', 'atraso_bandeira_ms')
+
+
+# bool é subclasse de int no Python, mas true/false no manifesto é erro
+def _inteiro(valor):
+    return isinstance(valor, int) and not isinstance(valor, bool)
+
+
+def _inteiro_positivo(valor):
+    return _inteiro(valor) and valor > 0
+
+
+# Lista de problemas de uma fase (já com o padrão aplicado); vazia = fase válida
+def _conferir_fase(campos, conferir_arquivos):
+    problemas = [f"campo desconhecido '{nome}'" for nome in campos if nome not in CAMPOS]
+    faltando = [f"falta o campo '{nome}'" for nome in OBRIGATORIOS if nome not in campos]
+    if faltando:
+        return problemas + faltando
+
+    if not isinstance(campos['nome'], str) or not campos['nome']:
+        problemas.append("'nome' deve ser um texto")
+    fundo = campos['fundo']
+    if not isinstance(fundo, str):
+        problemas.append("'fundo' deve ser o nome de um arquivo")
+    elif conferir_arquivos and not os.path.exists(os.path.join(CAMINHO_ASSETS, fundo)):
+        problemas.append(f"fundo '{fundo}' não existe em assets/")
+
+    inimigos = campos['inimigos']
+    if not isinstance(inimigos, list) or not inimigos:
+        problemas.append("'inimigos' deve ser uma lista com pelo menos um sprite")
+    else:
+        desconhecidos = [arquivo for arquivo in inimigos if arquivo not in nomes_inimigos]
+        if desconhecidos:
+            problemas.append(f"inimigos fora de nomes_inimigos: {', '.join(map(str, desconhecidos))}")
+        if len(set(map(str, inimigos))) != len(inimigos):
+            problemas.append("'inimigos' tem sprites repetidos")
+
+    for nome in ('intervalo_inimigos_ms', 'atraso_bandeira_ms'):
+        if not _inteiro_positivo(campos[nome]):
+            problemas.append(f"'{nome}' deve ser um inteiro positivo")
+
+    velocidade = campos['velocidade_inimigos']
+    if not (isinstance(velocidade, list) and len(velocidade) == 2 and all(map(_inteiro_positivo, velocidade))
+            and velocidade[0] <= velocidade[1]):
+        problemas.append("'velocidade_inimigos' deve ser [mínima, máxima], inteiros positivos")
+
+    ondas = campos.get('ondas')
+    if ondas is not None:
+        if not isinstance(ondas, list) or not ondas:
+            problemas.append("'ondas' deve ser uma lista de [início, intervalo, duração]")
+        else:
+            for i, onda in enumerate(ondas, 1):
+                if not (isinstance(onda, list) and len(onda) in (2, 3)
+                        and _inteiro(onda[0]) and onda[0] >= 0 and _inteiro_positivo(onda[1])
+                        and (len(onda) == 2 or onda[2] is None or _inteiro_positivo(onda[2]))):
+                    problemas.append(f"onda {i} deve ser [início >= 0, intervalo > 0, duração > 0 ou null]")
+    return problemas
+
+
+# Confere e compila o manifesto já lido (dict); devolve {número: Fase}.
+# conferir_arquivos: confere se os fundos existem (desnecessário ao reproduzir gravações)
+def compilar_fases(dados, origem='fases.json', conferir_arquivos=True):
+    if not isinstance(dados, dict) or not isinstance(dados.get('fases'), list) or not dados['fases']:
+        raise ValueError(f"{origem}: o manifesto precisa de uma lista 'fases' não vazia")
+    padrao = dados.get('padrao', {})
+    if not isinstance(padrao, dict):
+        raise ValueError(f"{origem}: 'padrao' deve ser um objeto")
+
+    fases = {}
+    erros = [f"padrao: campo desconhecido '{nome}'" for nome in padrao if nome not in CAMPOS]
+    padrao = {nome: valor for nome, valor in padrao.items() if nome in CAMPOS}  # Avisados uma vez só, acima
+    for numero, fase in enumerate(dados['fases'], 1):
+        if not isinstance(fase, dict):
+            erros.append(f"fase {numero}: deve ser um objeto")
+            continue
+        campos = dict(padrao, **fase)
+        problemas = _conferir_fase(campos, conferir_arquivos)
+        if problemas:
+            erros += [f"fase {numero} ({campos.get('nome', '?')}): {problema}" for problema in problemas]
+            continue
+        ondas = campos.get('ondas')
+        fases[numero] = Fase(
+            numero, campos['nome'], campos['fundo'], tuple(campos['inimigos']), campos['intervalo_inimigos_ms'],
+            tuple(campos['velocidade_inimigos']), campos['atraso_bandeira_ms'],
+            None if ondas is None else tuple(Onda(*onda) for onda in ondas),
+        )
+    if erros:
+        raise ValueError(f"{origem} inválido:\n  " + "\n  ".join(erros))
+    return fases
+
+
+def carregar_fases(caminho=CAMINHO_MANIFESTO):
+    try:
+        with open(caminho, encoding='utf-8') as arquivo:
+            dados = json.load(arquivo)
+    except json.JSONDecodeError as erro:
+        raise ValueError(f"{caminho}: JSON inválido ({erro})") from None
+    return compilar_fases(dados, origem=caminho)
+
+
+# Manifesto já compilado, sem o bloco "padrao" (gravado junto com as sessões)
+def exportar_fases(fases):
+    return {'fases': [
+        {
+            'nome': fase.nome,
+            'fundo': fase.fundo,
+            'inimigos': list(fase.inimigos),
+            'intervalo_inimigos_ms': fase.intervalo_inimigos_ms,
+            'velocidade_inimigos': list(fase.velocidade_inimigos),
+            'atraso_bandeira_ms': fase.atraso_bandeira_ms,
+            'ondas': None if fase.ondas is None else [list(onda) for onda in fase.ondas],
+        }
+        for _, fase in sorted(fases.items())
+    ]}
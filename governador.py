@@ -0,0 +1,73 @@
+# ================================
+# Governador de qualidade do Herói dos Pampas
+# Acompanha o tempo de trabalho dos últimos quadros do jogo e, quando a
+# média passa do orçamento de um quadro a 60 FPS, desce um nível de
+# qualidade, cortando trabalho opcional:
+#   1. sombras dos textos e fade da bandeira
+#   2. e também um limite de inimigos vivos e de chimarrões no ar
+#   3. limites mais baixos
+# Quando há folga por um tempo, sobe um nível de novo.
+#
+# O tempo usado é o de Clock.get_rawtime(): o quadro sem a espera do
+# limite de FPS. Com o limite, Clock.get_time() fica sempre perto de
+# 16,7 ms e não mostra quanta folga sobra.
+#
+# No jogo: HEROI_QUALIDADE=auto (padrão) liga o governador; um número
+# (0 a 3) fixa o nível.
+# ================================
+
+from collections import deque, namedtuple
+
+ORCAMENTO_QUADRO_MS = 1000 / 60
+JANELA_QUADROS = 60       # Quadros considerados para descer de nível (1 s a 60 FPS)
+QUADROS_PARA_SUBIR = 180  # Quadros seguidos com folga para subir de nível (3 s)
+FOLGA = 0.6               # Há folga quando a média fica abaixo de 60% do orçamento
+
+# sombras/efeitos_alpha: trabalho opcional ligado; limite_*: None = sem limite
+Nivel = namedtuple('Nivel', 'nome sombras efeitos_alpha limite_inimigos limite_balas')
+
+NIVEIS = (
+    Nivel('completa', True, True, None, None),
+    Nivel('sem efeitos', False, False, None, None),
+    Nivel('reduzida', False, False, 40, 30),
+    Nivel('mínima', False, False, 20, 15),
+)
+
+
+class Governador:
+    def __init__(self, orcamento_ms=ORCAMENTO_QUADRO_MS, janela=JANELA_QUADROS,
+                 quadros_para_subir=QUADROS_PARA_SUBIR, niveis=NIVEIS):
+        self.orcamento_ms = orcamento_ms
+        self.janela = janela
+        self.niveis = niveis
+        self.nivel = 0
+        self.tempos = deque(maxlen=max(janela, quadros_para_subir))
+        self.mudancas = 0
+
+    @property
+    def atual(self):
+        return self.niveis[self.nivel]
+
+    # Registra o tempo de trabalho de um quadro (ms); devolve o Nivel novo
+    # quando o nível muda, senão None
+    def registrar(self, ms):
+        tempos = self.tempos
+        tempos.append(ms)
+        if len(tempos) < self.janela:
+            return None
+
+        ultimos = list(tempos)[-self.janela:]
+        if sum(ultimos) / len(ultimos) > self.orcamento_ms:
+            if self.nivel == len(self.niveis) - 1:
+                return None
+            return self.definir(self.nivel + 1)
+        if len(tempos) == tempos.maxlen and self.nivel > 0 and sum(tempos) / len(tempos) < self.orcamento_ms * FOLGA:
+            return self.definir(self.nivel - 1)
+        return None
+
+    # Muda para o nível pedido; os quadros medidos no nível anterior são descartados
+    def definir(self, nivel):
+        self.nivel = max(0, min(nivel, len(self.niveis) - 1))
+        self.tempos.clear()
+        self.mudancas += 1
+        return self.atual
@@ -0,0 +1,202 @@
+# ================================
+# Gravação e reprodução de partidas do Herói dos Pampas
+# O Motor é determinístico: com a mesma semente e as mesmas entradas a
+# cada passo, a partida é sempre a mesma. O Gravador guarda a semente, os
+# parâmetros de jogo e tudo o que o jogo pediu ao motor (entradas de cada
+# passo, início de fase, volta ao menu); reproduzir() refaz a partida sem
+# janela, tão rápido quanto a CPU permitir, e conferir() compara o estado
+# final (pontos, vidas, fase e passos) com o gravado.
+#
+# Gravar no jogo:  HEROI_GRAVAR=sessao.json python main.py
+# Reproduzir:      python gravacao.py sessao.json [--entidades numpy]
+# ================================
+
+import argparse
+import json
+import sys
+from time import perf_counter
+
+from colisao import MOTORES as MOTORES_COLISAO
+from fases import compilar_fases, exportar_fases
+from motor import Entradas, Motor, criar_motor_sem_janela
+from ondas import Onda
+
+# Gravações de outra versão são recusadas
+VERSAO_FORMATO = 2  # 2: colisão, limites de entidades ('l') e manifesto das fases
+
+# Comandos gravados, em ordem:
+#   ['p', codigo, n]  n passos seguidos com as mesmas entradas
+#   ['f', fase]       iniciar_fase(fase)
+#   ['r']             reiniciar()
+#   ['l', ini, bal]   limitar_entidades(ini, bal) (governador de qualidade)
+# codigo: bits 0-3 = cima, baixo, esquerda, direita; do bit 4 em diante, disparos
+
+
+def codificar_entradas(entradas):
+    return (
+        bool(entradas.cima) | bool(entradas.baixo) << 1 | bool(entradas.esquerda) << 2
+        | bool(entradas.direita) << 3 | entradas.disparos << 4
+    )
+
+
+def decodificar_entradas(codigo):
+    return Entradas(bool(codigo & 1), bool(codigo & 2), bool(codigo & 4), bool(codigo & 8), codigo >> 4)
+
+
+# Estado conferido no fim da reprodução
+def estado_final(motor):
+    return {
+        'pontos': motor.pontos,
+        'vida': motor.jogador.vida,
+        'fase_atual': motor.fase_atual,
+        'passos': motor.passos,
+    }
+
+
+class Gravador:
+    # Deve ser ligado a um motor recém-criado, antes da primeira fase
+    def __init__(self, motor):
+        if motor.passos:
+            raise ValueError("O gravador precisa de um motor que ainda não andou nenhum passo")
+        self.motor = motor
+        self.comandos = []
+        self.parametros = {
+            'intervalo_inimigos_ms': motor.intervalo_inimigos_ms,
+            'velocidade_inimigos': None if motor.velocidade_inimigos is None else list(motor.velocidade_inimigos),
+            'pontos_vida_extra': motor.pontos_vida_extra,
+            'atraso_bandeira_ms': motor.atraso_bandeira_ms,
+            'invulneravel': motor.invulneravel,
+            'ondas_por_fase': {str(fase): [list(onda) for onda in ondas] for fase, ondas in motor.ondas_por_fase.items()},
+            'fases': exportar_fases(motor.fases),  # A partida não depende do fases.json de quem reproduz
+        }
+        motor.gravador = self
+
+    def passo(self, entradas):
+        codigo = codificar_entradas(entradas)
+        ultimo = self.comandos[-1] if self.comandos else None
+        if ultimo is not None and ultimo[0] == 'p' and ultimo[1] == codigo:
+            ultimo[2] += 1
+        else:
+            self.comandos.append(['p', codigo, 1])
+
+    def iniciar_fase(self, fase):
+        self.comandos.append(['f', fase])
+
+    def reiniciar(self):
+        self.comandos.append(['r'])
+
+    def limitar_entidades(self, inimigos, balas):
+        self.comandos.append(['l', inimigos, balas])
+
+    def dados(self):
+        return {
+            'versao': VERSAO_FORMATO,
+            'semente': self.motor.semente,
+            'motor': type(self.motor).__name__,
+            'colisao': self.motor.nome_colisao,
+            'parametros': self.parametros,
+            'comandos': self.comandos,
+            'final': estado_final(self.motor),
+        }
+
+    def salvar(self, caminho):
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            json.dump(self.dados(), arquivo, separators=(',', ':'))
+
+
+def carregar(caminho):
+    with open(caminho, encoding='utf-8') as arquivo:
+        dados = json.load(arquivo)
+    _conferir_versao(dados, caminho)
+    return dados
+
+
+def _conferir_versao(dados, origem='gravação'):
+    if dados.get('versao') != VERSAO_FORMATO:
+        raise ValueError(
+            f"{origem}: versão de gravação {dados.get('versao')} não suportada (esta versão lê a {VERSAO_FORMATO})"
+        )
+
+
+def _classe_motor(nome):
+    if nome == 'MotorVetorial':
+        from entidades import MotorVetorial  # Só importa o NumPy se a gravação pedir
+        return MotorVetorial
+    return Motor
+
+
+# Refaz a partida gravada num motor sem janela e devolve o motor no estado final.
+# classe: força Motor ou MotorVetorial (por padrão, o da gravação)
+# opcoes: repassadas ao motor; a colisão, por padrão, é a da gravação
+# ('faixas' e 'pygame' dão o mesmo resultado, 'mascaras' não)
+def reproduzir(dados, classe=None, **opcoes):
+    _conferir_versao(dados)
+    if opcoes.get('colisao') is None:
+        opcoes['colisao'] = dados['colisao']
+    motor = criar_motor_sem_janela(dados['semente'], classe or _classe_motor(dados['motor']), **opcoes)
+    parametros = dados['parametros']
+    motor.intervalo_inimigos_ms = parametros['intervalo_inimigos_ms']
+    motor.atraso_bandeira_ms = parametros['atraso_bandeira_ms']
+    motor.invulneravel = parametros['invulneravel']
+    velocidade = parametros['velocidade_inimigos']
+    motor.velocidade_inimigos = None if velocidade is None else tuple(velocidade)
+    motor.pontos_vida_extra = parametros['pontos_vida_extra']
+    motor.ondas_por_fase = {
+        int(fase): [Onda(*onda) for onda in ondas] for fase, ondas in parametros['ondas_por_fase'].items()
+    }
+    motor.fases = compilar_fases(parametros['fases'], origem='gravação', conferir_arquivos=False)
+
+    passo = motor.passo
+    for comando in dados['comandos']:
+        if comando[0] == 'p':
+            entradas = decodificar_entradas(comando[1])
+            for _ in range(comando[2]):
+                passo(entradas)
+        elif comando[0] == 'f':
+            motor.iniciar_fase(comando[1])
+        elif comando[0] == 'r':
+            motor.reiniciar()
+        elif comando[0] == 'l':
+            motor.limitar_entidades(comando[1], comando[2])
+        else:
+            raise ValueError(f"Comando de gravação desconhecido: {comando[0]!r}")
+    return motor
+
+
+# Diferenças entre o estado final gravado e o do motor (lista vazia = igual)
+def conferir(dados, motor):
+    obtido = estado_final(motor)
+    return [
+        f"{chave}: gravado {esperado}, reproduzido {obtido[chave]}"
+        for chave, esperado in dados['final'].items()
+        if obtido.get(chave) != esperado
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reproduz sem janela uma partida gravada do Herói dos Pampas")
+    parser.add_argument('gravacao', help="arquivo JSON gravado com HEROI_GRAVAR")
+    parser.add_argument('--entidades', choices=('sprites', 'numpy'), help="motor usado na reprodução (padrão: o da gravação)")
+    parser.add_argument('--colisao', choices=MOTORES_COLISAO, help="motor de colisão (padrão: o da gravação)")
+    args = parser.parse_args(argv)
+
+    dados = carregar(args.gravacao)
+    classe = None
+    if args.entidades:
+        classe = _classe_motor('MotorVetorial' if args.entidades == 'numpy' else 'Motor')
+
+    inicio = perf_counter()
+    motor = reproduzir(dados, classe, colisao=args.colisao)
+    duracao = perf_counter() - inicio
+
+    print(f"{motor.passos} passos em {duracao:.2f} s ({motor.passos / max(duracao, 1e-9):.0f} passos/s)")
+    diferencas = conferir(dados, motor)
+    for diferenca in diferencas:
+        print(f"  DIVERGE {diferenca}")
+    if not diferencas:
+        print(f"  OK {estado_final(motor)}")
+    return 1 if diferencas else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+# ================================
+# Inicialização rápida do Herói dos Pampas
+# - pygame.init() inicia todos os módulos, inclusive joystick e outros que
+#   o jogo não usa; iniciar_pygame() inicia só vídeo, fontes, mixer e o
+#   timer do SDL (get_ticks).
+# - pygame.font.SysFont() varre as fontes do sistema na primeira chamada
+#   (fc-list no Linux, lento), mesmo quando a fonte pedida nem existe.
+#   fonte() procura primeiro um arquivo em assets/fontes/ e depois o
+#   resultado guardado de uma execução anterior; só sem os dois varre o
+#   sistema, e guarda o que achou (ou que não achou) para a próxima vez.
+#   Para procurar de novo (ex.: fonte instalada depois), apague o arquivo
+#   ~/.cache/heroi-dos-pampas/fontes.json.
+# - MarcosInicio anota quanto durou cada fase da abertura (import, init,
+#   fontes, recursos, primeiro quadro).
+# ================================
+
+import json
+import os
+import sys
+from time import perf_counter
+
+import pygame
+
+from configuracoes import CAMINHO_ASSETS
+
+CAMINHO_FONTES = os.path.join(CAMINHO_ASSETS, 'fontes')
+ARQUIVO_CACHE_FONTES = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'heroi-dos-pampas', 'fontes.json'
+)
+
+_fontes = None  # (nome, negrito) -> [caminho ou None, negrito sintético]
+
+
+# Inicia só os módulos do pygame que o jogo usa; completo=True usa pygame.init()
+def iniciar_pygame(completo=False):
+    if completo:
+        pygame.init()
+        return
+    pygame.display.init()
+    pygame.font.init()
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        pass  # Sem dispositivo de áudio: o GerenciadorSons avisa e o jogo segue sem som
+    pygame.time.wait(0)  # Inicia o timer do SDL; sem ele, get_ticks() fica sempre em 0
+
+
+def _carregar_cache_fontes():
+    try:
+        with open(ARQUIVO_CACHE_FONTES, encoding='utf-8') as arquivo:
+            return {tuple(chave.split('|')): valor for chave, valor in json.load(arquivo).items()}
+    except (OSError, ValueError):
+        return {}
+
+
+def _salvar_cache_fontes():
+    try:
+        os.makedirs(os.path.dirname(ARQUIVO_CACHE_FONTES), exist_ok=True)
+        with open(ARQUIVO_CACHE_FONTES, 'w', encoding='utf-8') as arquivo:
+            json.dump({'|'.join(chave): valor for chave, valor in _fontes.items()}, arquivo, indent=1)
+    except OSError as erro:
+        print(f"Fontes: não foi possível guardar {ARQUIVO_CACHE_FONTES}: {erro}", file=sys.stderr)
+
+
+# Caminho da fonte e se o negrito precisa ser simulado, como pygame.font.SysFont
+# faria; caminho None = fonte padrão do pygame
+def _procurar_fonte(nome, negrito):
+    arquivos = [f"{nome}-negrito.ttf", f"{nome}.ttf"] if negrito else [f"{nome}.ttf"]
+    for arquivo in arquivos:
+        caminho = os.path.join(CAMINHO_FONTES, arquivo)
+        if os.path.exists(caminho):
+            return [caminho, negrito and arquivo == f"{nome}.ttf"]
+
+    global _fontes
+    if _fontes is None:
+        _fontes = _carregar_cache_fontes()
+    chave = (nome, 'negrito' if negrito else 'normal')
+    guardada = _fontes.get(chave)
+    if guardada is not None and (guardada[0] is None or os.path.exists(guardada[0])):
+        return guardada
+
+    # Varredura das fontes do sistema (só na primeira vez em cada máquina)
+    caminho = pygame.font.match_font(nome, bold=negrito)
+    sintetico = negrito and (caminho is None or caminho == pygame.font.match_font(nome))
+    _fontes[chave] = [caminho, sintetico]
+    _salvar_cache_fontes()
+    return _fontes[chave]
+
+
+def fonte(nome, tamanho, negrito=False):
+    caminho, sintetico = _procurar_fonte(nome, negrito)
+    resultado = pygame.font.Font(caminho, tamanho)
+    resultado.set_bold(sintetico)
+    return resultado
+
+
+# Tempo de cada fase da abertura do jogo, até o primeiro quadro
+class MarcosInicio:
+    def __init__(self, inicio=None):
+        self.inicio = perf_counter() if inicio is None else inicio
+        self.ultimo = self.inicio
+        self.fases = []  # (fase, ms)
+
+    def marcar(self, fase):
+        agora = perf_counter()
+        self.fases.append((fase, (agora - self.ultimo) * 1000))
+        self.ultimo = agora
+
+    def total_ms(self):
+        return (self.ultimo - self.inicio) * 1000
+
+    def imprimir(self):
+        for fase, ms in self.fases:
+            print(f"  {fase:<18s}{ms:8.1f} ms")
+        print(f"Abertura: {self.total_ms():.0f} ms até o primeiro quadro")
@@ -6,528 +6,416 @@
 # As fases fazem alusão a cidades do Rio Grande do Sul.
 # ================================
 
+# Marca o início da abertura, antes das importações (HEROI_TEMPOS=1 mostra as fases)
+from time import perf_counter
+inicio_abertura = perf_counter()
+
 # Importação das bibliotecas essenciais
 import pygame   # Biblioteca principal para jogos 2D em Python
-import random   # Para gerar posições aleatórias dos inimigos
 import sys      # Para encerrar o jogo corretamente
 import os       # Para lidar com caminhos de arquivos
-
-# Inicializa todos os módulos do Pygame
-pygame.init()
-
-# Define as dimensões da tela do jogo
-LARGURA, ALTURA = 1536, 1024  # Largura e altura da janela
-TELA = pygame.display.set_mode((LARGURA, ALTURA))  # Cria a janela do jogo
-pygame.display.set_caption("Herói dos Pampas")  # Define o título da janela
-
-# Define o caminho da pasta onde estão os assets (imagens, sons, etc.)
-CAMINHO_ASSETS = os.path.join(os.path.dirname(__file__), 'assets')
-
-# Lista com os arquivos dos fundos de cada fase
-# As imagens são redimensionadas para o tamanho da tela
-# A última imagem é usada como tela final de sucesso
-# (e.g., quando o jogador termina o jogo com vitória)
-diretorios_fundos = [
-    'fundo_pampa.jpg',     # Menu
-    'fundo_pampa-2.jpg',   # Fase 1
-    'fundo_pampa-3.jpg',   # Fase 2
-    'fundo_pampa-4.jpg',   # Fase 3
-    'fundo_pampa-5.jpg',   # Fase 4
-    'fundo_pampa-6.jpg',   # Fase 5
-    'fundo_pampa-7.jpg',   # Fase 6
-    'fundo_pampa-8.jpg',   # Fase 7
-    'fundo_pampa-9.jpg',   # Fase 8
-    'fundo_pampa-10.jpg',  # Fase 9
-    'fundo_pampa-11.jpg',  # Fase 10
-    'fundo_pampa-12.jpg',  # Fase 11
-    'fundo_pampa-13.jpg',  # Fase 12
-    'fundo_pampa-14.jpg',  # Fase 13
-    'success.jpg'          # Fundo final (usado para proteção de índice)
-]
-
-BANDEIRA_IMG = pygame.image.load(os.path.join(CAMINHO_ASSETS, 'bandeira.png'))
-
-fundos = [
-    pygame.transform.scale(pygame.image.load(os.path.join(CAMINHO_ASSETS, fundo)), (LARGURA, ALTURA))
-    for fundo in diretorios_fundos
-]
-
-# Carrega a imagem do jogador (Gaúcho) e redimensiona
-GAUCHO_ORIGINAL = pygame.image.load(os.path.join(CAMINHO_ASSETS, 'gaucho.png'))
-GAUCHO = pygame.transform.scale(GAUCHO_ORIGINAL, (
-    int(GAUCHO_ORIGINAL.get_width() * 0.11),
-    int(GAUCHO_ORIGINAL.get_height() * 0.11)
-))
-
-
-# Carrega múltiplos sprites de inimigos com tamanhos fixos
-nomes_inimigos = [
-    'inimigo.png', 'inimigo-2.png', 'inimigo-3.png', 'inimigo-4.png',
-    'inimigo-5.png', 'inimigo-6.png', 'inimigo-7.png', 'inimigo-8.png',
-    'inimigo-9.png', 'inimigo-10.png', 'inimigo-11.png', 'inimigo-12.png'
-]
-
-sprites_inimigos = []
-for nome in nomes_inimigos:
-    img = pygame.image.load(os.path.join(CAMINHO_ASSETS, nome))
-    img = pygame.transform.scale(img, (
-        int(img.get_width() * 0.11),
-        int(img.get_height() * 0.11)
-    ))
-    sprites_inimigos.append(img)
-
-# Carrega o sprite do chimarrão (projetil) e redimensiona
-BALA = pygame.transform.scale(pygame.image.load(os.path.join(CAMINHO_ASSETS, 'bala.png')), (65, 65))
-
-# Tenta carregar os arquivos de som (tiro e impacto)
+import time     # Para nomear os arquivos do perfilador
+
+from cenas import Cenas  # Telas com prazo (vinheta, game over...) sem travar o laço
+from configuracoes import (
+    ALTURA, CAMINHO_ASSETS, FINAL_SUCCESS_ARQUIVO, FUNDO_MENU, GAME_OVER_ARQUIVO, LARGURA
+)
+from fases import carregar_fases  # Manifesto das fases (fases.json), conferido na abertura
+from motor import (  # Estado do mundo e regras do jogo, sem desenho
+    EVENTO_ACERTO, EVENTO_DANO, EVENTO_FASE_CONCLUIDA, EVENTO_GAME_OVER, EVENTO_TIRO, EVENTO_VITORIA,
+    PASSO_MS, SPRITES_MOTOR, Motor, entradas_do_teclado, grupo_inimigos
+)
+from entidades import MotorVetorial  # Inimigos e chimarrões em arrays NumPy (opcional)
+from pacote import PacoteRecursos  # Pacote de sprites e fundos pré-processados
+from gravacao import Gravador  # Grava a sessão para reproduzi-la sem janela
+from governador import NIVEIS, Governador  # Reduz trabalho opcional quando os quadros passam do orçamento
+from inicializacao import MarcosInicio, fonte, iniciar_pygame  # Abertura rápida e fontes sem varrer o sistema
+from perfilador import Perfilador  # Tempos por quadro, gráfico (F3) e exportação (F4)
+from recursos import GerenciadorRecursos, imprimir_tempos_carga  # Dono de todas as imagens e sons
+from renderizacao import Renderizador  # Quadro completo ou só retângulos sujos
+from sons import GerenciadorSons, preparar_mixer  # Canais reservados e limite de vozes
+from telas import MENU_OPCOES, Telas, carregar_fontes, desenhar_carga  # Menu, vinheta, instruções, créditos e HUD
+
+marcos = MarcosInicio(inicio_abertura)
+marcos.marcar('import')
+
+# Fases do jogo: um erro no manifesto impede a abertura, com a lista dos problemas
 try:
-    TIRO_SOM = pygame.mixer.Sound(os.path.join(CAMINHO_ASSETS, 'tiro.wav'))
-    IMPACTO_SOM = pygame.mixer.Sound(os.path.join(CAMINHO_ASSETS, 'impacto.wav'))
-except:
-    TIRO_SOM = IMPACTO_SOM = None  # Se der erro, desativa os sons
+    fases = carregar_fases()
+except (OSError, ValueError) as erro:
+    sys.exit(f"Fases: {erro}")
 
-# Carrega imagem de Game Over redimensionada
-GAME_OVER_IMG = pygame.transform.scale(pygame.image.load(os.path.join(CAMINHO_ASSETS, 'game-over.jpg')), (LARGURA, ALTURA))
+# Inicializa só os módulos do Pygame que o jogo usa (o mixer com buffer pequeno,
+# para pouca latência); HEROI_INICIO_COMPLETO=1 inicia todos com pygame.init()
+preparar_mixer()
+iniciar_pygame(completo=os.environ.get('HEROI_INICIO_COMPLETO') == '1')
 
-# Carrega imagem final de sucesso redimensionada
-FINAL_SUCCESS_IMG = pygame.transform.scale(pygame.image.load(os.path.join(CAMINHO_ASSETS, 'success.jpg')), (LARGURA, ALTURA))
+# A janela pode ser redimensionada; HEROI_TELA_CHEIA=1 começa em tela cheia (F11 alterna)
+tela_cheia = os.environ.get('HEROI_TELA_CHEIA') == '1'
 
-# Define os frames por segundo do jogo
-FPS = 60
-clock = pygame.time.Clock()
-
-# Função auxiliar para desenhar texto branco com sombra preta
-def desenhar_texto_com_sombra(texto, fonte, cor_texto, posicao, superficie):
-    sombra = fonte.render(texto, True, (0, 0, 0))
-    texto_surface = fonte.render(texto, True, cor_texto)
-    x, y = posicao
-    superficie.blit(sombra, (x + 2, y + 2))
-    superficie.blit(texto_surface, (x, y))
-
-# Exibe vinheta de transição entre fases
-def mostrar_vinheta(fase_num, vidas):
-    TELA.blit(fundos[min(fase_num, len(fundos)-1)], (0, 0))
-    nome_fase = nomes_fase.get(fase_num, "")
-    texto_fase = fonte.render(nome_fase, True, (255, 255, 255))
-    texto_vida = fonte_pequena.render(f"Vida: {vidas}", True, (255, 255, 255))
-
-    x_fase = (LARGURA - texto_fase.get_width()) // 2
-    y_fase = (ALTURA - texto_fase.get_height()) // 2 - 30
-    x_vida = (LARGURA - texto_vida.get_width()) // 2
-    y_vida = y_fase + 80
-
-    desenhar_texto_com_sombra(nome_fase, fonte, (255, 255, 255), (x_fase, y_fase), TELA)
-    desenhar_texto_com_sombra(f"Vida: {vidas}", fonte_pequena, (255, 255, 255), (x_vida, y_vida), TELA)
+def abrir_janela():
+    if tela_cheia:
+        return pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    return pygame.display.set_mode((LARGURA, ALTURA), pygame.RESIZABLE)
 
+TELA = abrir_janela()  # Cria a janela do jogo
+pygame.display.set_caption("Herói dos Pampas")  # Define o título da janela
+marcos.marcar('init')
+
+# Fontes da tela de carga, das telas do jogo e do perfilador: um arquivo em
+# assets/fontes/ ou o caminho guardado da última vez, sem varrer as fontes do sistema
+fonte_carga = pygame.font.Font(None, 40)  # Fonte embutida no pygame
+fontes_telas = carregar_fontes()
+fonte_perfilador = fonte("consolas", 16)
+marcos.marcar('fontes')
+
+# Orçamento de memória (em MB) para os fundos decodificados.
+# Cada fundo ocupa cerca de 6 MB no formato da tela;
+# pode ser ajustado pela variável de ambiente HEROI_FUNDOS_MB.
+ORCAMENTO_FUNDOS_MB = int(os.environ.get('HEROI_FUNDOS_MB', 32))
+
+# Todas as imagens e sons passam pelo gerenciador de recursos, que usa o
+# pacote pré-processado (gerado com "python pacote.py") quando ele existe.
+# Os fundos são carregados só quando a fase precisa deles.
+recursos = GerenciadorRecursos(
+    CAMINHO_ASSETS, (LARGURA, ALTURA), ORCAMENTO_FUNDOS_MB * 1024 * 1024, PacoteRecursos.abrir()
+)
+
+# Tela de carga: os sprites do jogo, os inimigos e os fundos do menu e da
+# primeira fase são decodificados em paralelo, um por núcleo; os das demais
+# fases são carregados quando a fase começa (os fundos durante a vinheta).
+# HEROI_TEMPOS=1 mostra no terminal o tempo de cada imagem.
+def mostrar_progresso(feitos, total, nome):
+    desenhar_carga(TELA, fonte_carga, feitos, total)
     pygame.display.flip()
-    pygame.time.wait(3000)
-
-# ================================
-# CLASSES PRINCIPAIS DO JOGO
-# ================================
-
-# Classe que representa o jogador (Gaúcho)
-class Jogador(pygame.sprite.Sprite):
-    def __init__(self):
-        super().__init__()
-        self.image = GAUCHO
-        self.rect = self.image.get_rect()
-        self.rect.center = (100, ALTURA // 2)
-        self.vida = 5
-
-    def update(self, keys):
-        if keys[pygame.K_UP] and self.rect.top > 50:
-            self.rect.y -= 5
-        if keys[pygame.K_DOWN] and self.rect.bottom < ALTURA - 50:
-            self.rect.y += 5
-        if keys[pygame.K_LEFT] and self.rect.left > 0:
-            self.rect.x -= 5
-        if keys[pygame.K_RIGHT] and self.rect.right < LARGURA:
-            self.rect.x += 5
-
-class Inimigo(pygame.sprite.Sprite):
-    ultimas_y = []
-
-    def __init__(self):
-        super().__init__()
-        self.image = random.choice(sprites_inimigos)
-        self.rect = self.image.get_rect()
-        self.rect.x = LARGURA
-        self.velocidade = random.randint(3, 8)
-
-        tentativa = 0
-        
-        while tentativa < 10:
-            y = random.randint(50, ALTURA - self.rect.height - 50)
-
-            if all(abs(y - usado) > 130 for usado in Inimigo.ultimas_y):
-                self.rect.y = y
-                Inimigo.ultimas_y.append(y)
-                if len(Inimigo.ultimas_y) > 10:
-                    Inimigo.ultimas_y.pop(0)
-                break
-            tentativa += 1
-        else:
-            self.rect.y = random.randint(0, ALTURA - self.rect.height)
-
-    def update(self):
-        self.rect.x -= self.velocidade
-        
-        if self.rect.right < 0:
-            self.kill()
-
-class Bandeira(pygame.sprite.Sprite):
-    def __init__(self):
-        super().__init__()
-        self.base_image = pygame.transform.scale(
-            BANDEIRA_IMG,
-            (int(BANDEIRA_IMG.get_width() * 0.2), int(BANDEIRA_IMG.get_height() * 0.2))
-        )
-        self.image = self.base_image.copy()
+    pygame.event.pump()  # A janela continua respondendo durante a carga
+
+inicio_carga = perf_counter()
+tempos_carga = recursos.carregar_em_paralelo(
+    SPRITES_MOTOR, [grupo_inimigos(fases[1])], [FUNDO_MENU, fases[1].fundo], mostrar_progresso
+)
+if os.environ.get('HEROI_TEMPOS') == '1':
+    imprimir_tempos_carga(tempos_carga, (perf_counter() - inicio_carga) * 1000)
+
+# Arquivo do fundo da fase: o do menu na fase 0, o de sucesso depois da última
+def arquivo_fundo(fase_num):
+    if fase_num == 0:
+        return FUNDO_MENU
+    return fases[fase_num].fundo if fase_num in fases else FINAL_SUCCESS_ARQUIVO
+
+def fundo_da_fase(fase_num):
+    return recursos.fundo(arquivo_fundo(fase_num))
+
+# Pede a carga em segundo plano do fundo e dos inimigos da fase seguinte
+def precarregar_fase(fase_num):
+    recursos.precarregar_fundo(arquivo_fundo(fase_num))
+    motor.preparar_inimigos(fase_num)
+
+# Sons de tiro e impacto, com canais reservados; os que não carregarem são avisados no terminal
+sons = GerenciadorSons(recursos)
+
+# A simulação anda em passos fixos (PASSO_MS, definido no motor), independentes da taxa de quadros
+MAX_PASSOS_POR_QUADRO = 5  # Sob carga, no máximo 5 passos antes de desenhar de novo
+LIMITE_QUADRO_MS = 250     # Um quadro mais longo que isso (ex.: janela arrastada) não é recuperado
+
+# Limite de quadros desenhados por segundo (0 = sem limite).
+# Pode ser ajustado pela variável de ambiente HEROI_FPS.
+FPS = int(os.environ.get('HEROI_FPS', 60))
+clock = pygame.time.Clock()
 
-        # Posição inicial: completamente fora da tela na base
-        self.target_y = ALTURA - 20
-        self.rect = self.image.get_rect(bottomright=(LARGURA - 30, ALTURA + self.base_image.get_height()))
-        self.alpha = 0
-        self.velocidade_subida = 6
+# Durações das telas de transição; durante elas o jogo continua tratando eventos
+DURACAO_VINHETA_MS = 3000
+DURACAO_TELA_FINAL_MS = 5000  # Game over e tela de sucesso
+PAUSA_BANDEIRA_MS = 300       # O último quadro (gaúcho na bandeira) fica um instante na tela
 
-    def update(self):
-        # Subida vertical até a posição final
-        if self.rect.bottom > self.target_y:
-            self.rect.y -= self.velocidade_subida
+# Nas cenas paradas o jogo dorme até chegar um evento (ou o prazo da cena),
+# acordando no máximo a cada ESPERA_MAXIMA_MS
+ESPERA_MAXIMA_MS = 1000
 
-        # Fade-in
-        if self.alpha < 255:
-            self.alpha += 5
-            self.alpha = min(self.alpha, 255)
+# Eventos da janela que pedem para redesenhar a tela (janela descoberta, restaurada...)
+EVENTOS_EXPOSICAO = {
+    pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN, pygame.WINDOWRESTORED,
+    pygame.WINDOWMAXIMIZED, pygame.WINDOWSIZECHANGED
+}
 
-        self.image = self.base_image.copy()
-        self.image.set_alpha(self.alpha)
+# ================================
+# CONFIGURAÇÕES E VARIÁVEIS DO JOGO
+# ================================
 
-bandeira_group = pygame.sprite.Group()
-inicio_fase = 0
-bandeira_ativa = False
-primeira_bandeira_mostrada = False
+# Todo o estado do jogo (gaúcho, inimigos, chimarrões, bandeira, pontos e fase) fica no motor.
+# HEROI_ENTIDADES=numpy guarda inimigos e chimarrões em arrays NumPy em vez de sprites.
+# HEROI_SEMENTE fixa a semente dos inimigos (sem ela, cada partida tem uma sorteada).
+# HEROI_COLISAO: 'mascaras' (padrão, pixel a pixel) ou só retângulos ('faixas').
+semente = int(os.environ['HEROI_SEMENTE']) if os.environ.get('HEROI_SEMENTE') else None
+colisao = os.environ.get('HEROI_COLISAO', 'mascaras')
+if os.environ.get('HEROI_ENTIDADES') == 'numpy':
+    motor = MotorVetorial(recursos, semente=semente, colisao=colisao, fases=fases)
+else:
+    motor = Motor(recursos, semente=semente, colisao=colisao, fases=fases)
+
+# HEROI_GRAVAR=sessao.json grava a semente e as entradas de cada passo; ao
+# fechar o jogo, `python gravacao.py sessao.json` reproduz a sessão sem janela
+gravador = Gravador(motor) if os.environ.get('HEROI_GRAVAR') else None
+
+# Modo de renderização inicial ('completo' ou 'sujo'); F2 alterna durante o jogo.
+# HEROI_ESCALA (ex.: 0.5) desenha o jogo numa resolução menor e amplia para a janela; F5 alterna.
+renderizador = Renderizador(
+    TELA, os.environ.get('HEROI_RENDERIZACAO', 'completo'), float(os.environ.get('HEROI_ESCALA', 1.0))
+)
+
+# Desenho das telas (menu, vinheta, instruções, créditos) e do HUD
+telas = Telas(*fontes_telas)
+
+# Perfilador: F3 mostra/esconde o gráfico de tempos, F4 grava os últimos quadros.
+# HEROI_PERFILADOR=1 liga o perfilador desde o início.
+perfilador = Perfilador(fonte_perfilador)
+perfilador_ativo = False
+
+def alternar_perfilador():
+    global perfilador_ativo
+    perfilador_ativo = not perfilador_ativo
+    medidor = perfilador if perfilador_ativo else None
+    motor.medidor = medidor
+    renderizador.medidor = medidor
+    perfilador.inicio_quadro = None  # Só mede a partir do próximo quadro inteiro
+    renderizador.invalidar()  # Apaga o gráfico ao desligar, no modo 'sujo'
+
+# Grava o buffer do perfilador em JSON e no formato de trace do Chrome
+def exportar_perfil():
+    base = time.strftime('perfil-%Y%m%d-%H%M%S')
+    perfilador.exportar_json(base + '.json')
+    perfilador.exportar_chrome(base + '.trace.json')
+    print(f"Perfil gravado em {base}.json e {base}.trace.json")
+
+if os.environ.get('HEROI_PERFILADOR') == '1':
+    alternar_perfilador()
+
+# Governador de qualidade: com quadros acima do orçamento, tira sombras e
+# fade da bandeira e limita inimigos e chimarrões; com folga, devolve.
+# HEROI_QUALIDADE=auto (padrão) ou um nível fixo, de 0 a 3.
+modo_qualidade = os.environ.get('HEROI_QUALIDADE', 'auto')
+governador = Governador()
+governador_ativo = modo_qualidade == 'auto'
+
+def aplicar_qualidade(nivel):
+    telas.definir_sombras(nivel.sombras)
+    motor.definir_efeitos_alpha(nivel.efeitos_alpha)
+    if (motor.limite_inimigos, motor.limite_balas) != (nivel.limite_inimigos, nivel.limite_balas):
+        motor.limitar_entidades(nivel.limite_inimigos, nivel.limite_balas)  # Entra na gravação
+
+if not governador_ativo:
+    aplicar_qualidade(governador.definir(int(modo_qualidade)))
+marcos.marcar('recursos')
 
 # Menu principal atualizado com seleção
-menu_opcoes = ["Jogar", "Instruções", "Créditos", "Sair"]
+menu_opcoes = MENU_OPCOES
 indice_opcao = 0
 
-# Novas telas para instruções e créditos
-def mostrar_instrucoes():
-    TELA.blit(fundos[0], (0, 0))
-    instrucoes = [
-        "Setas para mover o Gaúcho", 
-        "Espaço para jogar chimarrão nos inimigos"
-    ]
-    base_y = 500  # mais abaixo
-
-    for i, linha in enumerate(instrucoes):
-        txt = fonte.render(linha, True, (255, 255, 255))
-        desenhar_texto_com_sombra(
-            linha, fonte, (255, 255, 255),
-            ((LARGURA - txt.get_width()) // 2, base_y + i * 60), TELA
-        )
-
-    voltar = fonte.render('"Esc" para Voltar', True, (255, 255, 255))
-    desenhar_texto_com_sombra(
-        '"Esc" para Voltar', fonte, (255, 255, 255),
-        ((LARGURA - voltar.get_width()) // 2, base_y + len(instrucoes) * 60 + 40), TELA
-    )
-
-    pygame.display.flip()
-    aguardar_voltar()
-
-
-def resetar_jogo():
-    global pontos, fase_atual, vinheta_mostrada
-    pontos = 0
-    jogador.vida = 5
-    fase_atual = 0
-    vinheta_mostrada = False
-    inimigos.empty()
-    balas.empty()
-    jogador.rect.center = (100, ALTURA // 2)
-    Inimigo.ultimas_y.clear()
-
-    # ⚠️ Redesenha fundo inicial e personagem para evitar "sombra visual"
-    TELA.blit(fundos[0], (0, 0))
-    jogador_group.draw(TELA)
-    desenhar_texto_com_sombra(f"Pontos: {pontos}  Vida: {jogador.vida}", fonte, (255, 255, 255), (20, 90), TELA)
-    pygame.display.flip()
-    pygame.time.wait(1000)
-
-
-def mostrar_creditos():
-    TELA.blit(fundos[0], (0, 0))
-
-    creditos = [
-        "Idealizado e desenvolvido pelo Engenheiro de Software",
-        "Francisco de Freitas Kemle, em junho de 2025."
-    ]
+rodando = True
+cenas = Cenas('menu')
 
-    for i, linha in enumerate(creditos):
-        txt = fonte.render(linha, True, (255, 255, 255))
-        desenhar_texto_com_sombra(linha, fonte, (255, 255, 255), ((LARGURA - txt.get_width()) // 2, 530 + i * 60), TELA)
-
-    voltar = fonte.render('"Esc" para Voltar', True, (255, 255, 255))
-    desenhar_texto_com_sombra('"Esc" para Voltar', fonte, (255, 255, 255), ((LARGURA - voltar.get_width()) // 2, 710), TELA)
-    pygame.display.flip()
-    aguardar_voltar()
-
-def aguardar_voltar():
-    global fase_atual
-    esperando = True
-    while esperando:
-        for evento in pygame.event.get():
-            if evento.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if evento.type == pygame.KEYDOWN and evento.key == pygame.K_ESCAPE:
-                fase_atual = 0
-                esperando = False
-
-class Bala(pygame.sprite.Sprite):
-    def __init__(self, x, y):
-        super().__init__()
-        self.image = BALA
-        self.rect = self.image.get_rect()
-        self.rect.center = (x, y)
-
-    def update(self):
-        self.rect.x += 10
-        if self.rect.left > LARGURA:
-            self.kill()
+acumulador = 0.0          # Tempo real ainda não simulado
+disparos_pendentes = 0    # Tiros pedidos desde o último passo de simulação
 
 # ================================
-# CONFIGURAÇÕES E VARIÁVEIS DO JOGO
+# CENAS
 # ================================
 
-jogador = Jogador()
-jogador_group = pygame.sprite.Group(jogador)
-inimigos = pygame.sprite.Group()
-balas = pygame.sprite.Group()
-
-fonte = pygame.font.SysFont("calibri", 40, bold=True)
-fonte_pequena = pygame.font.SysFont("calibri", 30, bold=True)
-
-TIMER_EVENT = pygame.USEREVENT + 1
-pygame.time.set_timer(TIMER_EVENT, 400)
-
-pontos = 0
-fase_atual = 0
-
-nomes_fase = {
-    1: "Fase Bagé",
-    2: "Fase Pelotas",
-    3: "Fase Rio Grande",
-    4: "Fase Aceguá",
-    5: "Fase Lajeado",
-    6: "Fase Gramado",
-    7: "Fase Quaraí",
-    8: "Fase Farroupilha",
-    9: "Fase Torres",
-    10: "Fase Bento Gonçalves",
-    11: "Fase Porto Alegre",
-    12: "Fase Santa Vitória do Palmar",
-    13: "Fase Piratini"
-}
-
-rodando = True
-
-rodando = True
-vinheta_mostrada = False
+def ir_para_menu():
+    global indice_opcao
+    motor.reiniciar()
+    indice_opcao = 0
+    cenas.trocar('menu')
+
+# Vinheta de transição entre fases; enquanto ela está na tela,
+# o fundo da fase seguinte é carregado em segundo plano
+def mostrar_vinheta():
+    cenas.trocar('vinheta', DURACAO_VINHETA_MS, comecar_jogo)
+    precarregar_fase(motor.fase_atual + 1)
+
+def comecar_jogo():
+    global acumulador, disparos_pendentes
+    acumulador = 0.0
+    disparos_pendentes = 0
+    cenas.trocar('jogo')
+
+# Game over ou tela de sucesso; depois volta ao menu
+def mostrar_tela_final(nome):
+    cenas.trocar(nome, DURACAO_TELA_FINAL_MS, ir_para_menu)
+    precarregar_fase(0)
+
+# Desenha as cenas paradas (tudo menos o jogo), uma vez ao entrar nelas
+def desenhar_cena():
+    nome = cenas.atual
+    tela = renderizador.tela  # Sempre LARGURA x ALTURA, qualquer que seja o tamanho da janela
+    if nome == 'menu':
+        telas.menu(tela, fundo_da_fase(0), indice_opcao)
+    elif nome == 'instrucoes':
+        telas.instrucoes(tela, fundo_da_fase(0))
+    elif nome == 'creditos':
+        telas.creditos(tela, fundo_da_fase(0))
+    elif nome == 'vinheta':
+        telas.vinheta(tela, fundo_da_fase(motor.fase_atual), motor.fase.nome if motor.fase else "", motor.jogador.vida)
+    elif nome == 'game_over':
+        tela.blit(recursos.fundo(GAME_OVER_ARQUIVO), (0, 0))
+    elif nome == 'sucesso':
+        tela.blit(recursos.fundo(FINAL_SUCCESS_ARQUIVO), (0, 0))
+    else:
+        return  # 'pausa': o último quadro do jogo continua na tela
+    renderizador.apresentar()
+
+def alternar_tela_cheia():
+    global tela_cheia
+    tela_cheia = not tela_cheia
+    renderizador.redimensionar(abrir_janela())
+    cenas.redesenhar = True
+
+# Espera, sem gastar CPU, pelo próximo evento ou pelo prazo da cena atual
+def esperar_eventos():
+    restante = cenas.restante_ms()
+    espera = ESPERA_MAXIMA_MS if restante is None else min(restante, ESPERA_MAXIMA_MS)
+    primeiro = pygame.event.poll() if espera <= 0 else pygame.event.wait(espera)  # wait(0) esperaria para sempre
+    if primeiro.type == pygame.NOEVENT:
+        return []
+    return [primeiro] + pygame.event.get()
+
+# Trata os eventos de um passo do motor (sons e cenas de transição)
+def tratar_eventos_motor(eventos):
+    for evento in eventos:
+        if evento == EVENTO_TIRO:
+            sons.pedir('tiro')
+        elif evento == EVENTO_ACERTO:
+            sons.pedir('impacto')
+        elif evento == EVENTO_FASE_CONCLUIDA:
+            cenas.trocar('pausa', PAUSA_BANDEIRA_MS, mostrar_vinheta)
+        elif evento == EVENTO_VITORIA:
+            cenas.trocar('pausa', PAUSA_BANDEIRA_MS, lambda: mostrar_tela_final('sucesso'))
+        elif evento == EVENTO_DANO:
+            if motor.jogador.vida in [5, 4, 3, 2, 1]:
+                mostrar_vinheta()
+        elif evento == EVENTO_GAME_OVER:
+            mostrar_tela_final('game_over')
+
+# O menu aparece antes de esperar o primeiro evento da janela
+desenhar_cena()
+cenas.redesenhar = False
+marcos.marcar('primeiro quadro')
+if os.environ.get('HEROI_TEMPOS') == '1':
+    marcos.imprimir()
 
 while rodando:
-    clock.tick(FPS)
+    if cenas.atual == 'jogo':
+        dt = clock.tick(FPS)
+        if governador_ativo:
+            nivel = governador.registrar(clock.get_rawtime())  # Quadro anterior, sem a espera do limite de FPS
+            if nivel is not None:
+                aplicar_qualidade(nivel)
+                print(f"Qualidade: {nivel.nome} (nível {governador.nivel} de {len(NIVEIS) - 1})")
+        if perfilador_ativo:
+            perfilador.iniciar_quadro()
+        inicio_eventos = perf_counter()
+        eventos_janela = pygame.event.get()
+    else:
+        # Menu, instruções, créditos, vinheta e telas finais só mudam com
+        # uma tecla, uma exposição da janela ou o fim do prazo
+        eventos_janela = esperar_eventos()
+        dt = clock.tick()
     keys = pygame.key.get_pressed()
 
-    if jogador.vida > 0:
-        tempo_atual = pygame.time.get_ticks() - inicio_fase
-        if not primeira_bandeira_mostrada and tempo_atual >= 24000 and fase_atual > 0:
-            inicio_fase = pygame.time.get_ticks()
-            bandeira_group.empty()
-            bandeira_group.add(Bandeira())
-            bandeira_ativa = True
-
-    bandeira = pygame.sprite.spritecollideany(jogador, bandeira_group)
-    if bandeira and jogador.rect.colliderect(bandeira.rect):
-        # Animação leve
-        for i in range(5):
-            TELA.blit(fundos[min(fase_atual, len(fundos)-1)], (0, 0))
-            jogador_group.draw(TELA)
-            bandeira_group.draw(TELA)
-            pygame.display.flip()
-            pygame.time.delay(60)
-
-        if fase_atual < 13:
-            fase_atual += 1
-            bandeira_group.empty()
-            vinheta_mostrada = False
-            bandeira_ativa = False
-            primeira_bandeira_mostrada = False
-            inicio_fase = pygame.time.get_ticks()
-        else:
-            fase_atual = 14
-
-            # Exibir sucesso final imediatamente
-            TELA.blit(FINAL_SUCCESS_IMG, (0, 0))
-            pygame.display.flip()
-            pygame.time.wait(5000)
-
-            pontos = 0
-            jogador.vida = 5
-            fase_atual = 0
-            vinheta_mostrada = False
-            inimigos.empty()
-            balas.empty()
-            jogador.rect.center = (100, ALTURA // 2)
-            indice_opcao = 0 
-            inicio_fase = pygame.time.get_ticks()
-        vinheta_mostrada = False
-        bandeira_ativa = False
-        primeira_bandeira_mostrada = False
-        inicio_fase = pygame.time.get_ticks()
-
-    for evento in pygame.event.get():
+    for evento in eventos_janela:
         if evento.type == pygame.QUIT:
             rodando = False
-        if evento.type == pygame.KEYDOWN:
-            if fase_atual == 0:
+        elif evento.type == pygame.VIDEORESIZE:
+            renderizador.redimensionar()
+            cenas.redesenhar = True
+        elif evento.type in EVENTOS_EXPOSICAO:
+            cenas.redesenhar = True
+            renderizador.invalidar()
+        elif evento.type == pygame.KEYDOWN:
+            if evento.key == pygame.K_F2:
+                print(f"Renderização: {renderizador.alternar_modo()}")
+            elif evento.key == pygame.K_F3:
+                alternar_perfilador()
+            elif evento.key == pygame.K_F4:
+                exportar_perfil()
+            elif evento.key == pygame.K_F5:
+                print(f"Resolução interna: {renderizador.alternar_escala():.0%}")
+                cenas.redesenhar = True
+            elif evento.key == pygame.K_F11:
+                alternar_tela_cheia()
+            elif cenas.atual == 'menu':
                 if evento.key == pygame.K_UP:
                     indice_opcao = (indice_opcao - 1) % len(menu_opcoes)
+                    cenas.redesenhar = True
                 elif evento.key == pygame.K_DOWN:
                     indice_opcao = (indice_opcao + 1) % len(menu_opcoes)
+                    cenas.redesenhar = True
                 elif evento.key == pygame.K_RETURN:
                     if menu_opcoes[indice_opcao] == "Jogar":
-                        fase_atual = 1      
-                        bandeira_ativa = False
-                        primeira_bandeira_mostrada = False
-                        vinheta_mostrada = False
-                        inicio_fase = pygame.time.get_ticks()
+                        motor.iniciar_fase(1)
+                        precarregar_fase(1)
+                        mostrar_vinheta()
                     elif menu_opcoes[indice_opcao] == "Instruções":
-                        mostrar_instrucoes()
+                        cenas.trocar('instrucoes')
                     elif menu_opcoes[indice_opcao] == "Créditos":
-                        mostrar_creditos()
+                        cenas.trocar('creditos')
                     elif menu_opcoes[indice_opcao] == "Sair":
                         rodando = False
-            else:
+            elif cenas.atual in ('instrucoes', 'creditos'):
+                if evento.key == pygame.K_ESCAPE:
+                    cenas.trocar('menu')
+            elif cenas.atual == 'jogo':
                 if evento.key == pygame.K_SPACE:
-                    nova_bala = Bala(jogador.rect.right, jogador.rect.centery)
-                    balas.add(nova_bala)
-                    if TIRO_SOM:
-                        TIRO_SOM.play()
-        if evento.type == TIMER_EVENT and fase_atual > 0:
-            inimigos.add(Inimigo())
-
-    if fase_atual == 0:
-        TELA.blit(fundos[0], (0, 0))
-        for i, opcao in enumerate(menu_opcoes):
-            if i == indice_opcao:
-                cor = (0, 100, 0)
-                sombra = (255, 255, 255)
-            else:
-                cor = (255, 255, 255)
-                sombra = (0, 0, 0)
-            texto = fonte.render(opcao, True, cor)
-            x = (LARGURA - texto.get_width()) // 2
-            y = 500 + i * 80
-            sombra_surface = fonte.render(opcao, True, sombra)
-            TELA.blit(sombra_surface, (x + 2, y + 2))
-            TELA.blit(texto, (x, y))
-        pygame.display.flip()
-        continue
+                    disparos_pendentes += 1
 
-    # Exibir vinheta uma vez ao mudar de fase
-    if not vinheta_mostrada:
-        inimigos.empty()
-        balas.empty()
-        jogador.rect.center = (100, ALTURA // 2)
-        Inimigo.ultimas_y.clear()
-
-        mostrar_vinheta(fase_atual, jogador.vida)
-        vinheta_mostrada = True
-        continue  # Garante que não atualize nada nesse frame ainda
-
-
-    # Atualizações do jogo
-    jogador.update(keys)
-    inimigos.update()
-    balas.update()
-
-    TELA.blit(fundos[min(fase_atual, len(fundos)-1)], (0, 0))
-    jogador_group.draw(TELA)
-    inimigos.draw(TELA)
-    balas.draw(TELA)
-    bandeira_group.draw(TELA)
-    bandeira_group.update()
-
-    for bala in pygame.sprite.groupcollide(balas, inimigos, True, True):
-        pontos += 1
-        if IMPACTO_SOM:
-            IMPACTO_SOM.play()
-        if pontos >= 100:
-            jogador.vida += 1
-            pontos = 0
-
-    if pygame.sprite.spritecollideany(jogador, inimigos):
-        jogador.vida -= 1
-        bandeira_group.empty()
-        inimigos.empty()
-        balas.empty()
-        jogador.rect.center = (100, ALTURA // 2) 
-        inicio_fase = pygame.time.get_ticks()
-        primeira_bandeira_mostrada = False
-
-        Inimigo.ultimas_y.clear()
-
-        if jogador.vida in [5, 4, 3, 2, 1]:
-            mostrar_vinheta(fase_atual, jogador.vida)
-
-    # HUD
-    desenhar_texto_com_sombra(f"Pontos: {pontos}  Vida: {jogador.vida}", fonte_pequena, (255, 255, 255), (20, 90), TELA)
-
-
-    if fase_atual <= 13:
-        nome = nomes_fase.get(fase_atual, "")
-        x_f = (LARGURA - fonte.size(nome)[0]) // 2
-        desenhar_texto_com_sombra(nome, fonte, (255, 255, 255), (x_f, 90), TELA)
-
-    pygame.display.flip()
+    # Cenas com prazo (vinheta, pausa, telas finais) passam para a seguinte
+    cenas.atualizar()
 
-    # Game over
-    if jogador.vida <= 0:
-        TELA.blit(GAME_OVER_IMG, (0, 0))
-        pygame.display.flip()
-        pygame.time.wait(5000)
-        pontos = 0
-        jogador.vida = 5
-        fase_atual = 0
-        inicio_fase = pygame.time.get_ticks()
-        vinheta_mostrada = False
-        inimigos.empty()
-        balas.empty()
-        jogador.rect.center = (100, ALTURA // 2)
-        indice_opcao = 0 
-        bandeira_group.empty()
+    if cenas.atual != 'jogo':
+        if cenas.redesenhar:
+            cenas.redesenhar = False
+            desenhar_cena()
         continue
 
-    # Fim de jogo com sucesso
-    if fase_atual == 14:
-        TELA.blit(FINAL_SUCCESS_IMG, (0, 0))
-        pygame.display.flip()
-        pygame.time.wait(5000)
-        pontos = 0
-        jogador.vida = 5
-        fase_atual = 0
-        inicio_fase = pygame.time.get_ticks()
-        vinheta_mostrada = False
-        inimigos.empty()
-        balas.empty()
-        jogador.rect.center = (100, ALTURA // 2)
-        indice_opcao = 0 
-        bandeira_group.empty()
-        continue
+    if perfilador_ativo and perfilador.inicio_quadro is not None:
+        perfilador.registrar('eventos', perf_counter() - inicio_eventos, inicio_eventos)
+
+    # Passos fixos de simulação com o tempo real acumulado
+    acumulador += dt if dt <= LIMITE_QUADRO_MS else PASSO_MS
+    passos = 0
+    while acumulador >= PASSO_MS and passos < MAX_PASSOS_POR_QUADRO and cenas.atual == 'jogo':
+        acumulador -= PASSO_MS
+        passos += 1
+        eventos = motor.passo(entradas_do_teclado(keys, disparos_pendentes))
+        disparos_pendentes = 0
+        tratar_eventos_motor(eventos)
+    if passos == MAX_PASSOS_POR_QUADRO:
+        acumulador = min(acumulador, PASSO_MS)  # Descarta o atraso que não dá para recuperar
+    sons.tocar_pendentes()  # Os sons de todos os passos do quadro, juntados
+
+    if cenas.atual == 'jogo':
+        # HUD e nome da fase, desenhados por cima dos sprites
+        nome = motor.fase.nome if motor.fase else None
+        qualidade = governador.atual.nome if governador.nivel > 0 else None
+        sobreposicoes = telas.sobreposicoes_jogo(motor.pontos, motor.jogador.vida, nome, qualidade)
+        if perfilador_ativo:
+            # O gráfico é redesenhado na mesma superfície a cada quadro
+            sobreposicoes.append((perfilador.sobreposicao(), (20, ALTURA - 130), True))
+
+        renderizador.desenhar_quadro(
+            fundo_da_fase(motor.fase_atual), motor.grupos_desenho, sobreposicoes, acumulador / PASSO_MS
+        )
+
+    if perfilador_ativo and perfilador.inicio_quadro is not None:
+        perfilador.fechar_quadro(
+            inimigos=len(motor.inimigos), balas=len(motor.balas), fps=round(clock.get_fps(), 1), qualidade=governador.nivel
+        )
+
+if gravador is not None:
+    gravador.salvar(os.environ['HEROI_GRAVAR'])
+    print(f"Sessão gravada em {os.environ['HEROI_GRAVAR']} (semente {motor.semente})")
 
+renderizador.encerrar()
+recursos.encerrar()
 pygame.quit()
 sys.exit()
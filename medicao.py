@@ -0,0 +1,59 @@
+# ================================
+# Medição de tempo por etapa do quadro (Herói dos Pampas)
+# O motor e o renderizador registram quanto tempo gastaram em cada
+# etapa (update, colisão, desenho, flip...) num Medidor, quando há um.
+# Partes de uma etapa usam nomes com ponto: 'update.inimigos' faz parte de 'update'.
+# Ao fim de cada quadro, fechar_quadro() guarda o registro do quadro.
+# ================================
+
+from contextlib import contextmanager
+from time import perf_counter
+
+
+class Medidor:
+    def __init__(self):
+        self.quadro = {}    # etapa -> segundos, no quadro atual
+        self.quadros = []   # Registros dos quadros já fechados
+
+    # inicio: perf_counter() do começo da etapa (usado só por quem guarda a linha do tempo)
+    def registrar(self, etapa, segundos, inicio=None):
+        self.quadro[etapa] = self.quadro.get(etapa, 0.0) + segundos
+
+    @contextmanager
+    def etapa(self, nome):
+        inicio = perf_counter()
+        try:
+            yield
+        finally:
+            self.registrar(nome, perf_counter() - inicio, inicio)
+
+    # Fecha o quadro atual; `total` é a duração do quadro inteiro, em segundos.
+    # Informações extras (ex.: contagem de entidades) vão junto no registro.
+    def fechar_quadro(self, total, **extras):
+        registro = {'total': total, 'etapas': self.quadro}
+        registro.update(extras)
+        self.quadros.append(registro)
+        self.quadro = {}
+        return registro
+
+
+# Percentil pelo método do posto mais próximo (valores já ordenados)
+def percentil(ordenados, p):
+    if not ordenados:
+        return 0.0
+    posto = max(1, -(-len(ordenados) * p // 100))
+    return ordenados[int(posto) - 1]
+
+
+# Resumo estatístico de uma lista de durações em segundos, em milissegundos
+def resumir_ms(valores):
+    ordenados = sorted(valores)
+    if not ordenados:
+        return {'media': 0.0, 'p50': 0.0, 'p90': 0.0, 'p99': 0.0, 'max': 0.0}
+    return {
+        'media': round(sum(ordenados) / len(ordenados) * 1000, 4),
+        'p50': round(percentil(ordenados, 50) * 1000, 4),
+        'p90': round(percentil(ordenados, 90) * 1000, 4),
+        'p99': round(percentil(ordenados, 99) * 1000, 4),
+        'max': round(ordenados[-1] * 1000, 4),
+    }
@@ -0,0 +1,531 @@
+# ================================
+# Núcleo de simulação do Herói dos Pampas
+# O Motor guarda todo o estado do mundo (jogador, inimigos, chimarrões,
+# bandeira, pontos, fase e relógios) e avança um passo fixo de 1/60 s a
+# cada chamada de passo(entradas). Ele não desenha nada nem toca sons:
+# devolve uma lista de eventos para quem estiver apresentando o jogo.
+# Assim a lógica roda também sem janela (driver "dummy" do SDL), em
+# testes, bots e análises em lote.
+# ================================
+
+import os      # Para configurar o SDL sem janela
+import random  # Cada motor tem o próprio gerador, com semente opcional
+from collections import namedtuple
+from functools import lru_cache
+from time import perf_counter
+
+import pygame
+
+from animacao import Animacao, combinar_trilhas, valores_tween  # Tabelas de quadros
+from colisao import criar_colisao  # Chimarrões x inimigos e gaúcho x inimigos
+from configuracoes import (
+    ALTURA, CAMINHO_ASSETS, ESCALA_BANDEIRA, ESCALA_PERSONAGENS, LARGURA, TAMANHO_BALA, nomes_inimigos
+)
+from fases import carregar_fases  # Nome, inimigos e ritmo de cada fase (fases.json)
+from ondas import AgendadorOndas, IndiceFaixas, Onda  # Quando e onde surgem os inimigos
+from pacote import PacoteRecursos
+from pool import PoolObjetos  # Chimarrões e inimigos mortos são reaproveitados
+from recursos import GerenciadorRecursos
+from renderizacao import GrupoInterpolado  # Guarda a posição anterior de cada sprite
+
+# A simulação anda em passos fixos de 1/60 s, independentes da taxa de quadros.
+# Todas as velocidades do jogo (5 px do gaúcho, 10 px do chimarrão...) são por passo.
+TAXA_SIMULACAO = 60
+PASSO_MS = 1000 / TAXA_SIMULACAO
+
+VIDAS_INICIAIS = 5
+PONTOS_VIDA_EXTRA = 100      # A cada 100 inimigos derrotados, uma vida a mais
+CAPACIDADE_POOL = 512        # Máximo de chimarrões (e de inimigos) livres guardados para reuso
+
+# Eventos devolvidos por Motor.passo()
+EVENTO_TIRO = 'tiro'                      # Um chimarrão foi lançado
+EVENTO_ACERTO = 'acerto'                  # Um chimarrão acertou um inimigo
+EVENTO_VIDA_EXTRA = 'vida_extra'
+EVENTO_DANO = 'dano'                      # O gaúcho foi atingido (a fase recomeça)
+EVENTO_GAME_OVER = 'game_over'
+EVENTO_FASE_CONCLUIDA = 'fase_concluida'  # O gaúcho alcançou a bandeira
+EVENTO_VITORIA = 'vitoria'                # Bandeira da última fase alcançada
+
+# Entradas de um passo: direções seguradas e quantos tiros foram pedidos
+Entradas = namedtuple('Entradas', 'cima baixo esquerda direita disparos', defaults=(False, False, False, False, 0))
+SEM_ENTRADAS = Entradas()
+
+
+# Converte o estado do teclado do pygame em Entradas
+def entradas_do_teclado(keys, disparos=0):
+    return Entradas(keys[pygame.K_UP], keys[pygame.K_DOWN], keys[pygame.K_LEFT], keys[pygame.K_RIGHT], disparos)
+
+
+# ================================
+# CLASSES PRINCIPAIS DO JOGO
+# ================================
+
+# Classe que representa o jogador (Gaúcho)
+class Jogador(pygame.sprite.Sprite):
+    def __init__(self, imagem):
+        super().__init__()
+        self.image = imagem
+        self.rect = self.image.get_rect()
+        self.rect.center = (100, ALTURA // 2)
+        self.vida = VIDAS_INICIAIS
+
+    def update(self, entradas):
+        if entradas.cima and self.rect.top > 50:
+            self.rect.y -= 5
+        if entradas.baixo and self.rect.bottom < ALTURA - 50:
+            self.rect.y += 5
+        if entradas.esquerda and self.rect.left > 0:
+            self.rect.x -= 5
+        if entradas.direita and self.rect.right < LARGURA:
+            self.rect.x += 5
+
+
+# Base dos sprites reaproveitados por um PoolObjetos: ao sair de todos os
+# grupos (kill), o sprite volta para o pool de onde veio
+class SpriteReciclavel(pygame.sprite.Sprite):
+    # O Sprite do pygame não usa __slots__, então ainda há um __dict__ (com
+    # os grupos do sprite); os atributos do jogo ficam nos slots
+    __slots__ = ('image', 'rect', 'pool')
+
+    def __init__(self, *args):
+        super().__init__()
+        self.pool = None
+        self.rect = pygame.Rect(0, 0, 0, 0)  # Reaproveitado junto com o sprite
+        self.iniciar(*args)
+
+    def kill(self):
+        if self.alive():
+            super().kill()
+            if self.pool is not None:
+                self.pool.devolver(self)
+
+
+class Inimigo(SpriteReciclavel):
+    __slots__ = ('velocidade',)
+
+    def iniciar(self, imagem, y, velocidade):
+        self.image = imagem
+        self.rect.update(LARGURA, y, *imagem.get_size())
+        self.velocidade = velocidade
+
+    def update(self):
+        self.rect.x -= self.velocidade
+
+        if self.rect.right < 0:
+            self.kill()
+
+
+class Bala(SpriteReciclavel):
+    __slots__ = ()
+
+    def iniciar(self, imagem, x, y):
+        self.image = imagem
+        self.rect.update(0, 0, *imagem.get_size())
+        self.rect.center = (x, y)
+
+    def update(self):
+        self.rect.x += 10
+        if self.rect.left > LARGURA:
+            self.kill()
+
+
+# Tabela da animação da bandeira: a cada quadro sobe 6 px até a posição
+# final e o alpha aumenta 5 até ficar opaca. Calculada uma vez só.
+@lru_cache(maxsize=None)
+def tabela_bandeira(base_inicial, base_final):
+    return combinar_trilhas(valores_tween(0, 255, 5), valores_tween(base_inicial, base_final, 6))
+
+
+class Bandeira(pygame.sprite.Sprite):
+    imagens_animadas = {}  # Cópia de cada sprite usada só pela bandeira, com alpha por blit
+
+    # fade: False faz a bandeira aparecer já opaca (só sobe), sem o efeito de alpha
+    def __init__(self, imagem, fade=True):
+        super().__init__()
+        # A cópia é feita uma vez por processo; o fade usa o alpha da própria
+        # superfície em vez de copiar a imagem a cada quadro
+        if imagem not in Bandeira.imagens_animadas:
+            Bandeira.imagens_animadas[imagem] = imagem.copy()
+        self.image = Bandeira.imagens_animadas[imagem]
+        self.fade = fade
+        self.image.set_alpha(0 if fade else None)
+
+        # Posição inicial: completamente fora da tela na base
+        self.target_y = ALTURA - 20
+        self.rect = self.image.get_rect(bottomright=(LARGURA - 30, ALTURA + self.image.get_height()))
+        self.animacao = Animacao(tabela_bandeira(self.rect.bottom, self.target_y))
+
+    def update(self):
+        # Subida vertical e fade-in; depois do último quadro não há mais trabalho
+        if self.animacao.concluida:
+            return
+        alpha, base = self.animacao.avancar()
+        self.rect.bottom = base
+        # Totalmente opaca volta ao caminho de blit só com alpha por pixel
+        if self.fade:
+            self.image.set_alpha(alpha if alpha < 255 else None)
+
+    def desligar_fade(self):
+        self.fade = False
+        self.image.set_alpha(None)
+
+
+# ================================
+# MOTOR DO JOGO
+# ================================
+
+# Sprites (arquivo, escala, tamanho) usados pelo Motor: os mesmos pedidos de
+# Motor.__init__, para a carga antecipada em paralelo
+# (GerenciadorRecursos.carregar_em_paralelo)
+SPRITES_MOTOR = [
+    ('gaucho.png', ESCALA_PERSONAGENS, None),
+    ('bala.png', None, TAMANHO_BALA),
+    ('bandeira.png', ESCALA_BANDEIRA, None),
+]
+
+
+# Grupo de sprites (nome, arquivos, escala, tamanho, escolhidos) com os
+# inimigos de uma fase, o mesmo pedido de Motor._carregar_inimigos
+def grupo_inimigos(fase):
+    return ('inimigos', nomes_inimigos, ESCALA_PERSONAGENS, None, fase.inimigos)
+
+
+class Motor:
+    # recursos: GerenciadorRecursos de onde vêm os sprites
+    # semente: semente do gerador aleatório (None = sorteia uma, guardada em self.semente)
+    # interpolar: guarda as posições anteriores para o desenho interpolado
+    #   (desnecessário quando ninguém desenha, como nas execuções sem janela)
+    # colisao: motor de colisão ('faixas', 'pygame' ou 'mascaras', ver colisao.py)
+    # fases: fases já compiladas (ver fases.py); None = as de fases.json
+    def __init__(self, recursos, semente=None, interpolar=True, colisao='faixas', fases=None):
+        # Mesmo sem semente dada, a partida tem uma conhecida, para poder ser gravada
+        self.semente = random.SystemRandom().randrange(2 ** 32) if semente is None else semente
+        self.rng = random.Random(self.semente)
+        self.interpolar = interpolar
+        self.nome_colisao = colisao
+        self.colisao = criar_colisao(colisao)
+        self.medidor = None   # Medidor opcional dos tempos de update e colisão
+        self.gravador = None  # Gravador opcional das entradas da partida (ver gravacao.py)
+
+        self.recursos = recursos
+        self.fases = fases or carregar_fases()
+
+        # Parâmetros de jogo (podem ser ajustados por benchmarks e bots). Os
+        # três primeiros valem para todas as fases; None = o valor de cada fase
+        # no manifesto. Mudanças valem a partir do próximo início de fase.
+        self.intervalo_inimigos_ms = None
+        self.velocidade_inimigos = None  # (mínima, máxima) em px por passo
+        self.atraso_bandeira_ms = None
+        self.ondas_por_fase = {}  # fase -> lista de Onda; as demais fases usam as do manifesto
+        self.pontos_vida_extra = PONTOS_VIDA_EXTRA
+        self.invulneravel = False  # Se True, encostar num inimigo não custa vida
+
+        # Qualidade (ajustada pelo governador de qualidade, ver governador.py).
+        # Os limites de entidades mudam a partida e por isso são gravados;
+        # o fade da bandeira é só visual.
+        self.efeitos_alpha = True
+        self.limite_inimigos = None  # None = sem limite de inimigos vivos
+        self.limite_balas = None     # None = sem limite de chimarrões no ar
+
+        self.imagem_gaucho = recursos.sprite('gaucho.png', escala=ESCALA_PERSONAGENS)
+        self.imagens_inimigos = []  # Só os inimigos da fase atual (ver _carregar_inimigos)
+        self.arquivos_inimigos = ()
+        self._inimigos_preparados = None  # (arquivos, Future) de preparar_inimigos
+        self.imagem_bala = recursos.sprite('bala.png', tamanho=TAMANHO_BALA)
+        self.imagem_bandeira = recursos.sprite('bandeira.png', escala=ESCALA_BANDEIRA)
+
+        self.jogador = Jogador(self.imagem_gaucho)
+        self.jogador_group = GrupoInterpolado(self.jogador, nome='jogador')
+        self.inimigos = GrupoInterpolado(nome='inimigos')
+        self.balas = GrupoInterpolado(nome='balas')
+        self.bandeira_group = GrupoInterpolado(nome='bandeira')
+        self.pool_inimigos = PoolObjetos(Inimigo, CAPACIDADE_POOL)
+        self.pool_balas = PoolObjetos(Bala, CAPACIDADE_POOL)
+
+        # Grupos na ordem em que são desenhados
+        self.grupos_desenho = (self.jogador_group, self.inimigos, self.balas, self.bandeira_group)
+
+        self.faixas = IndiceFaixas()  # Faixas verticais dos últimos inimigos, para não sobrepô-los
+        self.tempo_simulado = 0       # Milissegundos de jogo simulados
+        self.passos = 0
+        self.reiniciar()
+
+    # Volta ao estado inicial (menu): pontos zerados, vidas cheias, fase 0
+    def reiniciar(self):
+        if self.gravador is not None:
+            self.gravador.reiniciar()
+        self.pontos = 0
+        self.jogador.vida = VIDAS_INICIAIS
+        self.fase_atual = 0
+        self._limpar_fase()
+
+    @property
+    def ultima_fase(self):
+        return len(self.fases)
+
+    # Dados da fase atual no manifesto (None no menu e depois da última fase)
+    @property
+    def fase(self):
+        return self.fases.get(self.fase_atual)
+
+    # Em jogo: numa fase, com vida
+    @property
+    def ativo(self):
+        return 0 < self.fase_atual <= self.ultima_fase and self.jogador.vida > 0
+
+    # Começa (ou recomeça) uma fase do zero: sem inimigos, chimarrões nem bandeira
+    def iniciar_fase(self, fase):
+        if self.gravador is not None:
+            self.gravador.iniciar_fase(fase)
+        self._entrar_na_fase(fase)
+
+    # Os inimigos da fase são carregados aqui, antes do primeiro passo dela;
+    # recomeçar a mesma fase (dano, menu) não carrega nada de novo
+    def _entrar_na_fase(self, fase):
+        self.fase_atual = fase
+        self._limpar_fase()
+        if self.fase is not None and self.fase.inimigos != self.arquivos_inimigos:
+            self._carregar_inimigos(self.fase)
+
+    # Começa a carregar em segundo plano os sprites dos inimigos de uma fase
+    # (no jogo, a próxima, durante a vinheta), para que entrar nela só troque
+    # as referências em vez de decodificar imagens no meio de um passo
+    def preparar_inimigos(self, fase):
+        dados = self.fases.get(fase)
+        if dados is None or dados.inimigos == self.arquivos_inimigos:
+            return
+        if self._inimigos_preparados is None or self._inimigos_preparados[0] != dados.inimigos:
+            self._inimigos_preparados = (dados.inimigos, self.recursos.precarregar_grupo(*grupo_inimigos(dados)))
+
+    # Troca os sprites de inimigos pelos da fase (os preparados, se forem os
+    # dela; senão são carregados aqui). Os da fase anterior que ela não usa
+    # são descartados do gerenciador de recursos e do pool.
+    def _carregar_inimigos(self, fase):
+        descartados = set(self.arquivos_inimigos)
+        preparados, self._inimigos_preparados = self._inimigos_preparados, None
+        if preparados is not None and preparados[0] == fase.inimigos:
+            self.imagens_inimigos = preparados[1].result()  # Em geral já pronto
+        else:
+            if preparados is not None:
+                descartados.update(preparados[0])  # Preparados para uma fase que não veio
+            self.imagens_inimigos = self.recursos.sprites_do_grupo(
+                'inimigos', nomes_inimigos, fase.inimigos, escala=ESCALA_PERSONAGENS
+            )
+        descartados -= set(fase.inimigos)
+        self.arquivos_inimigos = fase.inimigos
+        if descartados:
+            # Os inimigos livres do pool ainda seguram os sprites descartados
+            self.pool_inimigos.esvaziar()
+            self.recursos.descartar_sprites(descartados, escala=ESCALA_PERSONAGENS)
+
+    def _limpar_fase(self):
+        self._esvaziar_entidades()
+        self.bandeira_group.empty()
+        self.faixas.limpar()
+        self.jogador.rect.center = (100, ALTURA // 2)
+        self._reiniciar_relogios()
+        if self.interpolar:
+            self.guardar_posicoes()
+
+    # Relógios da fase (bandeira e surgimento de inimigos)
+    def _reiniciar_relogios(self):
+        self.inicio_fase = self.tempo_simulado
+        self.passo_inicio_fase = self.passos
+        self.agendador = AgendadorOndas(self.ondas_da_fase(self.fase_atual))
+        self.atraso_bandeira_fase = self._parametro_da_fase('atraso_bandeira_ms')
+        self.velocidade_inimigos_fase = self._parametro_da_fase('velocidade_inimigos')
+
+    # Parâmetro ajustado no motor ou, sem ajuste, o da fase atual
+    def _parametro_da_fase(self, nome):
+        valor = getattr(self, nome)
+        if valor is None and self.fase is not None:
+            valor = getattr(self.fase, nome)
+        return valor
+
+    # Ondas da fase: as de ondas_por_fase, as do intervalo ajustado no motor,
+    # as do manifesto ou, por fim, um inimigo a cada intervalo da fase
+    def ondas_da_fase(self, fase):
+        if fase in self.ondas_por_fase:
+            return self.ondas_por_fase[fase]
+        dados = self.fases.get(fase)
+        if self.intervalo_inimigos_ms is not None:
+            return [Onda(0, self.intervalo_inimigos_ms)]
+        if dados is None:
+            return []  # Menu e tela final: não há inimigos
+        return dados.ondas or [Onda(0, dados.intervalo_inimigos_ms)]
+
+    # Liga/desliga o fade da bandeira, inclusive o da bandeira já na tela
+    def definir_efeitos_alpha(self, ligados):
+        self.efeitos_alpha = ligados
+        if not ligados:
+            for bandeira in self.bandeira_group:
+                bandeira.desligar_fade()
+
+    # Limita inimigos vivos e chimarrões no ar (None = sem limite): acima do
+    # limite, inimigos deixam de surgir e tiros não saem
+    def limitar_entidades(self, inimigos, balas):
+        if self.gravador is not None:
+            self.gravador.limitar_entidades(inimigos, balas)
+        self.limite_inimigos = inimigos
+        self.limite_balas = balas
+
+    def guardar_posicoes(self):
+        for grupo in self.grupos_desenho:
+            grupo.guardar_posicoes()
+
+    # Escolhe a altura do novo inimigo entre as faixas livres dos últimos 10
+    def _altura_inimigo(self, altura_sprite):
+        y = self.faixas.sortear(self.rng, 50, ALTURA - altura_sprite - 50, altura_sprite)
+        self.faixas.ocupar(y, altura_sprite)
+        return y
+
+    # Sorteia sprite, velocidade e altura de um novo inimigo (nessa ordem,
+    # para a mesma semente gerar a mesma partida)
+    def _sortear_inimigo(self):
+        indice = self.rng.randrange(len(self.imagens_inimigos))
+        velocidade = self.rng.randint(*self.velocidade_inimigos_fase)
+        y = self._altura_inimigo(self.imagens_inimigos[indice].get_height())
+        return indice, y, velocidade
+
+    # ================================
+    # Entidades (inimigos e chimarrões)
+    # Os métodos abaixo são os únicos que sabem como as entidades são
+    # guardadas; o MotorVetorial (entidades.py) os troca por arrays NumPy.
+    # ================================
+
+    def _gerar_inimigo(self):
+        indice, y, velocidade = self._sortear_inimigo()
+        self.inimigos.add(self.pool_inimigos.obter(self.imagens_inimigos[indice], y, velocidade))
+
+    def _lancar_bala(self, x, y):
+        self.balas.add(self.pool_balas.obter(self.imagem_bala, x, y))
+
+    # Recomeço de fase: todos voltam para os pools
+    def _esvaziar_entidades(self):
+        for grupo in (self.inimigos, self.balas):
+            for sprite in grupo.sprites():
+                sprite.kill()
+
+    def estatisticas_pools(self):
+        return {'inimigos': self.pool_inimigos.estatisticas(), 'balas': self.pool_balas.estatisticas()}
+
+    def _mover_inimigos(self):
+        self.inimigos.update()
+
+    def _mover_balas(self):
+        self.balas.update()
+
+    # Remove os chimarrões e os inimigos que se encostaram; devolve quantos chimarrões acertaram
+    def _colidir_balas(self):
+        self.colisao.indexar(self.inimigos)
+        return len(self.colisao.balas(self.balas))
+
+    def _colidir_jogador(self):
+        return self.colisao.jogador(self.jogador) is not None
+
+    # Retângulos dos inimigos vivos (usados pelos bots)
+    def retangulos_inimigos(self):
+        return [inimigo.rect for inimigo in self.inimigos]
+
+    # Avança um passo fixo de simulação e devolve a lista de eventos do passo
+    def passo(self, entradas=SEM_ENTRADAS):
+        if not self.ativo:
+            return []
+
+        if self.gravador is not None:
+            self.gravador.passo(entradas)
+        eventos = []
+        if self.interpolar:
+            self.guardar_posicoes()
+        # O tempo vem do número de passos, sem somar PASSO_MS (que não é exato)
+        self.passos += 1
+        self.tempo_simulado = self.passos * 1000 / TAXA_SIMULACAO
+        jogador = self.jogador
+
+        # A bandeira aparece depois de um tempo na fase (e de novo a cada intervalo)
+        if self.tempo_simulado - self.inicio_fase >= self.atraso_bandeira_fase:
+            self.inicio_fase = self.tempo_simulado
+            self.bandeira_group.empty()
+            self.bandeira_group.add(Bandeira(self.imagem_bandeira, self.efeitos_alpha))
+
+        if pygame.sprite.spritecollideany(jogador, self.bandeira_group):
+            if self.fase_atual < self.ultima_fase:
+                self._entrar_na_fase(self.fase_atual + 1)  # Sem iniciar_fase(), que o gravador registraria como entrada
+                eventos.append(EVENTO_FASE_CONCLUIDA)
+            else:
+                self.fase_atual = self.ultima_fase + 1  # Tela final de sucesso
+                eventos.append(EVENTO_VITORIA)
+            return eventos
+
+        # Tiros pedidos desde o último passo
+        for _ in range(entradas.disparos):
+            if self.limite_balas is not None and len(self.balas) >= self.limite_balas:
+                break
+            self._lancar_bala(jogador.rect.right, jogador.rect.centery)
+            eventos.append(EVENTO_TIRO)
+
+        # Surgimento de inimigos, conforme as ondas da fase
+        tempo_fase = (self.passos - self.passo_inicio_fase) * 1000 / TAXA_SIMULACAO
+        for _ in range(self.agendador.vencidos(tempo_fase)):
+            if self.limite_inimigos is None or len(self.inimigos) < self.limite_inimigos:
+                self._gerar_inimigo()
+
+        # Atualizações do jogo e colisões. Com um medidor, cada parte é
+        # cronometrada ('update.jogador', 'update.inimigos'...) e também o
+        # total de cada etapa ('update', 'colisao').
+        medidor = self.medidor
+        if medidor is None:
+            jogador.update(entradas)
+            self.bandeira_group.update()
+            self._mover_inimigos()
+            self._mover_balas()
+            acertos = self._colidir_balas()
+            atingido = self._colidir_jogador()
+        else:
+            t0 = perf_counter()
+            jogador.update(entradas)
+            self.bandeira_group.update()
+            t1 = perf_counter()
+            self._mover_inimigos()
+            t2 = perf_counter()
+            self._mover_balas()
+            t3 = perf_counter()
+            acertos = self._colidir_balas()
+            t4 = perf_counter()
+            atingido = self._colidir_jogador()
+            t5 = perf_counter()
+            medidor.registrar('update', t3 - t0, t0)
+            medidor.registrar('update.jogador', t1 - t0, t0)
+            medidor.registrar('update.inimigos', t2 - t1, t1)
+            medidor.registrar('update.balas', t3 - t2, t2)
+            medidor.registrar('colisao', t5 - t3, t3)
+            medidor.registrar('colisao.balas', t4 - t3, t3)
+            medidor.registrar('colisao.jogador', t5 - t4, t4)
+
+        for _ in range(acertos):
+            self.pontos += 1
+            eventos.append(EVENTO_ACERTO)
+            if self.pontos >= self.pontos_vida_extra:
+                jogador.vida += 1
+                self.pontos = 0
+                eventos.append(EVENTO_VIDA_EXTRA)
+
+        if atingido and not self.invulneravel:
+            jogador.vida -= 1
+            self._limpar_fase()
+            eventos.append(EVENTO_DANO)
+            if jogador.vida <= 0:
+                eventos.append(EVENTO_GAME_OVER)
+
+        return eventos
+
+
+# Prepara o pygame para rodar sem janela (driver "dummy" do SDL) e cria um
+# motor com os sprites carregados do pacote de recursos, se ele existir
+# (classe: Motor ou uma subclasse, como o MotorVetorial)
+def criar_motor_sem_janela(semente=None, classe=None, **opcoes):
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.display.init()
+    recursos = GerenciadorRecursos(CAMINHO_ASSETS, (LARGURA, ALTURA), 0, PacoteRecursos.abrir())
+    return (classe or Motor)(recursos, semente=semente, interpolar=False, **opcoes)
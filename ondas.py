@@ -0,0 +1,94 @@
+# ================================
+# Surgimento de inimigos do Herói dos Pampas
+#  - AgendadorOndas: quando surgem os inimigos de uma fase. Cada fase tem
+#    uma lista de ondas (início, intervalo e duração, em ms de simulação).
+#    O número de inimigos devidos é calculado a partir do passo atual da
+#    fase, e não somando intervalos, então não há deriva de ponto
+#    flutuante; e, como o relógio é o da simulação, pausas da janela
+#    (vinheta, janela arrastada) não geram rajadas de inimigos.
+#  - IndiceFaixas: em que altura surge cada inimigo. Guarda as faixas
+#    verticais ocupadas pelos últimos inimigos e sorteia uma altura entre
+#    as livres, sem tentativas repetidas.
+# ================================
+
+from bisect import bisect_right
+from collections import deque, namedtuple
+
+# inicio_ms: quando a onda começa, contado do início da fase
+# intervalo_ms: tempo entre dois inimigos da onda (o primeiro surge em inicio_ms + intervalo_ms)
+# duracao_ms: quanto tempo a onda dura (None = até o fim da fase)
+Onda = namedtuple('Onda', 'inicio_ms intervalo_ms duracao_ms', defaults=(None,))
+
+
+class AgendadorOndas:
+    def __init__(self, ondas):
+        self.ondas = tuple(ondas)
+        self.gerados = 0
+
+    # Total de inimigos que já deveriam ter surgido em `tempo_ms` de fase
+    def _devidos(self, tempo_ms):
+        total = 0
+        for onda in self.ondas:
+            fim = tempo_ms if onda.duracao_ms is None else min(tempo_ms, onda.inicio_ms + onda.duracao_ms)
+            if fim >= onda.inicio_ms + onda.intervalo_ms:
+                total += int((fim - onda.inicio_ms) // onda.intervalo_ms)
+        return total
+
+    # Quantos inimigos devem surgir agora (e os dá por gerados)
+    def vencidos(self, tempo_ms):
+        devidos = self._devidos(tempo_ms)
+        novos = devidos - self.gerados
+        self.gerados = devidos
+        return novos
+
+
+class IndiceFaixas:
+    # memoria: quantos dos últimos inimigos ocupam faixas
+    def __init__(self, memoria=10):
+        self.ocupadas = deque()  # (topo, base) de cada inimigo recente, do mais antigo ao mais novo
+        self.memoria = memoria
+
+    def limpar(self):
+        self.ocupadas.clear()
+
+    def ocupar(self, topo, altura):
+        self.ocupadas.append((topo, topo + altura))
+        if len(self.ocupadas) > self.memoria:
+            self.ocupadas.popleft()
+
+    # Intervalos livres para o topo de um sprite de `altura`, dentro de
+    # [minimo, maximo], sem encostar em nenhuma faixa ocupada
+    def _livres(self, minimo, maximo, altura):
+        bloqueios = sorted((topo - altura + 1, base - 1) for topo, base in self.ocupadas)
+        livres = []
+        inicio = minimo
+        for bloqueio_inicio, bloqueio_fim in bloqueios:
+            if bloqueio_inicio > inicio:
+                livres.append((inicio, min(bloqueio_inicio - 1, maximo)))
+            inicio = max(inicio, bloqueio_fim + 1)
+            if inicio > maximo:
+                break
+        if inicio <= maximo:
+            livres.append((inicio, maximo))
+        return [(a, b) for a, b in livres if a <= b]
+
+    # Sorteia o topo de um novo sprite uniformemente entre as alturas livres.
+    # Se os últimos inimigos ocupam tudo, o mais antigo deixa de contar, até
+    # sobrar espaço: o novo nunca sobrepõe os inimigos mais recentes.
+    def sortear(self, rng, minimo, maximo, altura):
+        while True:
+            livres = self._livres(minimo, maximo, altura)
+            if livres or not self.ocupadas:
+                break
+            self.ocupadas.popleft()
+        if not livres:  # Faixa permitida vazia (sprite maior que a tela)
+            return minimo
+
+        acumulados = []
+        total = 0
+        for inicio, fim in livres:
+            total += fim - inicio + 1
+            acumulados.append(total)
+        sorteio = rng.randrange(total)
+        i = bisect_right(acumulados, sorteio)
+        return livres[i][0] + sorteio - (acumulados[i - 1] if i else 0)
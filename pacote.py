@@ -0,0 +1,218 @@
+# ================================
+# Pacote de recursos pré-processados do Herói dos Pampas
+# Gera um único arquivo com os sprites já redimensionados (os inimigos
+# num atlas só) e os pixels crus de cada fundo. Em tempo de execução o
+# arquivo é mapeado com mmap e as superfícies são criadas direto sobre
+# esse buffer, sem decodificar PNG/JPEG nem copiar os pixels.
+#
+# Uso: python pacote.py [--forcar]
+#
+# Cada entrada guarda a data de modificação e o tamanho dos arquivos de
+# origem e os parâmetros de escala; se algo mudar, a entrada é ignorada
+# e o jogo volta a decodificar a imagem original.
+# ================================
+
+import json    # Índice do pacote
+import mmap    # Mapeamento do arquivo em memória
+import os      # Para lidar com caminhos de arquivos
+import struct  # Cabeçalho binário
+import sys
+
+import pygame
+
+from configuracoes import (
+    ALTURA, CAMINHO_ASSETS, ESCALA_BANDEIRA, ESCALA_PERSONAGENS, FINAL_SUCCESS_ARQUIVO, FUNDO_MENU,
+    GAME_OVER_ARQUIVO, LARGURA, TAMANHO_BALA, nomes_inimigos
+)
+from fases import carregar_fases  # Fundos de cada fase
+from recursos import carregar_redimensionada
+
+ARQUIVO_PACOTE = os.path.join(CAMINHO_ASSETS, 'recursos.pak')
+
+MAGICA = b'HPAK'
+VERSAO = 1
+ALINHAMENTO = 64  # Cada bloco de pixels começa num múltiplo de 64 bytes
+_CABECALHO = struct.Struct('<4sII')  # mágica, versão, tamanho do índice
+
+
+# Normaliza os parâmetros de escala para o formato guardado no índice (JSON)
+def _parametros(escala=None, tamanho=None):
+    parametros = {}
+    if escala is not None:
+        parametros['escala'] = escala
+    if tamanho is not None:
+        parametros['tamanho'] = list(tamanho)
+    return parametros
+
+
+def _origem(arquivo):
+    info = os.stat(os.path.join(CAMINHO_ASSETS, arquivo))
+    return [arquivo, info.st_mtime_ns, info.st_size]
+
+
+def _alinhar(posicao):
+    return (posicao + ALINHAMENTO - 1) // ALINHAMENTO * ALINHAMENTO
+
+
+# Descreve tudo o que vai para o pacote: (nome da entrada, formato, arquivos, parâmetros)
+def especificacao():
+    fundos = [FUNDO_MENU] + [fase.fundo for _, fase in sorted(carregar_fases().items())]
+    fundos = list(dict.fromkeys(fundos + [FINAL_SUCCESS_ARQUIVO, GAME_OVER_ARQUIVO]))
+    entradas = [
+        ('sprite:gaucho.png', 'RGBA', ['gaucho.png'], _parametros(escala=ESCALA_PERSONAGENS)),
+        ('sprite:bala.png', 'RGBA', ['bala.png'], _parametros(tamanho=TAMANHO_BALA)),
+        ('sprite:bandeira.png', 'RGBA', ['bandeira.png'], _parametros(escala=ESCALA_BANDEIRA)),
+        ('atlas:inimigos', 'RGBA', list(nomes_inimigos), _parametros(escala=ESCALA_PERSONAGENS)),
+    ]
+    for arquivo in fundos:
+        entradas.append(('fundo:' + arquivo, 'RGB', [arquivo], _parametros(tamanho=(LARGURA, ALTURA))))
+    return entradas
+
+
+# Monta o atlas colocando os sprites lado a lado numa única faixa
+def _montar_atlas(arquivos, parametros):
+    imagens = [carregar_redimensionada(CAMINHO_ASSETS, arquivo, **parametros) for arquivo in arquivos]
+    largura = sum(img.get_width() for img in imagens)
+    altura = max(img.get_height() for img in imagens)
+    atlas = pygame.Surface((largura, altura), pygame.SRCALPHA, 32)
+    quadros = {}
+    x = 0
+    for arquivo, img in zip(arquivos, imagens):
+        atlas.blit(img, (x, 0))
+        quadros[arquivo] = [x, 0, img.get_width(), img.get_height()]
+        x += img.get_width()
+    return atlas, quadros
+
+
+# Gera o pacote em disco. Devolve False se o pacote existente já estava atualizado.
+def construir(destino=ARQUIVO_PACOTE, forcar=False):
+    if not forcar:
+        existente = PacoteRecursos.abrir(destino)
+        if existente is not None:
+            atualizado = all(existente.valido(nome, parametros) for nome, _, _, parametros in especificacao())
+            existente.fechar()
+            if atualizado:
+                return False
+
+    indice = {}
+    blocos = []
+    for nome, formato, arquivos, parametros in especificacao():
+        quadros = None
+        if nome.startswith('atlas:'):
+            superficie, quadros = _montar_atlas(arquivos, parametros)
+        else:
+            superficie = carregar_redimensionada(CAMINHO_ASSETS, arquivos[0], **parametros)
+        dados = pygame.image.tobytes(superficie, formato)
+        indice[nome] = {
+            'formato': formato,
+            'largura': superficie.get_width(),
+            'altura': superficie.get_height(),
+            'bytes': len(dados),
+            'parametros': parametros,
+            'origens': [_origem(arquivo) for arquivo in arquivos],
+        }
+        if quadros is not None:
+            indice[nome]['quadros'] = quadros
+        blocos.append((nome, dados))
+
+    # O índice precisa dos deslocamentos, que dependem do tamanho do próprio índice:
+    # reserva espaço com deslocamentos provisórios e recalcula até estabilizar.
+    tamanho_indice = 0
+    while True:
+        posicao = _alinhar(_CABECALHO.size + tamanho_indice)
+        for nome, dados in blocos:
+            indice[nome]['deslocamento'] = posicao
+            posicao = _alinhar(posicao + len(dados))
+        texto = json.dumps(indice, sort_keys=True).encode('utf-8')
+        if len(texto) <= tamanho_indice:
+            texto = texto.ljust(tamanho_indice)
+            break
+        tamanho_indice = len(texto) + 256
+
+    temporario = destino + '.tmp'
+    with open(temporario, 'wb') as arquivo:
+        arquivo.write(_CABECALHO.pack(MAGICA, VERSAO, len(texto)))
+        arquivo.write(texto)
+        for nome, dados in blocos:
+            arquivo.seek(indice[nome]['deslocamento'])
+            arquivo.write(dados)
+    os.replace(temporario, destino)
+    return True
+
+
+# Leitura do pacote em tempo de execução
+class PacoteRecursos:
+    def __init__(self, arquivo, mapa, indice):
+        self._arquivo = arquivo
+        self._mapa = mapa
+        self._indice = indice
+
+    # Abre o pacote; devolve None se ele não existir ou for de outra versão
+    @classmethod
+    def abrir(cls, caminho=ARQUIVO_PACOTE):
+        try:
+            arquivo = open(caminho, 'rb')
+        except OSError:
+            return None
+        try:
+            magica, versao, tamanho_indice = _CABECALHO.unpack(arquivo.read(_CABECALHO.size))
+            if magica != MAGICA or versao != VERSAO:
+                arquivo.close()
+                return None
+            indice = json.loads(arquivo.read(tamanho_indice))
+            # ACCESS_COPY: as páginas são compartilhadas com o arquivo e, se alguém
+            # desenhar sobre uma dessas superfícies, a escrita não chega ao disco
+            mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError, struct.error):
+            arquivo.close()
+            return None
+        return cls(arquivo, mapa, indice)
+
+    # Confere se a entrada existe, foi gerada com os mesmos parâmetros
+    # e se os arquivos de origem não mudaram desde então
+    def valido(self, nome, parametros):
+        entrada = self._indice.get(nome)
+        if entrada is None or entrada['parametros'] != parametros:
+            return False
+        try:
+            return all(_origem(origem[0]) == origem for origem in entrada['origens'])
+        except OSError:
+            return False
+
+    def _superficie(self, nome, parametros):
+        if not self.valido(nome, parametros):
+            return None
+        entrada = self._indice[nome]
+        inicio = entrada['deslocamento']
+        buffer = memoryview(self._mapa)[inicio:inicio + entrada['bytes']]
+        return pygame.image.frombuffer(buffer, (entrada['largura'], entrada['altura']), entrada['formato'])
+
+    def sprite(self, arquivo, escala=None, tamanho=None):
+        return self._superficie('sprite:' + arquivo, _parametros(escala, tamanho))
+
+    def fundo(self, arquivo, tamanho):
+        return self._superficie('fundo:' + arquivo, _parametros(tamanho=tamanho))
+
+    # Devolve os quadros do atlas (subsuperfícies) na ordem de `arquivos`
+    def atlas(self, nome, arquivos, escala=None, tamanho=None):
+        superficie = self._superficie('atlas:' + nome, _parametros(escala, tamanho))
+        if superficie is None:
+            return None
+        quadros = self._indice['atlas:' + nome]['quadros']
+        if set(quadros) != set(arquivos):
+            return None
+        return [superficie.subsurface(pygame.Rect(quadros[arquivo])) for arquivo in arquivos]
+
+    def fechar(self):
+        try:
+            self._mapa.close()
+        except BufferError:
+            pass  # Ainda há superfícies apontando para o mapa
+        self._arquivo.close()
+
+
+if __name__ == '__main__':
+    if construir(forcar='--forcar' in sys.argv[1:]):
+        print(f"Pacote gerado em {ARQUIVO_PACOTE}")
+    else:
+        print(f"Pacote já está atualizado: {ARQUIVO_PACOTE}")
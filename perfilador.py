@@ -0,0 +1,170 @@
+# ================================
+# Perfilador do Herói dos Pampas
+# Um Medidor que guarda os últimos quadros num buffer circular, com a
+# linha do tempo de cada etapa (eventos, update, colisão, desenho, flip),
+# o número de inimigos e chimarrões e o FPS. Desenha um gráfico compacto
+# por cima do jogo e exporta o buffer em JSON ou no formato de trace do
+# Chrome (abrir em chrome://tracing ou https://ui.perfetto.dev).
+#
+# No jogo: F3 liga/desliga o gráfico, F4 grava o buffer em arquivos.
+# ================================
+
+import json
+from collections import deque
+from time import perf_counter
+
+import pygame
+
+from medicao import Medidor, resumir_ms
+from textos import Rotulo
+
+CAPACIDADE_PADRAO = 600      # 10 s de quadros a 60 FPS
+LARGURA_GRAFICO = 240        # Um pixel por quadro
+ALTURA_GRAFICO = 80
+MS_TOPO_GRAFICO = 40.0       # Tempo de quadro no topo do gráfico
+ORCAMENTO_QUADRO_MS = 1000 / 60
+
+# Etapas mostradas no gráfico, de baixo para cima, e suas cores
+CORES_ETAPAS = (
+    ('eventos', (200, 200, 200)),
+    ('update', (80, 160, 255)),
+    ('colisao', (255, 200, 40)),
+    ('desenho', (80, 220, 120)),
+    ('flip', (230, 80, 200)),
+)
+
+
+class Perfilador(Medidor):
+    def __init__(self, fonte, capacidade=CAPACIDADE_PADRAO):
+        super().__init__()
+        self.quadros = deque(maxlen=capacidade)
+        self.trechos = []           # (etapa, inicio, segundos) do quadro atual
+        self.inicio_quadro = None
+
+        # Gráfico: a cada quadro a imagem anda um pixel para a esquerda e
+        # só a coluna nova é desenhada
+        self.grafico = pygame.Surface((LARGURA_GRAFICO, ALTURA_GRAFICO))
+        self.grafico.fill((20, 20, 20))
+        self.rotulo = Rotulo(fonte, (255, 255, 255))
+        self.superficie = pygame.Surface((LARGURA_GRAFICO, ALTURA_GRAFICO + fonte.get_linesize() + 4))
+        self.superficie.set_alpha(210)
+        self.fechados = 0  # Quadros fechados desde a criação (o texto muda a cada 15)
+
+    # Começa um quadro; o que sobrou de um quadro não fechado é descartado
+    def iniciar_quadro(self):
+        self.quadro = {}
+        self.trechos = []
+        self.inicio_quadro = perf_counter()
+
+    def registrar(self, etapa, segundos, inicio=None):
+        super().registrar(etapa, segundos)
+        if inicio is None:
+            inicio = perf_counter() - segundos
+        self.trechos.append((etapa, inicio, segundos))
+
+    # Fecha o quadro aberto por iniciar_quadro(); extras: inimigos, balas, fps...
+    def fechar_quadro(self, total=None, **extras):
+        inicio = self.inicio_quadro if self.inicio_quadro is not None else perf_counter()
+        if total is None:
+            total = perf_counter() - inicio
+        registro = super().fechar_quadro(total, inicio=inicio, trechos=self.trechos, **extras)
+        self.trechos = []
+        self.inicio_quadro = None
+        self.fechados += 1
+        self._desenhar_coluna(registro)
+        return registro
+
+    # ================================
+    # GRÁFICO
+    # ================================
+
+    def _desenhar_coluna(self, registro):
+        grafico = self.grafico
+        grafico.scroll(-1, 0)
+        x = LARGURA_GRAFICO - 1
+        grafico.fill((20, 20, 20), (x, 0, 1, ALTURA_GRAFICO))
+
+        escala = ALTURA_GRAFICO / MS_TOPO_GRAFICO
+        base = ALTURA_GRAFICO
+        etapas = registro['etapas']
+        for etapa, cor in CORES_ETAPAS:
+            altura = etapas.get(etapa, 0.0) * 1000 * escala
+            if altura >= 0.5:
+                topo = max(0, base - round(altura))
+                grafico.fill(cor, (x, topo, 1, base - topo))
+                base = topo
+        # Resto do quadro (espera do clock, lógica do laço principal...)
+        resto = round(registro['total'] * 1000 * escala) - (ALTURA_GRAFICO - base)
+        if resto > 0:
+            topo = max(0, base - resto)
+            grafico.fill((90, 90, 90), (x, topo, 1, base - topo))
+
+        # Linha do orçamento de um quadro a 60 FPS
+        y_orcamento = ALTURA_GRAFICO - round(ORCAMENTO_QUADRO_MS * escala)
+        grafico.set_at((x, y_orcamento), (255, 60, 60))
+
+    # Superfície do gráfico com o resumo em texto, para desenhar por cima do
+    # jogo; é sempre a mesma superfície, redesenhada a cada chamada
+    def sobreposicao(self):
+        if self.rotulo.texto is None or self.fechados % 15 == 0:
+            ultimo = self.quadros[-1] if self.quadros else {}
+            resumo = resumir_ms([registro['total'] for registro in list(self.quadros)[-60:]])
+            self.rotulo.atualizar(
+                f"{ultimo.get('fps', 0):4.0f} FPS  p50 {resumo['p50']:.1f}  p99 {resumo['p99']:.1f} ms"
+                f"  ini {ultimo.get('inimigos', 0)}  bal {ultimo.get('balas', 0)}"
+            )
+        superficie = self.superficie
+        superficie.fill((0, 0, 0))
+        superficie.blit(self.grafico, (0, 0))
+        self.rotulo.desenhar(superficie, (2, ALTURA_GRAFICO + 2))
+        return superficie
+
+    # ================================
+    # EXPORTAÇÃO
+    # ================================
+
+    def resumo(self):
+        registros = list(self.quadros)
+        etapas = sorted({etapa for registro in registros for etapa in registro['etapas']})
+        return {
+            'quadros': len(registros),
+            'quadro_ms': resumir_ms([registro['total'] for registro in registros]),
+            'etapas_ms': {
+                etapa: resumir_ms([registro['etapas'].get(etapa, 0.0) for registro in registros])
+                for etapa in etapas
+            },
+        }
+
+    # Buffer completo: resumo e, para cada quadro, etapas em ms e extras
+    def exportar_json(self, caminho):
+        quadros = []
+        for registro in self.quadros:
+            quadro = {chave: valor for chave, valor in registro.items() if chave not in ('trechos', 'inicio')}
+            quadro['total'] = round(registro['total'] * 1000, 4)
+            quadro['etapas'] = {etapa: round(segundos * 1000, 4) for etapa, segundos in registro['etapas'].items()}
+            quadros.append(quadro)
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            json.dump({'resumo': self.resumo(), 'quadros_ms': quadros}, arquivo, indent=1, ensure_ascii=False)
+
+    # Formato "Trace Event" do Chrome: um evento completo ('X') por quadro e
+    # por etapa, em microssegundos, e um contador com inimigos, chimarrões, FPS
+    # e nível de qualidade
+    def exportar_chrome(self, caminho):
+        origem = self.quadros[0]['inicio'] if self.quadros else 0.0
+        eventos = []
+        for numero, registro in enumerate(self.quadros):
+            inicio = (registro['inicio'] - origem) * 1e6
+            eventos.append({
+                'name': 'quadro', 'cat': 'quadro', 'ph': 'X', 'pid': 1, 'tid': 1,
+                'ts': round(inicio, 1), 'dur': round(registro['total'] * 1e6, 1), 'args': {'numero': numero},
+            })
+            for etapa, comeco, segundos in registro['trechos']:
+                eventos.append({
+                    'name': etapa, 'cat': etapa.split('.')[0], 'ph': 'X', 'pid': 1, 'tid': 1,
+                    'ts': round((comeco - origem) * 1e6, 1), 'dur': round(segundos * 1e6, 1),
+                })
+            contadores = {chave: registro[chave] for chave in ('inimigos', 'balas', 'fps', 'qualidade') if chave in registro}
+            if contadores:
+                eventos.append({'name': 'contadores', 'ph': 'C', 'pid': 1, 'ts': round(inicio, 1), 'args': contadores})
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            json.dump({'traceEvents': eventos, 'displayTimeUnit': 'ms'}, arquivo)
@@ -0,0 +1,53 @@
+# ================================
+# Pools de objetos do Herói dos Pampas
+# Chimarrões e inimigos são criados e destruídos às centenas numa onda
+# densa. Em vez de criar um Sprite (com Rect e entradas nos grupos) para
+# cada um e deixá-lo para o coletor de lixo, os objetos mortos voltam
+# para um pool e são reaproveitados pelo próximo que for criado.
+#
+# A classe guardada precisa ter iniciar(*args), chamado tanto na criação
+# quanto no reaproveitamento, e um atributo `pool`.
+# ================================
+
+
+class PoolObjetos:
+    # capacidade: máximo de objetos livres guardados; os excedentes são descartados
+    def __init__(self, classe, capacidade):
+        self.classe = classe
+        self.capacidade = capacidade
+        self.livres = []
+        self.acertos = 0    # Pedidos atendidos com um objeto reaproveitado
+        self.faltas = 0     # Pedidos que precisaram criar um objeto novo
+        self.descartes = 0  # Objetos devolvidos com o pool cheio
+
+    def obter(self, *args):
+        if self.livres:
+            objeto = self.livres.pop()
+            objeto.iniciar(*args)
+            self.acertos += 1
+        else:
+            objeto = self.classe(*args)
+            objeto.pool = self
+            self.faltas += 1
+        return objeto
+
+    def devolver(self, objeto):
+        if len(self.livres) < self.capacidade:
+            self.livres.append(objeto)
+        else:
+            self.descartes += 1
+
+    # Descarta os objetos livres (ex.: inimigos que ainda apontam para os
+    # sprites de uma fase que terminou)
+    def esvaziar(self):
+        self.livres.clear()
+
+    def estatisticas(self):
+        pedidos = self.acertos + self.faltas
+        return {
+            'acertos': self.acertos,
+            'faltas': self.faltas,
+            'descartes': self.descartes,
+            'livres': len(self.livres),
+            'taxa_acerto': round(self.acertos / pedidos, 4) if pedidos else 0.0,
+        }
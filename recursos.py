@@ -0,0 +1,236 @@
+# ================================
+# Carregamento de recursos do Herói dos Pampas
+# O GerenciadorRecursos é o dono de todas as imagens e sons do jogo:
+# converte cada imagem para o formato de pixel da tela (assim o blit
+# não precisa converter a cada quadro) e memoriza cada sprite por
+# (arquivo, escala, tamanho), para que uma escala seja calculada uma vez só.
+# Os fundos de tela são carregados apenas quando uma fase precisa deles
+# e ficam guardados num cache LRU limitado por um orçamento de memória.
+# ================================
+
+import os         # Para lidar com caminhos de arquivos
+import threading  # Para a pré-carga da próxima fase em segundo plano
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from time import perf_counter
+
+import pygame
+
+
+# Decodifica uma imagem da pasta de assets e a redimensiona, seja por um
+# fator de escala (ex.: 0.11) ou para um tamanho fixo em pixels
+def carregar_redimensionada(caminho, arquivo, escala=None, tamanho=None):
+    imagem = pygame.image.load(os.path.join(caminho, arquivo))
+    if escala is not None:
+        tamanho = (int(imagem.get_width() * escala), int(imagem.get_height() * escala))
+    if tamanho is None:
+        return imagem
+    return pygame.transform.scale(imagem, tamanho)
+
+
+# Converte a superfície para o formato da tela. Fundos usam o caminho opaco
+# (convert) e sprites o de transparência por pixel (convert_alpha).
+# Sem janela aberta (ex.: execução sem vídeo) a superfície fica como está.
+def converter_para_tela(superficie, alpha):
+    if pygame.display.get_surface() is None:
+        return superficie
+    return superficie.convert_alpha() if alpha else superficie.convert()
+
+
+# Cache LRU de fundos já decodificados e redimensionados para a tela.
+# A chave é o nome do arquivo (ex.: 'fundo_pampa-3.jpg'); quando a soma dos
+# bytes das superfícies passa do orçamento, os fundos usados há mais tempo
+# são descartados. O fundo recém-carregado nunca é descartado, mesmo que
+# sozinho ultrapasse o orçamento.
+# Se houver um pacote de recursos (pacote.py), os pixels vêm dele.
+class CacheFundos:
+    def __init__(self, caminho, tamanho, orcamento_bytes, pacote=None):
+        self.caminho = caminho
+        self.pacote = pacote
+        self.tamanho = tamanho
+        self.orcamento_bytes = orcamento_bytes
+        self.bytes_usados = 0
+        self._superficies = OrderedDict()
+        self._em_carga = {}  # arquivo -> threading.Event das cargas em andamento
+        self._trava = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pre-carga")
+
+    def _carregar(self, arquivo):
+        superficie = None
+        if self.pacote is not None:
+            superficie = self.pacote.fundo(arquivo, self.tamanho)
+        if superficie is None:
+            superficie = carregar_redimensionada(self.caminho, arquivo, tamanho=self.tamanho)
+        return converter_para_tela(superficie, alpha=False)
+
+    # Devolve o fundo pedido, carregando-o do disco se ainda não estiver no cache.
+    # Se outra thread já estiver carregando o mesmo arquivo, espera por ela
+    # em vez de decodificar a imagem duas vezes.
+    def obter(self, arquivo):
+        while True:
+            with self._trava:
+                superficie = self._superficies.get(arquivo)
+                if superficie is not None:
+                    self._superficies.move_to_end(arquivo)
+                    return superficie
+                pronto = self._em_carga.get(arquivo)
+                if pronto is None:
+                    pronto = self._em_carga[arquivo] = threading.Event()
+                    break
+            pronto.wait()
+
+        try:
+            superficie = self._carregar(arquivo)
+            with self._trava:
+                self._guardar(arquivo, superficie)
+        finally:
+            with self._trava:
+                del self._em_carga[arquivo]
+            pronto.set()
+        return superficie
+
+    # Agenda a carga de um fundo em segundo plano (ex.: o da próxima fase)
+    def precarregar(self, arquivo):
+        with self._trava:
+            if arquivo in self._superficies or arquivo in self._em_carga:
+                return
+        self._executor.submit(self.obter, arquivo)
+
+    # Deve ser chamado com a trava adquirida
+    def _guardar(self, arquivo, superficie):
+        self._superficies[arquivo] = superficie
+        self.bytes_usados += superficie.get_pitch() * superficie.get_height()
+
+        while self.bytes_usados > self.orcamento_bytes and len(self._superficies) > 1:
+            _, descartada = self._superficies.popitem(last=False)
+            self.bytes_usados -= descartada.get_pitch() * descartada.get_height()
+
+    def encerrar(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Dono de todas as imagens e sons do jogo
+class GerenciadorRecursos:
+    def __init__(self, caminho, tamanho_tela, orcamento_fundos_bytes, pacote=None):
+        self.caminho = caminho
+        self.pacote = pacote
+        self.fundos = CacheFundos(caminho, tamanho_tela, orcamento_fundos_bytes, pacote)
+        self._sprites = {}   # (arquivo, escala, tamanho) -> Surface convertida
+        self._atlas = {}     # (nome, arquivos, escala) -> lista de Surfaces
+        self._sons = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pre-carga-sprites")
+
+    # Sprite com transparência, redimensionado por escala ou tamanho fixo
+    def sprite(self, arquivo, escala=None, tamanho=None):
+        chave = (arquivo, escala, tamanho)
+        sprite = self._sprites.get(chave)
+        if sprite is None:
+            if self.pacote is not None:
+                sprite = self.pacote.sprite(arquivo, escala=escala, tamanho=tamanho)
+            if sprite is None:
+                sprite = carregar_redimensionada(self.caminho, arquivo, escala=escala, tamanho=tamanho)
+            sprite = self._sprites[chave] = converter_para_tela(sprite, alpha=True)
+        return sprite
+
+    # Lista de sprites do mesmo grupo (ex.: inimigos), vinda do atlas do pacote
+    # quando disponível. O atlas é convertido uma vez e recortado em subsuperfícies.
+    def grupo_sprites(self, nome, arquivos, escala=None, tamanho=None):
+        chave = (nome, tuple(arquivos), escala, tamanho)
+        sprites = self._atlas.get(chave)
+        if sprites is None:
+            quadros = None
+            if self.pacote is not None:
+                quadros = self.pacote.atlas(nome, arquivos, escala=escala, tamanho=tamanho)
+            if quadros is not None:
+                atlas = converter_para_tela(quadros[0].get_parent(), alpha=True)
+                sprites = [atlas.subsurface(pygame.Rect(quadro.get_offset(), quadro.get_size())) for quadro in quadros]
+                for arquivo, sprite in zip(arquivos, sprites):
+                    self._sprites[(arquivo, escala, tamanho)] = sprite
+            else:
+                sprites = [self.sprite(arquivo, escala=escala, tamanho=tamanho) for arquivo in arquivos]
+            self._atlas[chave] = sprites
+        return sprites
+
+    # Só os sprites `escolhidos` de um grupo, na ordem pedida (ex.: os inimigos
+    # de uma fase). Com o atlas do grupo no pacote, são recortados dele; sem o
+    # pacote, só os escolhidos são decodificados.
+    def sprites_do_grupo(self, nome, arquivos, escolhidos, escala=None, tamanho=None):
+        if self.pacote is not None and self.pacote.atlas(nome, arquivos, escala=escala, tamanho=tamanho) is not None:
+            grupo = dict(zip(arquivos, self.grupo_sprites(nome, arquivos, escala=escala, tamanho=tamanho)))
+            return [grupo[arquivo] for arquivo in escolhidos]
+        return [self.sprite(arquivo, escala=escala, tamanho=tamanho) for arquivo in escolhidos]
+
+    # Agenda sprites_do_grupo em segundo plano (ex.: inimigos da próxima fase,
+    # durante a vinheta), com o grupo no formato de carregar_em_paralelo.
+    # Devolve o Future da lista de sprites.
+    def precarregar_grupo(self, nome, arquivos, escala, tamanho, escolhidos):
+        return self._executor.submit(self.sprites_do_grupo, nome, arquivos, escolhidos, escala, tamanho)
+
+    # Esquece sprites que não serão mais usados (ex.: inimigos da fase
+    # anterior). Os recortes de um atlas continuam no atlas, que é uma imagem só.
+    def descartar_sprites(self, arquivos, escala=None, tamanho=None):
+        for arquivo in arquivos:
+            self._sprites.pop((arquivo, escala, tamanho), None)
+
+    # Carrega de uma vez os sprites (arquivo, escala, tamanho), grupos de sprites
+    # (nome, arquivos, escala, tamanho, escolhidos) e fundos pedidos, um por
+    # thread: o pygame libera o GIL ao decodificar e redimensionar, então cada
+    # núcleo cuida de uma imagem. Um grupo que está no atlas do pacote é uma
+    # tarefa só; fora dele, cada sprite escolhido do grupo (None = todos) é uma tarefa.
+    # progresso(feitos, total, nome), se dada, é chamada na thread principal a
+    # cada imagem pronta (ex.: tela de carga).
+    # Devolve a lista de (nome, ms) com o tempo de cada imagem.
+    def carregar_em_paralelo(self, sprites=(), grupos=(), fundos=(), progresso=None, threads=None):
+        def medir(nome, carregar, *args):
+            inicio = perf_counter()
+            carregar(*args)
+            return nome, (perf_counter() - inicio) * 1000
+
+        sprites = list(sprites)
+        atlas = []
+        for nome, arquivos, escala, tamanho, escolhidos in grupos:
+            if self.pacote is not None and self.pacote.atlas(nome, arquivos, escala=escala, tamanho=tamanho) is not None:
+                atlas.append((nome, arquivos, escala, tamanho))
+            else:
+                sprites.extend((arquivo, escala, tamanho) for arquivo in (escolhidos or arquivos))
+
+        tempos = []
+        with ThreadPoolExecutor(max_workers=threads or os.cpu_count(), thread_name_prefix="carga") as executor:
+            futuros = [executor.submit(medir, arquivo, self.sprite, arquivo, escala, tamanho)
+                       for arquivo, escala, tamanho in sprites]
+            futuros += [executor.submit(medir, 'atlas:' + grupo[0], self.grupo_sprites, *grupo) for grupo in atlas]
+            futuros += [executor.submit(medir, arquivo, self.fundo, arquivo) for arquivo in fundos]
+            for futuro in as_completed(futuros):
+                tempos.append(futuro.result())
+                if progresso is not None:
+                    progresso(len(tempos), len(futuros), tempos[-1][0])
+        return tempos
+
+    # Fundo de tela (opaco) já no tamanho da tela
+    def fundo(self, arquivo):
+        return self.fundos.obter(arquivo)
+
+    def precarregar_fundo(self, arquivo):
+        self.fundos.precarregar(arquivo)
+
+    # Som carregado uma vez. Se o arquivo não existir ou o mixer falhar, o
+    # erro (pygame.error ou FileNotFoundError) chega a quem pediu: sons.py
+    # avisa o motivo em vez de desligar o som em silêncio
+    def som(self, arquivo):
+        som = self._sons.get(arquivo)
+        if som is None:
+            som = self._sons[arquivo] = pygame.mixer.Sound(os.path.join(self.caminho, arquivo))
+        return som
+
+    def encerrar(self):
+        self.fundos.encerrar()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Relatório de carga: cada imagem, da mais lenta para a mais rápida, e o
+# total de trabalho comparado ao tempo de relógio (ganho do paralelismo)
+def imprimir_tempos_carga(tempos, duracao_ms):
+    for nome, ms in sorted(tempos, key=lambda tempo: -tempo[1]):
+        print(f"  {nome:24s} {ms:8.1f} ms")
+    trabalho = sum(ms for _, ms in tempos)
+    print(f"Carga: {len(tempos)} imagens, {trabalho:.0f} ms de trabalho em {duracao_ms:.0f} ms de relógio")
@@ -0,0 +1,278 @@
+# ================================
+# Renderização do quadro de jogo do Herói dos Pampas
+# Dois modos, que podem ser trocados durante o jogo para comparação:
+#  - 'completo': redesenha o fundo inteiro e chama display.flip()
+#  - 'sujo': restaura só as áreas do fundo por onde os sprites passaram
+#    e envia apenas esses retângulos com display.update(rects)
+# Sempre que outra parte do jogo desenha direto na tela (menu, vinheta,
+# troca de fase...) o próximo quadro volta a ser completo.
+#
+# Como a simulação anda em passos fixos, independentes da taxa de quadros,
+# os sprites de um GrupoInterpolado são desenhados entre a posição do passo
+# anterior e a do passo atual, conforme o tempo que sobrou no acumulador.
+#
+# Com a janela em outro tamanho ou uma resolução interna menor (escala.py),
+# o quadro é desenhado já no tamanho reduzido e ampliado uma vez para a
+# janela; os textos são desenhados depois, na resolução da janela. Nesse
+# caso o quadro é sempre completo.
+# ================================
+
+from time import perf_counter
+
+import pygame
+
+from configuracoes import ALTURA, LARGURA
+from escala import ESCALAS, Escalador, area_na_janela, tamanho_escalado
+
+MODOS = ('completo', 'sujo')
+
+
+# Grupo de sprites desenhado numa posição interpolada entre o passo de
+# simulação anterior e o atual (alfa entre 0 e 1)
+# (nome: usado nas medições de desenho, ex.: 'desenho.inimigos')
+class GrupoInterpolado(pygame.sprite.Group):
+    def __init__(self, *sprites, nome=None):
+        super().__init__(*sprites)
+        self.nome = nome
+        self.anteriores = {}
+
+    # Deve ser chamado antes de cada passo de simulação (e depois de um
+    # teletransporte, para o sprite não "deslizar" até a nova posição)
+    def guardar_posicoes(self):
+        self.anteriores = {sprite: sprite.rect.topleft for sprite in self.spritedict}
+
+    # escalador: Escalador do quadro reduzido (None = tamanho original)
+    def desenhar(self, superficie, alfa, escalador=None):
+        anteriores = self.anteriores
+        sprites = self.sprites()
+        blits = []
+        if escalador is None:
+            for sprite in sprites:
+                x, y = sprite.rect.topleft
+                anterior = anteriores.get(sprite)
+                if anterior is not None:
+                    x = round(anterior[0] + (x - anterior[0]) * alfa)
+                    y = round(anterior[1] + (y - anterior[1]) * alfa)
+                blits.append((sprite.image, (x, y)))
+        else:
+            for sprite in sprites:
+                x, y = sprite.rect.topleft
+                anterior = anteriores.get(sprite)
+                if anterior is not None:
+                    x = anterior[0] + (x - anterior[0]) * alfa
+                    y = anterior[1] + (y - anterior[1]) * alfa
+                blits.append((escalador.sprite(sprite.image), escalador.posicao(x, y)))
+        # Guarda o retângulo realmente desenhado, usado pelo modo 'sujo' para apagar
+        self.spritedict.update(zip(sprites, superficie.blits(blits)))
+        self.lostsprites = []
+
+
+# Grupos com desenhar(superficie, alfa, escalador) (GrupoInterpolado,
+# ArmazemEntidades) são interpolados; os demais são desenhados como um Group comum
+def _desenhar_grupo(grupo, superficie, alfa, escalador=None):
+    desenhar = getattr(grupo, 'desenhar', None)
+    if desenhar is not None:
+        desenhar(superficie, alfa, escalador)
+    elif escalador is None:
+        grupo.draw(superficie)
+    else:
+        superficie.blits([(escalador.sprite(sprite.image), escalador.posicao(*sprite.rect.topleft)) for sprite in grupo])
+
+
+class Renderizador:
+    # tela: superfície da janela
+    # escala: resolução interna do quadro de jogo, como fração da área do
+    #   jogo na janela (1.0 = resolução da janela)
+    def __init__(self, tela, modo='completo', escala=1.0):
+        if modo not in MODOS:
+            raise ValueError(f"Modo de renderização desconhecido: {modo}")
+        if not 0 < escala <= 1:
+            raise ValueError(f"Escala de renderização fora de (0, 1]: {escala}")
+        self.modo = modo
+        self.escala = escala
+        self.medidor = None  # Medidor opcional dos tempos de desenho e de flip
+        self.escalador = Escalador()
+        self.escalador_textos = Escalador()  # Textos ampliados para a janela (fator = ampliacao)
+        self._fundo_anterior = None
+        self._sobreposicoes_anteriores = []
+        self.tela = None
+        self.redimensionar(tela)
+
+    # Ajusta o desenho ao tamanho atual da janela (depois de redimensioná-la,
+    # de entrar ou sair da tela cheia ou de trocar a escala).
+    #  - self.tela: onde as telas paradas (menu, vinheta...) desenham, sempre
+    #    LARGURA x ALTURA; é a própria janela quando ela tem esse tamanho
+    #  - self.quadro: onde o quadro de jogo é desenhado reduzido (None = direto na tela)
+    def redimensionar(self, janela=None):
+        self.janela = janela if janela is not None else pygame.display.get_surface()
+        self.area = area_na_janela(self.janela.get_size())
+        self.destino = self.janela.subsurface(self.area)
+        self.ampliacao = self.area.width / LARGURA  # Da coordenada do jogo para a janela
+
+        if self.janela.get_size() == (LARGURA, ALTURA):
+            self.tela = self.janela
+        elif self.tela is None or self.tela is self.janela:
+            self.tela = pygame.Surface((LARGURA, ALTURA), 0, self.janela)
+
+        fator = self.ampliacao * self.escala
+        if self.tela is self.janela and fator == 1.0:
+            self.quadro = None
+        elif self.escala == 1.0:
+            self.quadro = self.destino  # Desenha reduzido direto na janela, sem ampliar
+        else:
+            self.quadro = pygame.Surface(tamanho_escalado((LARGURA, ALTURA), fator), 0, self.janela)
+        self.escalador.definir_fator(fator)
+        self.escalador_textos.definir_fator(self.ampliacao)
+
+        self.janela.fill((0, 0, 0))  # Faixas pretas em volta da área do jogo
+        self.invalidar()
+
+    # Passa para a próxima escala de ESCALAS e devolve a nova escala
+    def alternar_escala(self):
+        seguintes = [escala for escala in ESCALAS if escala < self.escala]
+        self.escala = seguintes[0] if seguintes else ESCALAS[0]
+        self.redimensionar(self.janela)
+        return self.escala
+
+    def alternar_modo(self):
+        self.modo = MODOS[(MODOS.index(self.modo) + 1) % len(MODOS)]
+        self.invalidar()
+        return self.modo
+
+    # O conteúdo da tela não corresponde mais ao último quadro desenhado aqui
+    def invalidar(self):
+        self._fundo_anterior = None
+
+    # Mostra na janela algo que foi desenhado fora do renderizador (em self.tela)
+    def apresentar(self):
+        if self.tela is not self.janela:
+            pygame.transform.smoothscale(self.tela, self.area.size, self.destino)
+        pygame.display.flip()
+        self.invalidar()
+
+    def encerrar(self):
+        self.escalador.encerrar()
+        self.escalador_textos.encerrar()
+
+    # Desenha um quadro de jogo.
+    # grupos: grupos de sprites, na ordem de desenho
+    # sobreposicoes: lista de (superficie, posicao) desenhadas por cima (HUD, nome da fase);
+    #   (superficie, posicao, True) marca uma superfície redesenhada a cada quadro (perfilador)
+    # alfa: fração do passo de simulação já decorrida, para a interpolação
+    #
+    # Com um medidor, registra 'desenho' (com as partes 'desenho.fundo',
+    # 'desenho.<nome do grupo>' e 'desenho.textos') e 'flip'.
+    def desenhar_quadro(self, fundo, grupos, sobreposicoes=(), alfa=1.0):
+        inicio = perf_counter()
+        if self.quadro is not None:
+            sujos = self._desenhar_escalado(fundo, grupos, sobreposicoes, alfa)
+        elif self.modo == 'completo' or fundo is not self._fundo_anterior:
+            sujos = self._desenhar_completo(fundo, grupos, sobreposicoes, alfa)
+        else:
+            sujos = self._desenhar_sujo(fundo, grupos, sobreposicoes, alfa)
+        desenhado = perf_counter()
+
+        if sujos is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(sujos)
+
+        if self.medidor is not None:
+            self.medidor.registrar('desenho', desenhado - inicio, inicio)
+            self.medidor.registrar('flip', perf_counter() - desenhado, desenhado)
+
+    def _medir(self, parte, inicio):
+        agora = perf_counter()
+        self.medidor.registrar('desenho.' + parte, agora - inicio, inicio)
+        return agora
+
+    def _desenhar_grupos(self, superficie, grupos, alfa, escalador=None):
+        if self.medidor is None:
+            for grupo in grupos:
+                _desenhar_grupo(grupo, superficie, alfa, escalador)
+            return
+        inicio = perf_counter()
+        for grupo in grupos:
+            _desenhar_grupo(grupo, superficie, alfa, escalador)
+            inicio = self._medir(getattr(grupo, 'nome', None) or 'grupo', inicio)
+
+    # Textos na resolução de `superficie`. Com ampliado=True (janela de outro
+    # tamanho), os textos do CacheTexto e dos Rotulos, que ganham uma
+    # superfície nova quando o texto muda, são redimensionados uma vez por
+    # ampliação (escalador dos textos); as superfícies redesenhadas a cada
+    # quadro (o gráfico do perfilador) são redimensionadas a cada quadro.
+    def _desenhar_sobreposicoes(self, superficie, sobreposicoes, ampliado=False):
+        inicio = perf_counter()
+        if not ampliado:
+            self._sobreposicoes_anteriores = [
+                superficie.blit(imagem, posicao) for imagem, posicao, *_ in sobreposicoes
+            ]
+        else:
+            escalador = self.escalador_textos
+            desenhados = []
+            for imagem, posicao, *redesenhada in sobreposicoes:
+                if redesenhada and redesenhada[0]:
+                    imagem = pygame.transform.smoothscale(imagem, tamanho_escalado(imagem.get_size(), self.ampliacao))
+                else:
+                    imagem = escalador.sprite(imagem)
+                desenhados.append(superficie.blit(imagem, escalador.posicao(*posicao)))
+            self._sobreposicoes_anteriores = desenhados
+        if self.medidor is not None:
+            self._medir('textos', inicio)
+
+    # Os dois métodos abaixo desenham na tela e devolvem a lista de retângulos
+    # a enviar para a janela (None = a janela inteira)
+    def _desenhar_completo(self, fundo, grupos, sobreposicoes, alfa):
+        inicio = perf_counter()
+        self.tela.blit(fundo, (0, 0))
+        if self.medidor is not None:
+            self._medir('fundo', inicio)
+        self._desenhar_grupos(self.tela, grupos, alfa)
+        self._desenhar_sobreposicoes(self.tela, sobreposicoes)
+        self._fundo_anterior = fundo
+        return None
+
+    # Quadro reduzido: fundo e sprites no fator do escalador; se o quadro não
+    # é a própria janela, é ampliado para ela ('desenho.ampliacao')
+    def _desenhar_escalado(self, fundo, grupos, sobreposicoes, alfa):
+        inicio = perf_counter()
+        quadro = self.quadro
+        quadro.blit(self.escalador.fundo(fundo), (0, 0))
+        if self.medidor is not None:
+            inicio = self._medir('fundo', inicio)
+        self._desenhar_grupos(quadro, grupos, alfa, self.escalador)
+
+        if quadro is not self.destino:
+            inicio = perf_counter()
+            pygame.transform.scale(quadro, self.area.size, self.destino)  # Sem suavizar: é a etapa mais cara
+            if self.medidor is not None:
+                self._medir('ampliacao', inicio)
+        self._desenhar_sobreposicoes(self.destino, sobreposicoes, ampliado=True)
+        return None
+
+    def _desenhar_sujo(self, fundo, grupos, sobreposicoes, alfa):
+        inicio = perf_counter()
+        tela = self.tela
+        sujos = []
+
+        # 1) Apaga os sprites e os textos do quadro anterior
+        for rect in self._sobreposicoes_anteriores:
+            tela.blit(fundo, rect, rect)
+        sujos.extend(self._sobreposicoes_anteriores)
+        for grupo in grupos:
+            sujos.extend(grupo.lostsprites)
+            sujos.extend(rect for rect in grupo.spritedict.values() if rect)
+            grupo.clear(tela, fundo)
+        if self.medidor is not None:
+            self._medir('fundo', inicio)
+
+        # 2) Desenha todos os sprites nas novas posições. Como todos são
+        #    redesenhados, apagar um retângulo acima nunca deixa um sprite pela metade.
+        self._desenhar_grupos(tela, grupos, alfa)
+        for grupo in grupos:
+            sujos.extend(grupo.spritedict.values())
+
+        # 3) Textos por cima de tudo
+        self._desenhar_sobreposicoes(tela, sobreposicoes)
+        sujos.extend(self._sobreposicoes_anteriores)
+        return sujos
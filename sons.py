@@ -0,0 +1,116 @@
+# ================================
+# Sons do Herói dos Pampas
+# - O mixer é preparado antes de pygame.init() com um buffer pequeno
+#   (512 amostras, ~12 ms a 44,1 kHz), para o som sair junto com o tiro.
+# - Cada categoria de som (tiro, impacto) tem canais reservados só para
+#   ela, e o número de canais é o limite de vozes simultâneas: com todos
+#   ocupados, a voz mais antiga da categoria é interrompida pela nova.
+# - Os pedidos de um quadro são juntados: dez acertos no mesmo quadro
+#   tocam o impacto uma vez, um pouco mais alto, em vez de dez vozes.
+# - Sons que não carregam (arquivo ausente, sem dispositivo de áudio) são
+#   avisados uma vez, com o motivo, e o jogo segue sem eles.
+# ================================
+
+import sys
+from collections import Counter, namedtuple
+
+import pygame
+
+FREQUENCIA_MIXER = 44100
+BUFFER_MIXER = 512
+REFORCO_POR_PEDIDO = 0.15  # Volume extra por pedido juntado no mesmo quadro
+
+# arquivo: som em assets/; vozes: canais reservados; volume: de 0 a 1
+Categoria = namedtuple('Categoria', 'arquivo vozes volume')
+
+CATEGORIAS = {
+    'tiro': Categoria('tiro.wav', 3, 0.6),
+    'impacto': Categoria('impacto.wav', 4, 0.8),
+}
+
+
+# Deve ser chamada antes de pygame.init()
+def preparar_mixer():
+    pygame.mixer.pre_init(FREQUENCIA_MIXER, -16, 2, BUFFER_MIXER)
+
+
+def _avisar(mensagem):
+    print(f"Sons: {mensagem}", file=sys.stderr)
+
+
+class GerenciadorSons:
+    def __init__(self, recursos, categorias=CATEGORIAS):
+        self.categorias = categorias
+        self.sons = {}      # categoria -> Sound (só as que carregaram)
+        self.canais = {}    # categoria -> lista de Channel reservados
+        self.inicios = {}   # categoria -> get_ticks() em que cada canal começou a tocar
+        self.falhas = {}    # arquivo -> motivo
+        self.pendentes = Counter()
+        self.tocados = 0
+        self.juntados = 0   # Pedidos que não viraram uma voz nova
+        self.interrompidos = 0
+
+        if pygame.mixer.get_init() is None:
+            motivo = "mixer não inicializado (sem dispositivo de áudio?)"
+            for categoria in categorias.values():
+                self.falhas[categoria.arquivo] = motivo
+            _avisar(f"desativados: {motivo}")
+            return
+
+        for nome, categoria in categorias.items():
+            try:
+                som = recursos.som(categoria.arquivo)
+            except (pygame.error, FileNotFoundError) as erro:
+                self.falhas[categoria.arquivo] = str(erro)
+                _avisar(f"'{categoria.arquivo}' ({nome}) não carregou: {erro}")
+                continue
+            self.sons[nome] = som
+
+        # Os primeiros canais ficam reservados para as categorias; Sound.play()
+        # avulso usa só os demais e nunca rouba uma voz daqui
+        reservados = sum(categoria.vozes for categoria in categorias.values())
+        if pygame.mixer.get_num_channels() < reservados + 2:
+            pygame.mixer.set_num_channels(reservados + 2)
+        pygame.mixer.set_reserved(reservados)
+        indice = 0
+        for nome, categoria in categorias.items():
+            self.canais[nome] = [pygame.mixer.Channel(indice + i) for i in range(categoria.vozes)]
+            self.inicios[nome] = [0] * categoria.vozes
+            indice += categoria.vozes
+
+    # Pede um som da categoria; ele toca em tocar_pendentes(), no fim do quadro
+    def pedir(self, categoria):
+        self.pendentes[categoria] += 1
+
+    def tocar_pendentes(self):
+        if not self.pendentes:
+            return
+        for categoria, pedidos in self.pendentes.items():
+            if categoria in self.sons:
+                self._tocar(categoria, pedidos)
+        self.pendentes.clear()
+
+    def _tocar(self, categoria, pedidos):
+        canais = self.canais[categoria]
+        inicios = self.inicios[categoria]
+        livres = [i for i, canal in enumerate(canais) if not canal.get_busy()]
+        if livres:
+            i = livres[0]
+        else:
+            i = inicios.index(min(inicios))  # Interrompe a voz mais antiga
+            self.interrompidos += 1
+
+        canais[i].play(self.sons[categoria])
+        volume = self.categorias[categoria].volume * (1 + REFORCO_POR_PEDIDO * (pedidos - 1))
+        canais[i].set_volume(min(1.0, volume))
+        inicios[i] = pygame.time.get_ticks()
+        self.tocados += 1
+        self.juntados += pedidos - 1
+
+    def estatisticas(self):
+        return {
+            'tocados': self.tocados,
+            'juntados': self.juntados,
+            'interrompidos': self.interrompidos,
+            'falhas': dict(self.falhas),
+        }
@@ -0,0 +1,146 @@
+# ================================
+# Telas do Herói dos Pampas (menu, instruções, créditos, vinheta e HUD)
+# As funções daqui só desenham na superfície recebida; quem chama decide
+# quando mostrar na janela e por quanto tempo. Assim o jogo e o
+# benchmark desenham exatamente as mesmas telas.
+# ================================
+
+import pygame
+
+from configuracoes import ALTURA, LARGURA
+from inicializacao import fonte
+from textos import CacheTexto, Rotulo
+
+BRANCO = (255, 255, 255)
+PRETO = (0, 0, 0)
+
+# Menu principal atualizado com seleção
+MENU_OPCOES = ["Jogar", "Instruções", "Créditos", "Sair"]
+
+
+# Fontes usadas em todas as telas: (normal, pequena). Sem Calibri (em
+# assets/fontes/ ou no sistema), fica a fonte padrão do pygame, em negrito
+def carregar_fontes():
+    return fonte("calibri", 40, negrito=True), fonte("calibri", 30, negrito=True)
+
+
+# Tela de carga: barra de progresso no centro da superfície (de qualquer
+# tamanho). Usa uma fonte qualquer, pois roda antes das fontes do jogo.
+def desenhar_carga(superficie, fonte, feitos, total):
+    largura, altura = superficie.get_size()
+    superficie.fill(PRETO)
+    barra = pygame.Rect(0, 0, largura // 2, 28)
+    barra.center = (largura // 2, altura // 2)
+    pygame.draw.rect(superficie, BRANCO, barra, 2)
+    cheia = barra.inflate(-8, -8)
+    cheia.width = round(cheia.width * feitos / max(total, 1))
+    pygame.draw.rect(superficie, BRANCO, cheia)
+    texto = fonte.render(f"Carregando... {feitos}/{total}", True, BRANCO)
+    superficie.blit(texto, texto.get_rect(midbottom=(barra.centerx, barra.top - 12)))
+
+
+class Telas:
+    def __init__(self, fonte, fonte_pequena):
+        self.fonte = fonte
+        self.fonte_pequena = fonte_pequena
+        self.sombras = True  # O governador de qualidade as desliga quando falta tempo
+
+        # Cache dos textos fixos (menu, nomes de fase, telas de instruções e créditos)
+        self.cache_textos = CacheTexto()
+
+        # HUD de pontos e vida: só é renderizado de novo quando os valores mudam
+        self.hud = Rotulo(fonte_pequena, BRANCO)
+
+    # Desenha texto com sombra (preta por padrão).
+    # Texto e sombra vêm prontos numa única superfície do cache de textos.
+    def texto_com_sombra(self, superficie, texto, fonte, cor_texto, posicao, cor_sombra=PRETO):
+        if not self.sombras:
+            cor_sombra = None
+        return superficie.blit(self.cache_textos.obter(fonte, texto, cor_texto, cor_sombra), posicao)
+
+    # Liga/desliga as sombras de todos os textos, inclusive do HUD
+    def definir_sombras(self, ligadas):
+        self.sombras = ligadas
+        self.hud.cor_sombra = PRETO if ligadas else None
+        self.hud.texto = None  # Renderiza de novo na próxima atualização
+
+    # Posição x para centralizar o texto na tela
+    @staticmethod
+    def x_centralizado(texto, fonte):
+        return (LARGURA - fonte.size(texto)[0]) // 2
+
+    def menu(self, superficie, fundo, indice_opcao):
+        superficie.blit(fundo, (0, 0))
+        for i, opcao in enumerate(MENU_OPCOES):
+            if i == indice_opcao:
+                cor = (0, 100, 0)
+                sombra = BRANCO
+            else:
+                cor = BRANCO
+                sombra = PRETO
+            self.texto_com_sombra(superficie, opcao, self.fonte, cor, (self.x_centralizado(opcao, self.fonte), 500 + i * 80), sombra)
+
+    def instrucoes(self, superficie, fundo):
+        superficie.blit(fundo, (0, 0))
+        instrucoes = [
+            "Setas para mover o Gaúcho",
+            "Espaço para jogar chimarrão nos inimigos"
+        ]
+        base_y = 500  # mais abaixo
+
+        for i, linha in enumerate(instrucoes):
+            self.texto_com_sombra(
+                superficie, linha, self.fonte, BRANCO,
+                (self.x_centralizado(linha, self.fonte), base_y + i * 60)
+            )
+
+        voltar = '"Esc" para Voltar'
+        self.texto_com_sombra(
+            superficie, voltar, self.fonte, BRANCO,
+            (self.x_centralizado(voltar, self.fonte), base_y + len(instrucoes) * 60 + 40)
+        )
+
+    def creditos(self, superficie, fundo):
+        superficie.blit(fundo, (0, 0))
+
+        creditos = [
+            "Idealizado e desenvolvido pelo Engenheiro de Software",
+            "Francisco de Freitas Kemle, em junho de 2025."
+        ]
+
+        for i, linha in enumerate(creditos):
+            self.texto_com_sombra(superficie, linha, self.fonte, BRANCO, (self.x_centralizado(linha, self.fonte), 530 + i * 60))
+
+        voltar = '"Esc" para Voltar'
+        self.texto_com_sombra(superficie, voltar, self.fonte, BRANCO, (self.x_centralizado(voltar, self.fonte), 710))
+
+    # Vinheta de transição entre fases
+    def vinheta(self, superficie, fundo, nome_fase, vidas):
+        superficie.blit(fundo, (0, 0))
+        texto_vida = f"Vida: {vidas}"
+
+        x_fase = self.x_centralizado(nome_fase, self.fonte)
+        y_fase = (ALTURA - self.fonte.get_height()) // 2 - 30
+        x_vida = self.x_centralizado(texto_vida, self.fonte_pequena)
+        y_vida = y_fase + 80
+
+        self.texto_com_sombra(superficie, nome_fase, self.fonte, BRANCO, (x_fase, y_fase))
+        self.texto_com_sombra(superficie, texto_vida, self.fonte_pequena, BRANCO, (x_vida, y_vida))
+
+    # HUD e nome da fase, desenhados por cima dos sprites durante o jogo,
+    # e o nível de qualidade, quando o governador reduziu algo.
+    # Devolve a lista de (superficie, posicao) usada pelo Renderizador.
+    def sobreposicoes_jogo(self, pontos, vidas, nome_fase, qualidade=None):
+        self.hud.atualizar(f"Pontos: {pontos}  Vida: {vidas}")
+        sombra = PRETO if self.sombras else None
+        sobreposicoes = [(self.hud.superficie, (20, 90))]
+        if nome_fase is not None:
+            sobreposicoes.append((
+                self.cache_textos.obter(self.fonte, nome_fase, BRANCO, sombra),
+                (self.x_centralizado(nome_fase, self.fonte), 90)
+            ))
+        if qualidade is not None:
+            sobreposicoes.append((
+                self.cache_textos.obter(self.fonte_pequena, f"Qualidade: {qualidade}", BRANCO, sombra), (20, 130)
+            ))
+        return sobreposicoes
@@ -0,0 +1,13 @@
+# ================================
+# Configuração dos testes do Herói dos Pampas
+# Os testes rodam sem janela e sem áudio (drivers "dummy" do SDL), com os
+# módulos do jogo importados da raiz do repositório.
+# ================================
+
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,114 @@
+# ================================
+# Testes dos motores de colisão (colisao.py)
+# 'faixas' precisa dar exatamente o resultado de 'pygame' (groupcollide e
+# spritecollideany), com poucos e com muitos pares; 'mascaras' ignora a
+# borda transparente dos sprites.
+# ================================
+
+import random
+
+import pygame
+import pytest
+
+from colisao import ColisaoPorFaixas, criar_colisao
+
+
+def _sprite(x, y, largura, altura, numero, imagem=None):
+    sprite = pygame.sprite.Sprite()
+    sprite.image = imagem
+    sprite.rect = pygame.Rect(x, y, largura, altura)
+    sprite.numero = numero
+    return sprite
+
+
+# Mesma cena aleatória para cada motor: (grupo de chimarrões, grupo de inimigos, gaúcho)
+def _cena(semente, n_balas, n_inimigos):
+    rng = random.Random(semente)
+    balas = pygame.sprite.Group(
+        _sprite(rng.randrange(0, 1500), rng.randrange(0, 1000), 65, 65, i) for i in range(n_balas)
+    )
+    inimigos = pygame.sprite.Group(
+        _sprite(rng.randrange(0, 1500), rng.randrange(0, 1000), rng.randrange(40, 120), rng.randrange(40, 120), i)
+        for i in range(n_inimigos)
+    )
+    jogador = _sprite(rng.randrange(0, 1500), rng.randrange(0, 1000), 80, 100, -1)
+    return balas, inimigos, jogador
+
+
+def _resultado(nome, semente, n_balas, n_inimigos):
+    balas, inimigos, jogador = _cena(semente, n_balas, n_inimigos)
+    colisao = criar_colisao(nome)
+    colisao.indexar(inimigos)
+    acertos = colisao.balas(balas)
+    atingido = colisao.jogador(jogador)
+    return (
+        {bala.numero: [inimigo.numero for inimigo in lista] for bala, lista in acertos.items()},
+        sorted(sprite.numero for sprite in balas),
+        sorted(sprite.numero for sprite in inimigos),
+        None if atingido is None else atingido.numero,
+    )
+
+
+@pytest.mark.parametrize('n_balas, n_inimigos', [(5, 20), (80, 200), (300, 60)])
+@pytest.mark.parametrize('semente', range(5))
+def test_faixas_igual_a_pygame(semente, n_balas, n_inimigos):
+    assert _resultado('faixas', semente, n_balas, n_inimigos) == _resultado('pygame', semente, n_balas, n_inimigos)
+
+
+def test_faixas_usa_o_indice_com_muitos_pares():
+    balas, inimigos, jogador = _cena(1, 100, 100)
+    colisao = ColisaoPorFaixas(minimo_pares=1)
+    colisao.indexar(inimigos)
+    colisao.balas(balas)
+    assert colisao._inimigos is not None  # O índice foi montado
+    colisao.jogador(jogador)
+
+
+def test_motor_desconhecido():
+    with pytest.raises(ValueError):
+        criar_colisao('octree')
+
+
+# Sprite 40x40 com só o quadrado central 20x20 opaco
+def _imagem_com_borda():
+    imagem = pygame.Surface((40, 40), pygame.SRCALPHA)
+    imagem.fill((255, 255, 255, 255), pygame.Rect(10, 10, 20, 20))
+    return imagem
+
+
+def test_mascaras_ignoram_borda_transparente():
+    imagem = _imagem_com_borda()
+    # Os retângulos se cruzam só nas bordas transparentes
+    jogador = _sprite(0, 0, 40, 40, -1, imagem)
+    longe = _sprite(25, 25, 40, 40, 0, imagem)
+    grupo = pygame.sprite.Group(longe)
+
+    retangulos = criar_colisao('faixas')
+    retangulos.indexar(grupo)
+    assert retangulos.jogador(jogador) is longe
+
+    mascaras = criar_colisao('mascaras')
+    mascaras.indexar(grupo)
+    assert mascaras.jogador(jogador) is None
+
+    # Os quadrados opacos se cruzam
+    perto = _sprite(15, 15, 40, 40, 1, imagem)
+    grupo.add(perto)
+    mascaras.indexar(grupo)
+    assert mascaras.jogador(jogador) is perto
+
+
+def test_mascaras_nos_chimarroes():
+    imagem = _imagem_com_borda()
+    bala = _sprite(0, 0, 40, 40, 0, imagem)
+    inimigo = _sprite(25, 0, 40, 40, 0, imagem)
+    balas, inimigos = pygame.sprite.Group(bala), pygame.sprite.Group(inimigo)
+    colisao = criar_colisao('mascaras')
+    colisao.indexar(inimigos)
+    assert colisao.balas(balas) == {}
+    assert bala.alive() and inimigo.alive()
+
+    inimigo.rect.x = 15
+    colisao.indexar(inimigos)
+    assert colisao.balas(balas) == {bala: [inimigo]}
+    assert not bala.alive() and not inimigo.alive()
@@ -0,0 +1,52 @@
+# ================================
+# Testes da escala de desenho (escala.py)
+# O Escalador redimensiona cada superfície uma vez por fator e copia o
+# alpha do original a cada uso.
+# ================================
+
+import pygame
+
+from escala import Escalador, area_na_janela, tamanho_escalado
+
+
+def _superficie(cor, tamanho=(40, 20)):
+    superficie = pygame.Surface(tamanho)
+    superficie.fill(cor)
+    return superficie
+
+
+def test_area_na_janela_mantem_a_proporcao():
+    area = area_na_janela((3072, 1200))
+    assert area.size == (1800, 1200)
+    assert area.center == (1536, 600)
+
+
+def test_fator_1_devolve_o_original():
+    escalador = Escalador()
+    imagem = _superficie((255, 0, 0))
+    assert escalador.sprite(imagem) is imagem
+    escalador.encerrar()
+
+
+def test_sprite_redimensionado_uma_vez_por_fator():
+    escalador = Escalador()
+    escalador.definir_fator(1.5)
+    imagem = _superficie((255, 0, 0))
+    escalada = escalador.sprite(imagem)
+    assert escalada.get_size() == tamanho_escalado((40, 20), 1.5) == (60, 30)
+    assert escalador.sprite(imagem) is escalada
+
+    escalador.definir_fator(0.5)
+    assert escalador.sprite(imagem).get_size() == (20, 10)
+    escalador.encerrar()
+
+
+def test_sprite_copia_o_alpha_do_original():
+    escalador = Escalador()
+    escalador.definir_fator(2.0)
+    imagem = _superficie((255, 0, 0))
+    imagem.set_alpha(100)
+    assert escalador.sprite(imagem).get_alpha() == 100
+    imagem.set_alpha(30)
+    assert escalador.sprite(imagem).get_alpha() == 30
+    escalador.encerrar()
@@ -0,0 +1,154 @@
+# ================================
+# Testes do manifesto de fases (fases.py)
+# O fases.json do jogo compila; erros aparecem todos juntos, com a fase e
+# o motivo; o manifesto exportado (gravado nas sessões) volta igual.
+# ================================
+
+import copy
+import json
+
+import pytest
+
+from configuracoes import nomes_inimigos
+from fases import carregar_fases, compilar_fases, exportar_fases
+from motor import criar_motor_sem_janela
+from ondas import Onda
+
+FASE_VALIDA = {
+    'nome': "Fase Teste",
+    'fundo': 'fundo_pampa-2.jpg',
+    'inimigos': ['inimigo.png', 'inimigo-2.png'],
+    'intervalo_inimigos_ms': 400,
+    'velocidade_inimigos': [3, 8],
+    'atraso_bandeira_ms': 24000,
+}
+
+
+def _manifesto(**campos):
+    fase = dict(FASE_VALIDA, **campos)
+    return {'fases': [{nome: valor for nome, valor in fase.items() if valor is not None}]}
+
+
+def _erros(dados, **opcoes):
+    with pytest.raises(ValueError) as erro:
+        compilar_fases(dados, **opcoes)
+    return str(erro.value)
+
+
+def test_manifesto_do_jogo():
+    fases = carregar_fases()
+    assert sorted(fases) == list(range(1, len(fases) + 1))
+    for numero, fase in fases.items():
+        assert fase.numero == numero
+        assert fase.inimigos and set(fase.inimigos) <= set(nomes_inimigos)
+        assert fase.velocidade_inimigos[0] <= fase.velocidade_inimigos[1]
+
+
+def test_padrao_preenche_o_que_a_fase_nao_define():
+    dados = {
+        'padrao': {'intervalo_inimigos_ms': 250, 'velocidade_inimigos': [2, 4], 'atraso_bandeira_ms': 9000},
+        'fases': [
+            {'nome': "A", 'fundo': 'fundo_pampa-2.jpg', 'inimigos': ['inimigo.png']},
+            {'nome': "B", 'fundo': 'fundo_pampa-3.jpg', 'inimigos': ['inimigo-3.png'], 'intervalo_inimigos_ms': 100,
+             'ondas': [[0, 300], [2000, 100, 500]]},
+        ],
+    }
+    fases = compilar_fases(dados)
+    assert fases[1].intervalo_inimigos_ms == 250
+    assert fases[1].velocidade_inimigos == (2, 4)
+    assert fases[1].ondas is None
+    assert fases[2].intervalo_inimigos_ms == 100
+    assert fases[2].ondas == (Onda(0, 300), Onda(2000, 100, 500))
+
+
+@pytest.mark.parametrize('campos, mensagem', [
+    ({'cor': 'azul'}, "campo desconhecido 'cor'"),
+    ({'fundo': None}, "falta o campo 'fundo'"),
+    ({'fundo': 'nao_existe.jpg'}, "não existe em assets/"),
+    ({'inimigos': ['inimigo-99.png']}, "inimigos fora de nomes_inimigos: inimigo-99.png"),
+    ({'inimigos': ['inimigo.png', 'inimigo.png']}, "sprites repetidos"),
+    ({'inimigos': []}, "pelo menos um sprite"),
+    ({'intervalo_inimigos_ms': 0}, "'intervalo_inimigos_ms' deve ser um inteiro positivo"),
+    ({'intervalo_inimigos_ms': True}, "'intervalo_inimigos_ms' deve ser um inteiro positivo"),
+    ({'atraso_bandeira_ms': 1.5}, "'atraso_bandeira_ms' deve ser um inteiro positivo"),
+    ({'velocidade_inimigos': [8, 3]}, "'velocidade_inimigos' deve ser"),
+    ({'velocidade_inimigos': [3]}, "'velocidade_inimigos' deve ser"),
+    ({'ondas': []}, "'ondas' deve ser uma lista"),
+    ({'ondas': [[True, 100]]}, "onda 1 deve ser"),
+    ({'ondas': [[0, False]]}, "onda 1 deve ser"),
+    ({'ondas': [[0, 100, True]]}, "onda 1 deve ser"),
+    ({'ondas': [[0, 100], [-1, 100]]}, "onda 2 deve ser"),
+])
+def test_erros(campos, mensagem):
+    erros = _erros(_manifesto(**campos))
+    assert "fase 1 (" in erros
+    assert mensagem in erros
+
+
+def test_todos_os_erros_juntos():
+    dados = _manifesto()
+    dados['fases'].append(dict(FASE_VALIDA, fundo='nao_existe.jpg'))
+    dados['fases'].append(dict(FASE_VALIDA, inimigos=['x.png'], velocidade_inimigos=[9, 1]))
+    dados['padrao'] = {'cor': 'azul'}
+    erros = _erros(dados).splitlines()
+    assert len(erros) == 5  # Título e os quatro problemas
+    assert any(linha.strip().startswith('padrao:') for linha in erros)
+    assert any('fase 2' in linha for linha in erros)
+    assert sum('fase 3' in linha for linha in erros) == 2
+
+
+@pytest.mark.parametrize('dados', [None, {}, {'fases': []}, {'fases': {}}])
+def test_manifesto_sem_fases(dados):
+    assert "lista 'fases'" in _erros(dados)
+
+
+def test_fundos_sem_conferir_arquivos():
+    fases = compilar_fases(_manifesto(fundo='nao_existe.jpg'), conferir_arquivos=False)
+    assert fases[1].fundo == 'nao_existe.jpg'
+
+
+def test_exportar_e_compilar_de_novo():
+    fases = carregar_fases()
+    fases[2] = fases[2]._replace(ondas=(Onda(0, 300), Onda(1000, 100, 500)))
+    exportado = json.loads(json.dumps(exportar_fases(fases)))
+    assert compilar_fases(copy.deepcopy(exportado)) == fases
+
+
+def test_json_invalido(tmp_path):
+    caminho = tmp_path / 'fases.json'
+    caminho.write_text('{"fases": [', encoding='utf-8')
+    with pytest.raises(ValueError, match="JSON inválido"):
+        carregar_fases(str(caminho))
+
+
+
+# Cada fase com inimigos diferentes
+def _motor_com_fases():
+    motor = criar_motor_sem_janela(1)
+    inimigos = (['inimigo.png', 'inimigo-2.png'], ['inimigo-3.png'], ['inimigo-4.png'])
+    motor.fases = compilar_fases({'fases': [dict(FASE_VALIDA, inimigos=lista) for lista in inimigos]})
+    return motor
+
+
+def test_inimigos_preparados_sao_so_trocados_ao_entrar_na_fase():
+    motor = _motor_com_fases()
+    motor.iniciar_fase(1)
+    motor.preparar_inimigos(1)  # Já carregados: nada a preparar
+    assert motor._inimigos_preparados is None
+    motor.preparar_inimigos(2)
+    preparados = motor._inimigos_preparados[1].result()
+    motor.iniciar_fase(2)
+    assert motor.imagens_inimigos is preparados
+    assert motor.arquivos_inimigos == ('inimigo-3.png',)
+    assert motor._inimigos_preparados is None
+
+
+def test_inimigos_preparados_para_outra_fase_sao_descartados():
+    motor = _motor_com_fases()
+    motor.iniciar_fase(1)
+    motor.preparar_inimigos(2)
+    motor._inimigos_preparados[1].result()
+    motor.iniciar_fase(3)
+    assert motor.arquivos_inimigos == ('inimigo-4.png',)
+    assert len(motor.imagens_inimigos) == 1
+    assert not {'inimigo.png', 'inimigo-3.png'} & {arquivo for arquivo, _, _ in motor.recursos._sprites}
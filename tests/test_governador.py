@@ -0,0 +1,54 @@
+# ================================
+# Testes do governador de qualidade (governador.py)
+# Desce um nível quando a média da janela passa do orçamento e sobe
+# depois de quadros_para_subir quadros com folga.
+# ================================
+
+from governador import FOLGA, NIVEIS, Governador
+
+ORCAMENTO = 10.0
+LENTO = 30.0
+RAPIDO = ORCAMENTO * FOLGA / 2  # Bem abaixo da folga
+
+
+def _governador():
+    return Governador(orcamento_ms=ORCAMENTO, janela=4, quadros_para_subir=6)
+
+
+def _registrar(governador, ms, quadros):
+    return [governador.registrar(ms) for _ in range(quadros)]
+
+
+def test_desce_um_nivel_depois_da_janela_lenta():
+    governador = _governador()
+    assert _registrar(governador, LENTO, 3) == [None] * 3
+    assert governador.registrar(LENTO) == NIVEIS[1]
+    assert governador.nivel == 1 and governador.mudancas == 1
+    assert len(governador.tempos) == 0  # Os quadros do nível anterior não contam
+
+
+def test_para_no_ultimo_nivel():
+    governador = _governador()
+    _registrar(governador, LENTO, 4 * len(NIVEIS) + 8)
+    assert governador.atual == NIVEIS[-1]
+    assert governador.mudancas == len(NIVEIS) - 1
+
+
+def test_sobe_depois_de_quadros_com_folga():
+    governador = _governador()
+    governador.definir(2)
+    assert _registrar(governador, RAPIDO, 5) == [None] * 5
+    assert governador.registrar(RAPIDO) == NIVEIS[1]
+
+
+def test_media_entre_folga_e_orcamento_mantem_o_nivel():
+    governador = _governador()
+    governador.definir(1)
+    assert _registrar(governador, 9.0, 20) == [None] * 20
+    assert governador.nivel == 1
+
+
+def test_definir_limita_o_nivel():
+    governador = _governador()
+    assert governador.definir(99) == NIVEIS[-1]
+    assert governador.definir(-1) == NIVEIS[0]
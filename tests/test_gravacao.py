@@ -0,0 +1,113 @@
+# ================================
+# Testes de gravação e reprodução (gravacao.py)
+# Uma partida gravada, salva em JSON e reproduzida sem janela termina no
+# mesmo estado, com os dois motores e com cada motor de colisão.
+# ================================
+
+import json
+
+import pytest
+
+from bots import BotBandeira
+from colisao import MOTORES as MOTORES_COLISAO
+from gravacao import Gravador, carregar, codificar_entradas, decodificar_entradas, estado_final, reproduzir
+from motor import Entradas, Motor, criar_motor_sem_janela
+
+PASSOS = 1500
+
+
+# Joga com o BotBandeira, passando por reinício, troca de fase e limite de entidades
+def _gravar(classe=None, colisao='faixas', semente=5):
+    motor = criar_motor_sem_janela(semente, classe, colisao=colisao)
+    gravador = Gravador(motor)
+    bot = BotBandeira()
+    motor.iniciar_fase(2)
+    for _ in range(PASSOS // 3):
+        motor.passo(bot(motor))
+    motor.reiniciar()
+    motor.iniciar_fase(1)
+    motor.limitar_entidades(8, 4)
+    for _ in range(PASSOS):
+        motor.passo(bot(motor))
+    dados = gravador.dados()
+    return motor, json.loads(json.dumps(dados))  # Como se tivesse sido salva e lida
+
+
+@pytest.mark.parametrize('entradas', [
+    Entradas(),
+    Entradas(True, False, True, False, 0),
+    Entradas(False, True, False, True, 3),
+    Entradas(True, True, True, True, 17),
+])
+def test_codificar_entradas(entradas):
+    assert decodificar_entradas(codificar_entradas(entradas)) == entradas
+
+
+@pytest.mark.parametrize('colisao', MOTORES_COLISAO)
+def test_reproduz_a_mesma_partida(colisao):
+    motor, dados = _gravar(colisao=colisao)
+    assert dados['colisao'] == colisao
+    reproduzido = reproduzir(dados)
+    assert estado_final(reproduzido) == estado_final(motor)
+    assert reproduzido.pontos > 0
+
+
+def test_motor_vetorial_reproduz_a_partida_dos_sprites():
+    pytest.importorskip('numpy')
+    from entidades import MotorVetorial
+    motor, dados = _gravar()
+    assert estado_final(reproduzir(dados, classe=MotorVetorial)) == estado_final(motor)
+    vetorial, dados_vetorial = _gravar(classe=MotorVetorial)
+    assert estado_final(reproduzir(dados_vetorial)) == estado_final(vetorial) == estado_final(motor)
+
+
+def test_salvar_e_carregar(tmp_path):
+    motor, _ = _gravar()
+    caminho = tmp_path / 'sessao.json'
+    motor.gravador.salvar(str(caminho))
+    dados = carregar(str(caminho))
+    dados['final'] = estado_final(motor)
+    assert estado_final(reproduzir(dados)) == dados['final']
+
+
+def test_versao_desconhecida(tmp_path):
+    caminho = tmp_path / 'sessao.json'
+    caminho.write_text(json.dumps({'versao': 99}), encoding='utf-8')
+    with pytest.raises(ValueError):
+        carregar(str(caminho))
+
+
+def test_gravador_precisa_de_motor_novo():
+    motor = criar_motor_sem_janela(1)
+    motor.iniciar_fase(1)
+    motor.passo()
+    with pytest.raises(ValueError):
+        Gravador(motor)
+
+
+def test_manifesto_vem_da_gravacao():
+    motor, dados = _gravar()
+    dados['parametros']['fases']['fases'][0]['inimigos'] = ['inimigo-7.png']
+    reproduzido = reproduzir(dados)
+    assert reproduzido.fases[1].inimigos == ('inimigo-7.png',)
+
+
+def test_versao_anterior_e_recusada():
+    _, dados = _gravar()
+    dados['versao'] = 1  # Sem colisão, limites e manifesto gravados
+    with pytest.raises(ValueError):
+        reproduzir(dados)
+
+
+def test_mesma_semente_mesma_partida():
+    motores = []
+    for _ in range(2):
+        motor = criar_motor_sem_janela(9)
+        assert type(motor) is Motor
+        bot = BotBandeira()
+        motor.iniciar_fase(3)
+        for _ in range(PASSOS):
+            motor.passo(bot(motor))
+        motores.append(motor)
+    assert estado_final(motores[0]) == estado_final(motores[1])
+    assert motores[0].retangulos_inimigos() == motores[1].retangulos_inimigos()
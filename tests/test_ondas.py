@@ -0,0 +1,88 @@
+# ================================
+# Testes do surgimento de inimigos (ondas.py)
+# O AgendadorOndas conta inimigos a partir do tempo da fase, sem deriva;
+# o IndiceFaixas nunca põe um inimigo novo sobre os mais recentes.
+# ================================
+
+import random
+
+import pytest
+
+from ondas import AgendadorOndas, IndiceFaixas, Onda
+
+PASSO_MS = 1000 / 60
+
+
+def _total_em_passos(ondas, passos):
+    agendador = AgendadorOndas(ondas)
+    return sum(agendador.vencidos(passo * 1000 / 60) for passo in range(1, passos + 1))
+
+
+def test_onda_padrao():
+    agendador = AgendadorOndas([Onda(0, 400)])
+    assert agendador.vencidos(399) == 0
+    assert agendador.vencidos(400) == 1
+    assert agendador.vencidos(1000) == 1
+    assert agendador.vencidos(1200) == 1
+    assert agendador.vencidos(1200) == 0  # Já dados por gerados
+
+
+def test_passo_a_passo_sem_deriva():
+    # 10 minutos a 60 passos por segundo: 600000 / 400 inimigos, nem um a mais nem a menos
+    assert _total_em_passos([Onda(0, 400)], 36000) == 1500
+
+
+def test_inicio_e_duracao():
+    # Começa em 1 s, um inimigo a cada 500 ms, por 2 s: surgem em 1,5 s, 2 s, 2,5 s e 3 s
+    assert _total_em_passos([Onda(1000, 500, 2000)], 60 * 10) == 4
+    assert AgendadorOndas([Onda(1000, 500, 2000)]).vencidos(1499) == 0
+
+
+def test_ondas_somadas():
+    ondas = [Onda(0, 1000), Onda(5000, 250, 1000)]
+    assert _total_em_passos(ondas, 60 * 10) == 10 + 4
+
+
+def test_sem_ondas():
+    assert AgendadorOndas([]).vencidos(10 ** 6) == 0
+
+
+def _cruzam(a, b):
+    return a[0] < b[1] and b[0] < a[1]
+
+
+@pytest.mark.parametrize('semente', range(10))
+def test_novo_inimigo_nao_sobrepoe_os_recentes(semente):
+    rng = random.Random(semente)
+    indice = IndiceFaixas(memoria=10)
+    for _ in range(500):
+        altura = rng.randrange(40, 90)
+        recentes = list(indice.ocupadas)
+        topo = indice.sortear(rng, 50, 1024 - altura - 50, altura)
+        assert 50 <= topo <= 1024 - altura - 50
+        # Sem espaço, só os mais antigos deixam de contar: os que sobram são os mais recentes
+        mantidos = list(indice.ocupadas)
+        assert mantidos == recentes[len(recentes) - len(mantidos):]
+        assert mantidos or not recentes  # Sempre cabe ao lado de pelo menos um
+        assert not any(_cruzam((topo, topo + altura), faixa) for faixa in mantidos)
+        indice.ocupar(topo, altura)
+        assert len(indice.ocupadas) <= 10
+
+
+def test_espaco_cheio_libera_os_mais_antigos():
+    rng = random.Random(0)
+    indice = IndiceFaixas(memoria=10)
+    for topo in range(0, 1000, 100):
+        indice.ocupar(topo, 100)
+    topo = indice.sortear(rng, 0, 900, 100)
+    # O novo não encosta nos que continuaram ocupando faixas
+    assert not any(_cruzam((topo, topo + 100), faixa) for faixa in indice.ocupadas)
+    assert len(indice.ocupadas) < 10
+
+
+def test_sorteio_uniforme_entre_as_livres():
+    rng = random.Random(3)
+    indice = IndiceFaixas()
+    indice.ocupar(0, 50)  # Só sobram os topos de 50 a 99
+    topos = {indice.sortear(rng, 0, 99, 1) for _ in range(2000)}
+    assert topos == set(range(50, 100))
@@ -0,0 +1,59 @@
+# ================================
+# Testes do pacote de recursos (pacote.py)
+# O pacote é gerado numa pasta temporária; os pixels lidos dele precisam
+# ser os mesmos da imagem original decodificada e redimensionada.
+# ================================
+
+import pygame
+import pytest
+
+from configuracoes import CAMINHO_ASSETS, ESCALA_PERSONAGENS, TAMANHO_BALA, nomes_inimigos
+from pacote import PacoteRecursos, construir
+from recursos import carregar_redimensionada
+
+
+@pytest.fixture(scope='module')
+def caminho_pacote(tmp_path_factory):
+    caminho = str(tmp_path_factory.mktemp('pacote') / 'recursos.pak')
+    assert construir(caminho)
+    return caminho
+
+
+@pytest.fixture
+def pacote(caminho_pacote):
+    pacote = PacoteRecursos.abrir(caminho_pacote)
+    yield pacote
+    pacote.fechar()
+
+
+def _pixels(superficie):
+    return pygame.image.tobytes(superficie, 'RGBA')
+
+
+def test_atualizado_nao_e_gerado_de_novo(caminho_pacote):
+    assert not construir(caminho_pacote)
+
+
+def test_sprite_igual_ao_original(pacote):
+    original = carregar_redimensionada(CAMINHO_ASSETS, 'bala.png', tamanho=TAMANHO_BALA)
+    assert _pixels(pacote.sprite('bala.png', tamanho=TAMANHO_BALA)) == _pixels(original)
+
+
+def test_atlas_dos_inimigos(pacote):
+    quadros = pacote.atlas('inimigos', nomes_inimigos, escala=ESCALA_PERSONAGENS)
+    assert len(quadros) == len(nomes_inimigos)
+    original = carregar_redimensionada(CAMINHO_ASSETS, nomes_inimigos[3], escala=ESCALA_PERSONAGENS)
+    assert _pixels(quadros[3]) == _pixels(original)
+
+
+def test_outros_parametros_nao_usam_o_pacote(pacote):
+    assert pacote.sprite('bala.png', tamanho=(10, 10)) is None
+    assert pacote.sprite('inexistente.png') is None
+    assert pacote.atlas('inimigos', nomes_inimigos[:2], escala=ESCALA_PERSONAGENS) is None
+
+
+def test_arquivo_invalido(tmp_path):
+    caminho = tmp_path / 'recursos.pak'
+    caminho.write_bytes(b'nada disso')
+    assert PacoteRecursos.abrir(str(caminho)) is None
+    assert PacoteRecursos.abrir(str(tmp_path / 'faltando.pak')) is None
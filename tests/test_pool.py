@@ -0,0 +1,45 @@
+# ================================
+# Testes do pool de objetos (pool.py)
+# ================================
+
+from pool import PoolObjetos
+
+
+class Objeto:
+    def __init__(self, valor):
+        self.iniciar(valor)
+
+    def iniciar(self, valor):
+        self.valor = valor
+
+
+def test_reaproveita_os_objetos_devolvidos():
+    pool = PoolObjetos(Objeto, capacidade=4)
+    primeiro = pool.obter(1)
+    assert primeiro.pool is pool
+    pool.devolver(primeiro)
+    segundo = pool.obter(2)
+    assert segundo is primeiro and segundo.valor == 2
+    assert pool.estatisticas() == {'acertos': 1, 'faltas': 1, 'descartes': 0, 'livres': 0, 'taxa_acerto': 0.5}
+
+
+def test_descarta_o_que_passa_da_capacidade():
+    pool = PoolObjetos(Objeto, capacidade=2)
+    objetos = [pool.obter(i) for i in range(3)]
+    for objeto in objetos:
+        pool.devolver(objeto)
+    assert pool.estatisticas()['livres'] == 2
+    assert pool.descartes == 1
+
+
+def test_esvaziar_descarta_os_livres():
+    pool = PoolObjetos(Objeto, capacidade=4)
+    antigo = pool.obter(1)
+    pool.devolver(antigo)
+    pool.esvaziar()
+    assert pool.obter(2) is not antigo
+    assert (pool.acertos, pool.faltas) == (0, 2)
+
+
+def test_sem_pedidos_taxa_zero():
+    assert PoolObjetos(Objeto, capacidade=1).estatisticas()['taxa_acerto'] == 0.0
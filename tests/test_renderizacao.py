@@ -0,0 +1,58 @@
+# ================================
+# Testes da renderização (renderizacao.py)
+# Com a janela maior que o jogo, os textos são ampliados para a janela:
+# os do cache uma vez só, os redesenhados a cada quadro (gráfico do
+# perfilador) a cada quadro.
+# ================================
+
+import pygame
+import pytest
+
+from configuracoes import ALTURA, LARGURA
+from renderizacao import Renderizador
+
+VERMELHO = (255, 0, 0)
+AZUL = (0, 0, 255)
+
+
+@pytest.fixture
+def renderizador():
+    pygame.display.init()
+    janela = pygame.display.set_mode((LARGURA * 3 // 2, ALTURA * 3 // 2))
+    renderizador = Renderizador(janela)
+    yield renderizador
+    renderizador.encerrar()
+    pygame.display.quit()
+
+
+def _quadro(renderizador, sobreposicoes):
+    fundo = pygame.Surface((LARGURA, ALTURA))
+    renderizador.desenhar_quadro(fundo, [], sobreposicoes)
+
+
+def _pixel(renderizador, x, y):
+    area = renderizador.area
+    return tuple(renderizador.janela.get_at((area.x + x, area.y + y)))[:3]
+
+
+def test_texto_do_cache_ampliado_uma_vez(renderizador):
+    assert renderizador.ampliacao == 1.5
+    texto = pygame.Surface((40, 20))
+    texto.fill(VERMELHO)
+    _quadro(renderizador, [(texto, (10, 10))])
+    ampliado = renderizador.escalador_textos.sprite(texto)
+    assert ampliado.get_size() == (60, 30)
+    _quadro(renderizador, [(texto, (10, 10))])
+    assert renderizador.escalador_textos.sprite(texto) is ampliado
+    assert _pixel(renderizador, 20, 20) == VERMELHO
+
+
+def test_superficie_redesenhada_e_ampliada_a_cada_quadro(renderizador):
+    grafico = pygame.Surface((40, 20))
+    grafico.fill(VERMELHO)
+    _quadro(renderizador, [(grafico, (10, 10), True)])
+    assert _pixel(renderizador, 20, 20) == VERMELHO
+
+    grafico.fill(AZUL)  # Mesma superfície, conteúdo novo (como o perfilador)
+    _quadro(renderizador, [(grafico, (10, 10), True)])
+    assert _pixel(renderizador, 20, 20) == AZUL
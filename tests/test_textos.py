@@ -0,0 +1,51 @@
+# ================================
+# Testes dos textos com cache (textos.py)
+# ================================
+
+import pygame
+import pytest
+
+from textos import DESLOCAMENTO_SOMBRA, CacheTexto, Rotulo
+
+BRANCO = (255, 255, 255)
+
+
+@pytest.fixture(scope='module')
+def fonte():
+    pygame.font.init()
+    return pygame.font.Font(None, 24)
+
+
+def test_sombra_aumenta_a_superficie(fonte):
+    cache = CacheTexto()
+    sem_sombra = cache.obter(fonte, "Pontos", BRANCO, None)
+    com_sombra = cache.obter(fonte, "Pontos", BRANCO)
+    assert sem_sombra is not com_sombra
+    assert com_sombra.get_width() == sem_sombra.get_width() + DESLOCAMENTO_SOMBRA
+
+
+def test_cache_devolve_a_mesma_superficie(fonte):
+    cache = CacheTexto()
+    superficie = cache.obter(fonte, "Jogar", BRANCO)
+    assert cache.obter(fonte, "Jogar", [255, 255, 255]) is superficie  # Cor em lista ou tupla
+    assert cache.obter(fonte, "Jogar", (0, 100, 0)) is not superficie
+
+
+def test_cache_descarta_o_usado_ha_mais_tempo(fonte):
+    cache = CacheTexto(capacidade=2)
+    jogar = cache.obter(fonte, "Jogar", BRANCO)
+    sair = cache.obter(fonte, "Sair", BRANCO)
+    assert cache.obter(fonte, "Jogar", BRANCO) is jogar  # "Sair" passa a ser o mais antigo
+    cache.obter(fonte, "Créditos", BRANCO)
+    assert cache.obter(fonte, "Jogar", BRANCO) is jogar
+    assert cache.obter(fonte, "Sair", BRANCO) is not sair
+
+
+def test_rotulo_so_renderiza_quando_o_texto_muda(fonte):
+    rotulo = Rotulo(fonte, BRANCO)
+    assert rotulo.atualizar("Pontos: 1")
+    superficie = rotulo.superficie
+    assert not rotulo.atualizar("Pontos: 1")
+    assert rotulo.superficie is superficie
+    assert rotulo.atualizar("Pontos: 2")
+    assert rotulo.superficie is not superficie  # Superfície nova: o escalador dos textos pode guardá-la
@@ -0,0 +1,75 @@
+# ================================
+# Renderização de textos com cache do Herói dos Pampas
+# Rasterizar fontes é caro, então cada texto com sombra vira uma única
+# superfície (sombra + texto já compostos), guardada num cache LRU
+# indexado por (fonte, texto, cor, cor da sombra).
+# ================================
+
+from collections import OrderedDict
+
+import pygame
+
+from recursos import converter_para_tela
+
+DESLOCAMENTO_SOMBRA = 2  # A sombra fica 2 px à direita e abaixo do texto
+
+
+# Renderiza o texto com sombra numa única superfície transparente.
+# Com cor_sombra None o texto é renderizado sem sombra.
+def renderizar_com_sombra(fonte, texto, cor, cor_sombra=(0, 0, 0)):
+    superficie_texto = fonte.render(texto, True, cor)
+    if cor_sombra is None:
+        return converter_para_tela(superficie_texto, alpha=True)
+
+    largura, altura = superficie_texto.get_size()
+    composta = pygame.Surface(
+        (largura + DESLOCAMENTO_SOMBRA, altura + DESLOCAMENTO_SOMBRA), pygame.SRCALPHA, 32
+    )
+    composta.blit(fonte.render(texto, True, cor_sombra), (DESLOCAMENTO_SOMBRA, DESLOCAMENTO_SOMBRA))
+    composta.blit(superficie_texto, (0, 0))
+    return converter_para_tela(composta, alpha=True)
+
+
+# Cache LRU de textos já renderizados
+class CacheTexto:
+    def __init__(self, capacidade=128):
+        self.capacidade = capacidade
+        self._superficies = OrderedDict()
+
+    def obter(self, fonte, texto, cor, cor_sombra=(0, 0, 0)):
+        chave = (fonte, texto, tuple(cor), None if cor_sombra is None else tuple(cor_sombra))
+        superficie = self._superficies.get(chave)
+        if superficie is not None:
+            self._superficies.move_to_end(chave)
+            return superficie
+
+        superficie = self._superficies[chave] = renderizar_com_sombra(fonte, texto, cor, cor_sombra)
+        if len(self._superficies) > self.capacidade:
+            self._superficies.popitem(last=False)
+        return superficie
+
+    def limpar(self):
+        self._superficies.clear()
+
+
+# Texto que muda de tempos em tempos (ex.: HUD de pontos e vida).
+# Só é renderizado de novo quando o conteúdo muda, e não ocupa o cache
+# com cada valor intermediário.
+class Rotulo:
+    def __init__(self, fonte, cor, cor_sombra=(0, 0, 0)):
+        self.fonte = fonte
+        self.cor = cor
+        self.cor_sombra = cor_sombra
+        self.texto = None
+        self.superficie = None
+
+    # Atualiza o conteúdo; devolve True se a superfície foi renderizada de novo
+    def atualizar(self, texto):
+        if texto == self.texto:
+            return False
+        self.texto = texto
+        self.superficie = renderizar_com_sombra(self.fonte, texto, self.cor, self.cor_sombra)
+        return True
+
+    def desenhar(self, superficie, posicao):
+        return superficie.blit(self.superficie, posicao)